@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Benchmark: batch answer scoring vs the original per-answer heuristics
+
+Generates a synthetic corpus of interview answers, scores it with the
+original _generate_feedback heuristics (substring scans per answer) and
+with AnswerScoringEngine.score_batch, then reports throughput and how
+often the two disagree. The one-at-a-time rows compare the full
+feedback path: the original _generate_feedback against
+AnswerScoringEngine.score, both building an InterviewFeedback. Disagreements are expected only where the old
+substring scan matched inside other words (e.g. "at" in "that"); each one
+is checked, and the words that caused them are listed.
+
+Usage:
+    python benchmarks/bench_answer_scoring.py --answers 100000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.schemas import InterviewFeedback, InterviewQuestion
+from services.answer_scoring import AnswerScoringEngine, LENGTH_FEEDBACK, STAR_COMPONENTS
+
+
+# ---------------------------------------------------------------------------
+# Reference implementation (GPUInterviewService._generate_feedback before the
+# engine), reduced to the numeric scores.
+# ---------------------------------------------------------------------------
+
+LEGACY_STAR = {
+    "situation": ["when", "while", "during", "at"],
+    "task": ["needed", "required", "had to", "goal"],
+    "action": ["i did", "i made", "i created", "i developed"],
+    "result": ["result", "outcome", "achieved", "improved"],
+}
+
+
+def legacy_score(response: str):
+    response_words = len(response.split())
+    if response_words < 20:
+        score = 50
+    elif response_words < 50:
+        score = 70
+    elif response_words < 150:
+        score = 85
+    else:
+        score = 90
+
+    star_analysis = {"situation": 0, "task": 0, "action": 0, "result": 0}
+    response_lower = response.lower()
+    for component, words in LEGACY_STAR.items():
+        if any(word in response_lower for word in words):
+            star_analysis[component] = 80
+
+    star_avg = sum(star_analysis.values()) / 4
+    return (score + star_avg) / 2, star_analysis
+
+
+def legacy_feedback(question: InterviewQuestion, response: str) -> InterviewFeedback:
+    """The original _generate_feedback: legacy_score plus its InterviewFeedback"""
+    final_score, star_analysis = legacy_score(response)
+    response_words = len(response.split())
+    band = (response_words >= 20) + (response_words >= 50) + (response_words >= 150)
+    star_avg = sum(star_analysis.values()) / 4
+    return InterviewFeedback(
+        question_id=question.id,
+        overall_score=final_score,
+        strengths=[LENGTH_FEEDBACK[band], "Shows understanding of the question"],
+        growth_areas=[
+            "Consider using the STAR method more explicitly" if star_avg < 60 else "Good use of STAR method",
+            "Include specific metrics or outcomes" if "%" not in response else "Good use of metrics"
+        ],
+        star_analysis=star_analysis,
+        suggestions=["Try to quantify your achievements", "Include the impact of your actions"],
+        keywords_used=question.tags[:3] if question.tags else [],
+        keywords_missing=[]
+    )
+
+
+SENTENCES = [
+    "When I joined the platform team the deploy pipeline took two hours.",
+    "While migrating our services we needed to keep the API stable.",
+    "During the launch we had to support three times the usual traffic.",
+    "The goal was to cut p99 latency for the recommendation service.",
+    "I developed a batching layer in front of the model servers.",
+    "I created dashboards so that the on-call engineer could see regressions.",
+    "I made the rollout gradual and added automatic rollback.",
+    "The result was a 40% drop in latency and fewer pages.",
+    "We achieved the target a week early.",
+    "That approach improved reliability across the fleet.",
+    "Honestly I think the main thing is communication and trust.",
+    "My team reviewed the design and we iterated on the data model.",
+    "The outcome convinced leadership to fund the second phase.",
+    "I worked with product to define what success looked like.",
+]
+TAGS = [["ml_systems", "latency"], ["leadership"], ["python", "c++"], ["system design"], []]
+
+
+def in_word_hits(answer: str, component: str) -> list:
+    """
+    Words in which the legacy scan found a phrase of component, when none
+    occurs as whole words (None if one does: the engine should have hit)
+    """
+    text = answer.lower()
+    phrases = LEGACY_STAR[component]
+    if any(re.search(rf"(?<!\w){re.escape(phrase)}(?!\w)", text) for phrase in phrases):
+        return None
+    return [
+        match.group() for match in re.finditer(r"\S+", text)
+        if any(phrase in match.group() for phrase in phrases)
+    ]
+
+
+def make_corpus(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    answers, tags = [], []
+    for _ in range(n):
+        answers.append(" ".join(rng.choice(SENTENCES) for _ in range(rng.randint(1, 14))))
+        tags.append(rng.choice(TAGS))
+    return answers, tags
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark answer scoring")
+    parser.add_argument("--answers", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    answers, tags = make_corpus(args.answers)
+    engine = AnswerScoringEngine()
+    print(f"{len(answers)} answers, {sum(len(a.split()) for a in answers) / len(answers):.0f} words on average")
+
+    start = time.perf_counter()
+    legacy = [legacy_score(answer) for answer in answers]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batches = [
+        engine.score_batch(answers[i:i + args.batch_size], tags[i:i + args.batch_size])
+        for i in range(0, len(answers), args.batch_size)
+    ]
+    batch_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(0, len(answers), args.batch_size):
+        engine.score_batch(answers[i:i + args.batch_size])
+    star_only_seconds = time.perf_counter() - start
+
+    sample = min(len(answers), 10000)
+    questions = [
+        InterviewQuestion(id=f"q{i}", question="Tell me about a project", category="behavioral", tags=answer_tags)
+        for i, answer_tags in enumerate(tags[:sample])
+    ]
+    start = time.perf_counter()
+    for question, answer in zip(questions, answers):
+        legacy_feedback(question, answer)
+    legacy_single_seconds = (time.perf_counter() - start) * len(answers) / sample
+
+    start = time.perf_counter()
+    for question, answer in zip(questions, answers):
+        engine.score(question, answer)
+    single_seconds = (time.perf_counter() - start) * len(answers) / sample
+
+    # Agreement: every STAR difference must be a legacy hit inside another word
+    star_diff = {component: 0 for component in STAR_COMPONENTS}
+    causes = {component: Counter() for component in STAR_COMPONENTS}
+    unexplained = 0
+    score_diff = 0
+    row = 0
+    for scores in batches:
+        for i in range(len(scores.overall)):
+            old_score, old_star = legacy[row]
+            if abs(old_score - scores.overall[i]) > 1e-9:
+                score_diff += 1
+            for index, component in enumerate(STAR_COMPONENTS):
+                if bool(old_star[component]) != bool(scores.star[i, index]):
+                    star_diff[component] += 1
+                    words = in_word_hits(answers[row], component) if old_star[component] else None
+                    if words:
+                        causes[component].update(words)
+                    else:
+                        unexplained += 1
+            row += 1
+
+    print(f"{'method':<32} {'seconds':>8} {'answers/s':>12}")
+    for name, seconds in (
+        ("legacy per-answer scans", legacy_seconds),
+        ("legacy feedback, one at a time", legacy_single_seconds),
+        ("engine.score, one at a time", single_seconds),
+        (f"engine, batches of {args.batch_size}", batch_seconds),
+        ("engine, batches, no tags", star_only_seconds),
+    ):
+        print(f"{name:<32} {seconds:>8.2f} {len(answers) / seconds:>12,.0f}")
+
+    print(f"Scores changed vs legacy: {score_diff / len(answers):.1%}")
+    for component, count in star_diff.items():
+        top = ", ".join(f'"{word}"' for word, _ in causes[component].most_common(4))
+        print(f"   {component:<10} {count / len(answers):.1%} of answers differ" + (f" (legacy matched inside {top})" if top else ""))
+    if unexplained:
+        print(f"❌ {unexplained} differences are not legacy matches inside other words")
+    else:
+        print("✅ Every difference is a legacy match inside another word")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cross-request ASR batching, throughput and tail latency
+
+Runs N concurrent streams against an in-process VoiceService, each
+transcribing a recording back to back (--requests per stream, no word
+timestamps, as the interview turn does), once with every request
+decoded on its own and once through the ASRBatcher. Reports requests/s,
+seconds of audio transcribed per second, p50/p95 latency and the mean
+decoder batch size. Needs the Whisper model (openai-whisper engine),
+preferably on a GPU.
+
+Usage:
+    python benchmarks/bench_asr_batching.py answer.wav
+    python benchmarks/bench_asr_batching.py answer.wav --streams 1 8 32 --requests 4 --window-ms 20
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.schemas import TranscriptionRequest
+from services.asr_batcher import ASRBatcher
+from services.audio_io import ASR_SAMPLE_RATE, get_audio_decoder
+from services.voice_service import VoiceService
+
+
+async def run_streams(service: VoiceService, audio, streams: int, requests: int) -> List[float]:
+    request = TranscriptionRequest(word_timestamps=False)
+    latencies = []
+
+    async def stream():
+        for _ in range(requests):
+            start = time.perf_counter()
+            await service.transcribe_samples(audio, request)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(stream() for _ in range(streams)))
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cross-request ASR batching")
+    parser.add_argument("audio", help="Recording transcribed by every request")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=4, help="Requests per stream")
+    parser.add_argument("--window-ms", type=int, help="Override ASR_BATCH_WINDOW_MS")
+    parser.add_argument("--max-batch", type=int, help="Override WHISPER_BATCH_SIZE")
+    args = parser.parse_args()
+
+    with open(args.audio, "rb") as f:
+        audio = get_audio_decoder().decode(f.read(), ASR_SAMPLE_RATE)
+    seconds = len(audio) / ASR_SAMPLE_RATE
+
+    service = VoiceService()
+    if not service.load_whisper():
+        print("❌ Whisper model not available")
+        sys.exit(1)
+    if not service.asr_engine.batch_decoding:
+        print(f"❌ {service.asr_engine.name} does not support batched decoding")
+        sys.exit(1)
+
+    window_ms = args.window_ms if args.window_ms is not None else service.settings.ASR_BATCH_WINDOW_MS
+    max_batch = args.max_batch or service.model_config.WHISPER_BATCH_SIZE
+    print(f"{os.path.basename(args.audio)}: {seconds:.1f}s, window {window_ms} ms, max batch {max_batch}")
+
+    # Warm-up (CUDA kernels, allocator)
+    service.asr_batcher = None
+    asyncio.run(run_streams(service, audio, 1, 1))
+
+    print(f"{'streams':>7} {'mode':>9} {'req/s':>8} {'audio s/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'batch':>6}")
+    for streams in args.streams:
+        for mode in ("single", "batched"):
+            # Each asyncio.run() is a new event loop
+            service._asr_lock = asyncio.Lock()
+            batcher = None
+            if mode == "batched":
+                batcher = ASRBatcher(service.asr_engine, service._asr_lock, max_batch=max_batch, window_ms=window_ms)
+            service.asr_batcher = batcher
+
+            start = time.perf_counter()
+            latencies = sorted(asyncio.run(run_streams(service, audio, streams, args.requests)))
+            elapsed = time.perf_counter() - start
+
+            mean_batch = batcher.get_stats()["mean_batch_size"] if batcher else 1.0
+            print(
+                f"{streams:>7} {mode:>9} {len(latencies) / elapsed:>8.2f} {len(latencies) * seconds / elapsed:>10.1f} "
+                f"{statistics.median(latencies):>9.0f} {latencies[int(len(latencies) * 0.95)]:>9.0f} {mean_batch:>6.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
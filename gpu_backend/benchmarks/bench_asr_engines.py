@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ASR engines, accuracy vs latency on a fixed test set
+
+Transcribes every recording of a manifest with each engine and reports
+word error rate against the reference transcripts, mean/p50/p90
+latency per file and the real-time factor (processing time / audio
+duration). Model load time is reported separately; one warm-up file is
+decoded before timing.
+
+The manifest is JSON lines with the audio path (relative to the
+manifest) and its reference text:
+
+    {"audio": "answers/001.wav", "text": "I led the migration to ..."}
+
+A LibriSpeech split directory (e.g. LibriSpeech/test-clean from
+https://www.openslr.org/12) can be given instead of a manifest; its
+*.trans.txt files are read in sorted order. The reference set for
+comparing engines is the first 200 utterances of test-clean
+(--limit 200), so runs on different hosts decode the same audio.
+
+Engines are given as engine:model[:device[:compute_type]], e.g.
+openai-whisper:large-v3:cuda or faster-whisper:small:cpu:int8
+(model "auto" picks the CPU size for this host). The default compares
+openai-whisper on this host's device with faster-whisper int8 on CPU.
+
+Usage:
+    python benchmarks/bench_asr_engines.py testset/manifest.jsonl
+    python benchmarks/bench_asr_engines.py LibriSpeech/test-clean --limit 200
+    python benchmarks/bench_asr_engines.py testset/manifest.jsonl \\
+        --engines openai-whisper:small:cpu faster-whisper:small:cpu:int8 faster-whisper:small:cpu:float32
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import sys
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import ModelConfig, get_device
+from models.schemas import TranscriptionRequest
+from services.asr_engines import ENGINES, cpu_model_size
+from services.audio_io import ASR_SAMPLE_RATE, get_audio_decoder
+
+
+def normalize(text: str) -> List[str]:
+    """Lowercase words without punctuation"""
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def word_errors(reference: List[str], hypothesis: List[str]) -> int:
+    """Word-level edit distance (substitutions + deletions + insertions)"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_word in enumerate(reference, 1):
+        current = [i] + [0] * len(hypothesis)
+        for j, hyp_word in enumerate(hypothesis, 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            )
+        previous = current
+    return previous[-1]
+
+
+def read_manifest(manifest: str) -> List[Tuple[str, str]]:
+    """(audio path, reference text) of each manifest line"""
+    base = os.path.dirname(os.path.abspath(manifest))
+    entries = []
+    with open(manifest) as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                entries.append((os.path.join(base, entry["audio"]), entry["text"]))
+    return entries
+
+
+def read_librispeech(directory: str) -> List[Tuple[str, str]]:
+    """(audio path, reference text) of each utterance of a LibriSpeech split, sorted by ID"""
+    entries = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(".trans.txt"):
+                continue
+            with open(os.path.join(root, name)) as f:
+                for line in f:
+                    utterance_id, _, text = line.strip().partition(" ")
+                    if utterance_id:
+                        entries.append((os.path.join(root, f"{utterance_id}.flac"), text))
+    return sorted(entries)
+
+
+def load_testset(source: str, limit: Optional[int] = None) -> List[Tuple[str, np.ndarray, str]]:
+    entries = read_librispeech(source) if os.path.isdir(source) else read_manifest(source)
+    decoder = get_audio_decoder()
+    items = []
+    for path, text in entries[:limit]:
+        with open(path, "rb") as audio_file:
+            audio = decoder.decode(audio_file.read(), ASR_SAMPLE_RATE)
+        items.append((os.path.basename(path), audio, text))
+    return items
+
+
+def build_engine(spec: str, **overrides):
+    parts = spec.split(":")
+    name, model_size = parts[0], parts[1] if len(parts) > 1 else "auto"
+    device = parts[2] if len(parts) > 2 else get_device()
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine {name}; expected one of {', '.join(ENGINES)}")
+
+    engine_cls, available = ENGINES[name]
+    if not available():
+        raise RuntimeError(f"{name} is not installed")
+
+    if len(parts) > 3:
+        key = "WHISPER_COMPUTE_TYPE" if device.startswith("cuda") else "WHISPER_CPU_COMPUTE_TYPE"
+        overrides[key] = parts[3]
+    if model_size == "auto":
+        model_size = cpu_model_size()
+    return engine_cls(model_size, device, ModelConfig(**overrides))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ASR engines (WER and latency)")
+    parser.add_argument("manifest", help="JSON lines of {audio, text}, or a LibriSpeech split directory")
+    parser.add_argument("--limit", type=int, help="Use only the first N recordings")
+    parser.add_argument("--engines", nargs="+", help="engine:model[:device[:compute_type]]")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--beam-size", type=int, help="Override WHISPER_BEAM_SIZE")
+    args = parser.parse_args()
+
+    testset = load_testset(args.manifest, args.limit)
+    if not testset:
+        print("❌ Empty test set")
+        sys.exit(1)
+    total_audio = sum(len(audio) for _, audio, _ in testset) / ASR_SAMPLE_RATE
+    print(f"Test set: {len(testset)} files, {total_audio:.1f}s of audio")
+
+    specs = args.engines or [f"openai-whisper:{ModelConfig().WHISPER_MODEL_SIZE}", "faster-whisper:auto:cpu:int8"]
+    request = TranscriptionRequest(language=args.language, word_timestamps=False)
+    overrides = {"WHISPER_BEAM_SIZE": args.beam_size} if args.beam_size is not None else {}
+
+    print(f"{'engine':<40} {'load s':>7} {'WER %':>7} {'mean ms':>9} {'p50 ms':>9} {'p90 ms':>9} {'RTF':>7}")
+    for spec in specs:
+        try:
+            engine = build_engine(spec, **overrides)
+        except (ValueError, RuntimeError) as e:
+            print(f"⚠️ {spec}: {e}")
+            continue
+
+        start = time.perf_counter()
+        if not engine.load():
+            print(f"❌ {spec}: model failed to load")
+            continue
+        load_seconds = time.perf_counter() - start
+
+        engine.transcribe(testset[0][1], request)  # warm-up
+
+        latencies = []
+        errors = 0
+        reference_words = 0
+        for _, audio, reference in testset:
+            start = time.perf_counter()
+            result = engine.transcribe(audio, request)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            reference = normalize(reference)
+            errors += word_errors(reference, normalize(result["text"]))
+            reference_words += len(reference)
+
+        latencies.sort()
+        label = f"{engine.name}:{engine.model_size}:{engine.device}"
+        if hasattr(engine, "compute_type"):
+            label += f":{engine.compute_type}"
+        print(
+            f"{label:<40} {load_seconds:>7.1f} {100 * errors / max(1, reference_words):>7.2f} "
+            f"{statistics.mean(latencies):>9.0f} {latencies[len(latencies) // 2]:>9.0f} "
+            f"{latencies[int(len(latencies) * 0.9)]:>9.0f} {sum(latencies) / 1000 / total_audio:>7.3f}"
+        )
+        engine.unload()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-request audio decode latency for transcription
+
+Compares the original path (write the upload to a temp file, then
+whisper.load_audio, i.e. one ffmpeg process per request) with
+AudioDecoder (in-memory WAV/FLAC decoding, ffmpeg over pipes only for
+other containers). Test clips are generated in memory: WAV at several
+rates and channel counts, FLAC, and MP3 when ffmpeg is installed.
+
+Reports mean/p95 decode latency per format and the ffmpeg processes
+spawned per minute at the given request rate.
+
+Usage:
+    python benchmarks/bench_audio_decode.py --seconds 20 --requests 50
+    python benchmarks/bench_audio_decode.py --rate 30   # requests per minute
+"""
+import argparse
+import io
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.audio_io import ASR_SAMPLE_RATE, AudioDecoder
+
+
+def make_clip(seconds: float, sample_rate: int, channels: int) -> np.ndarray:
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    voice = 0.3 * np.sin(2 * np.pi * 220 * t) * (1 + np.sin(2 * np.pi * 3 * t)) / 2
+    return np.stack([voice] * channels, axis=1).astype(np.float32)
+
+
+def encode(audio: np.ndarray, sample_rate: int, fmt: str, subtype: str = None) -> bytes:
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sample_rate, format=fmt, subtype=subtype)
+    return buffer.getvalue()
+
+
+def encode_mp3(wav: bytes) -> bytes:
+    return subprocess.run(
+        ["ffmpeg", "-nostdin", "-f", "wav", "-i", "pipe:0", "-f", "mp3", "-"],
+        input=wav, capture_output=True, check=True
+    ).stdout
+
+
+def legacy_decode(data: bytes) -> np.ndarray:
+    """Original VoiceService path: temp file + whisper.load_audio (ffmpeg)"""
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+        tmp.write(data)
+        tmp_path = tmp.name
+    try:
+        out = subprocess.run(
+            ["ffmpeg", "-nostdin", "-threads", "0", "-i", tmp_path, "-f", "s16le", "-ac", "1",
+             "-acodec", "pcm_s16le", "-ar", str(ASR_SAMPLE_RATE), "-"],
+            capture_output=True, check=True
+        ).stdout
+    finally:
+        os.unlink(tmp_path)
+    return np.frombuffer(out, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def timed(fn, data: bytes, requests: int):
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        fn(data)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return statistics.mean(latencies), latencies[max(0, int(len(latencies) * 0.95) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark audio decoding for ASR")
+    parser.add_argument("--seconds", type=float, default=20.0, help="Clip length")
+    parser.add_argument("--requests", type=int, default=50, help="Decodes per format")
+    parser.add_argument("--rate", type=float, default=60.0, help="Transcription requests per minute")
+    args = parser.parse_args()
+
+    has_ffmpeg = shutil.which("ffmpeg") is not None
+    clips = {
+        "wav 16k mono s16": encode(make_clip(args.seconds, 16000, 1), 16000, "WAV", "PCM_16"),
+        "wav 44.1k stereo s16": encode(make_clip(args.seconds, 44100, 2), 44100, "WAV", "PCM_16"),
+        "wav 48k mono float": encode(make_clip(args.seconds, 48000, 1), 48000, "WAV", "FLOAT"),
+        "flac 48k mono": encode(make_clip(args.seconds, 48000, 1), 48000, "FLAC"),
+    }
+    if has_ffmpeg:
+        clips["mp3 44.1k stereo"] = encode_mp3(clips["wav 44.1k stereo s16"])
+    else:
+        print("⚠️  ffmpeg not installed: skipping the original path and MP3")
+
+    decoder = AudioDecoder()
+    print(f"{args.seconds:.0f}s clips, {args.requests} decodes each")
+    print(f"{'format':<22} {'original ms':>12} {'p95':>8} {'in-memory ms':>13} {'p95':>8}  path")
+    for name, data in clips.items():
+        before = dict(decoder.stats)
+        new_mean, new_p95 = timed(decoder.decode, data, args.requests)
+        path = next(p for p in ("wav", "soundfile", "ffmpeg") if decoder.stats[p] > before[p])
+        if has_ffmpeg:
+            old_mean, old_p95 = timed(legacy_decode, data, args.requests)
+            old = f"{old_mean:>12.2f} {old_p95:>8.2f}"
+        else:
+            old = f"{'-':>12} {'-':>8}"
+        print(f"{name:<22} {old} {new_mean:>13.2f} {new_p95:>8.2f}  {path}")
+
+    # Spawns per minute: the original path spawns one ffmpeg per request;
+    # AudioDecoder only for formats outside WAV/FLAC/OGG
+    native = [name for name in clips if not name.startswith("mp3")]
+    print(f"ffmpeg spawns/min at {args.rate:.0f} requests/min:")
+    print(f"   original:  {args.rate:.0f} (every request)")
+    print(f"   in-memory: 0 for {', '.join(native)}; {args.rate:.0f} only if all uploads are MP3/M4A/WebM")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: size and encode latency of the TTS output formats
+
+For each output format (WAV, raw PCM, Opus, MP3) and utterance length,
+reports:
+- bytes per second of speech, as sent by /synthesize/stream
+- base64 bytes per second, as inlined into JSON (/synthesize, interview
+  turns)
+- encode latency added to a whole-utterance response
+- encode time per sentence when streaming (StreamEncoder)
+
+Compression levels come from TTS_OPUS_COMPRESSION_LEVEL and
+TTS_MP3_COMPRESSION_LEVEL unless given. Use --audio with real speech
+(e.g. saved TTS output); the default synthetic signal is only a rough
+stand-in for how codecs treat speech.
+
+Usage:
+    python benchmarks/bench_audio_formats.py
+    python benchmarks/bench_audio_formats.py --audio speech.wav --opus-level 0.9
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import get_model_config
+from models.schemas import AudioFormat
+from services.audio_io import (
+    StreamEncoder,
+    encode_audio,
+    get_audio_decoder,
+    supported_output_formats
+)
+
+
+SAMPLE_RATE = 24000  # XTTS-v2 output rate
+LENGTHS = [2, 5, 15, 30]
+SENTENCE_SECONDS = 3
+
+
+def synthetic_speech(seconds: float, rng: np.random.Generator) -> np.ndarray:
+    """Voiced harmonics with a wandering pitch, syllable envelope and pauses"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 120 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 12))
+    syllables = np.clip(np.sin(2 * np.pi * 4 * t), 0, None) * (np.sin(2 * np.pi * 0.3 * t) > -0.6)
+    audio = 0.15 * voiced * syllables + 0.005 * rng.standard_normal(len(t))
+    return audio.astype(np.float32)
+
+
+def median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def stream_ms(audio: np.ndarray, fmt: AudioFormat, level) -> float:
+    """Median encode time per sentence-sized piece of a stream"""
+    piece = SENTENCE_SECONDS * SAMPLE_RATE
+    encoder = StreamEncoder(fmt, SAMPLE_RATE, level)
+    times = []
+    for offset in range(0, len(audio), piece):
+        start = time.perf_counter()
+        encoder.write(audio[offset:offset + piece])
+        times.append((time.perf_counter() - start) * 1000)
+    encoder.close()
+    return statistics.median(times)
+
+
+def main():
+    config = get_model_config()
+    parser = argparse.ArgumentParser(description="Benchmark TTS output formats")
+    parser.add_argument("--audio", help="Speech recording to encode (default: synthetic)")
+    parser.add_argument("--lengths", type=float, nargs="+", default=LENGTHS, help="Seconds")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--opus-level", type=float, default=config.TTS_OPUS_COMPRESSION_LEVEL)
+    parser.add_argument("--mp3-level", type=float, default=config.TTS_MP3_COMPRESSION_LEVEL)
+    args = parser.parse_args()
+
+    formats = supported_output_formats()
+    missing = [fmt.value for fmt in AudioFormat if fmt not in formats]
+    if missing:
+        print(f"⚠️ Not encodable here (needs libsndfile >= 1.1): {', '.join(missing)}")
+
+    rng = np.random.default_rng(0)
+    if args.audio:
+        with open(args.audio, "rb") as f:
+            source = get_audio_decoder().decode(f.read(), SAMPLE_RATE)
+    else:
+        source = synthetic_speech(max(args.lengths), rng)
+
+    levels = {AudioFormat.OPUS: args.opus_level, AudioFormat.MP3: args.mp3_level}
+    print(f"{'seconds':>8} {'format':>7} {'kB/s':>7} {'b64 kB/s':>9} {'vs wav':>7} "
+          f"{'encode ms':>10} {'ms/s':>6} {'stream ms/sentence':>19}")
+    for seconds in args.lengths:
+        audio = np.resize(source, int(seconds * SAMPLE_RATE))
+        wav_size = None
+        for fmt in formats:
+            level = levels.get(fmt)
+            encoded = encode_audio(audio, SAMPLE_RATE, fmt, level)
+            size = len(encoded.data)
+            wav_size = wav_size or size
+            encode = median_ms(lambda: encode_audio(audio, SAMPLE_RATE, fmt, level).to_base64(), args.repeat)
+            print(
+                f"{seconds:>8.0f} {fmt.value:>7} {size / seconds / 1000:>7.1f} "
+                f"{len(encoded.to_base64()) / seconds / 1000:>9.1f} {wav_size / size:>6.1f}x "
+                f"{encode:>10.1f} {encode / seconds:>6.1f} {stream_ms(audio, fmt, level):>19.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmark: resume / job extraction engine vs the original regex functions
+
+Generates a synthetic corpus of resumes and job descriptions, checks that
+ExtractionEngine produces the same fields as the original per-pattern
+re.findall implementation, then times both.
+
+Usage:
+    python benchmarks/bench_extraction.py --docs 10000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.extraction_engine import (
+    ExtractionEngine,
+    MAX_SKILLS,
+    MAX_COMPANIES,
+    MAX_REQUIRED_SKILLS,
+    MAX_PREFERRED_SKILLS
+)
+
+
+# ---------------------------------------------------------------------------
+# Reference implementation (MatchWiseIntegrationService before the engine).
+# Returns the raw, un-deduplicated field lists so results can be compared
+# exactly; the original then applied list(set(...))[:cap].
+# ---------------------------------------------------------------------------
+
+def legacy_extract_resume_info(resume_text):
+    info = {"skills": [], "companies": []}
+    skill_patterns = [
+        r"(?:skills?|technologies?|tools?)[\s:]+([^\n]+)",
+        r"(?:proficient in|experienced with|expertise in)[\s:]+([^\n]+)",
+    ]
+    for pattern in skill_patterns:
+        matches = re.findall(pattern, resume_text, re.IGNORECASE)
+        for match in matches:
+            skills = [s.strip() for s in re.split(r'[,;|]', match) if s.strip()]
+            info["skills"].extend(skills)
+    company_patterns = [
+        r"(?:at|@|worked at|employed by)\s+([A-Z][A-Za-z\s]+(?:Inc|Corp|LLC|Ltd)?)",
+    ]
+    for pattern in company_patterns:
+        info["companies"].extend(re.findall(pattern, resume_text))
+    return info
+
+
+def legacy_extract_job_info(job_description):
+    info = {"required_skills": [], "preferred_skills": []}
+    required_patterns = [
+        r"(?:required|must have|essential)[\s:]+([^\n]+)",
+        r"requirements?[\s:]+([^\n]+)",
+    ]
+    for pattern in required_patterns:
+        matches = re.findall(pattern, job_description, re.IGNORECASE)
+        for match in matches:
+            skills = [s.strip() for s in re.split(r'[,;|]', match) if s.strip()]
+            info["required_skills"].extend(skills)
+    preferred_patterns = [
+        r"(?:preferred|nice to have|bonus)[\s:]+([^\n]+)",
+    ]
+    for pattern in preferred_patterns:
+        matches = re.findall(pattern, job_description, re.IGNORECASE)
+        for match in matches:
+            skills = [s.strip() for s in re.split(r'[,;|]', match) if s.strip()]
+            info["preferred_skills"].extend(skills)
+    return info
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+SKILLS = [
+    "Python", "PyTorch", "pytorch", "TensorFlow", "Kubernetes", "Docker", "SQL",
+    "Spark", "AWS", "GCP", "React", "Node.js", "C++", "Go", "Rust", "MLflow",
+    "Airflow", "LangChain", "Hugging Face", "FastAPI", "Redis", "Kafka",
+]
+COMPANIES = ["Acme Corp", "Globex Inc", "Initech LLC", "Umbrella Ltd", "Hooli", "Stark Industries"]
+FILLER = [
+    "Led a team that shipped features and improved latency by 30% during the migration.",
+    "Built data pipelines and tooling that the whole organization relied on.",
+    "Mentored engineers and drove the technical roadmap for the platform.",
+    "Owned on-call rotations and reduced incident volume quarter over quarter.",
+    "Café-style standups with the Zürich team to coordinate releases.",
+]
+SEPARATORS = [", ", "; ", " | ", ","]
+# Rare line exercising the IGNORECASE fallback (long s, dotted capital I)
+CASEFOLD_EXCEPTION_LINE = "Typeset a facsimile edition; ſkills: ligatures, long s, İstanbul office."
+
+
+def _items(rng, k):
+    return rng.choice(SEPARATORS).join(rng.sample(SKILLS, k))
+
+
+def synth_resume(rng):
+    lines = [
+        "Jane Doe - Machine Learning Engineer",
+        f"Summary: engineer with {rng.randint(2, 12)} years at {rng.choice(COMPANIES)} building ML tools.",
+        f"{rng.choice(['Skills', 'SKILLS', 'skill', 'Technical Skills'])}: {_items(rng, rng.randint(3, 8))}",
+        f"{rng.choice(['Proficient in', 'Experienced with', 'Expertise in'])} {_items(rng, rng.randint(2, 5))}",
+        f"Worked at {rng.choice(COMPANIES)} as ML engineer",
+        f"Employed by {rng.choice(COMPANIES)}",
+        f"Technologies:\n{_items(rng, rng.randint(2, 6))}",
+        f"Tools: {_items(rng, 3)} (Skills: proficient in {_items(rng, 2)})",
+    ]
+    lines += [rng.choice(FILLER) for _ in range(rng.randint(10, 80))]
+    if rng.random() < 0.02:
+        lines.append(CASEFOLD_EXCEPTION_LINE)
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+def synth_job(rng):
+    lines = [
+        "Senior AI Engineer",
+        f"Requirements: {_items(rng, rng.randint(3, 7))}",
+        f"{rng.choice(['Required', 'Must have', 'Essential'])}: {_items(rng, rng.randint(2, 6))}",
+        f"Requirement {_items(rng, 2)}",
+        f"{rng.choice(['Preferred', 'Nice to have', 'Bonus'])}: {_items(rng, rng.randint(1, 5))}",
+        "Required experience: requirements gathering, preferred: bonus skills",
+    ]
+    lines += [rng.choice(FILLER) for _ in range(rng.randint(5, 40))]
+    rng.shuffle(lines)
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Equivalence and timing
+# ---------------------------------------------------------------------------
+
+def _capped(items, cap):
+    return list(dict.fromkeys(items))[:cap]
+
+
+def check_equivalence(engine, resumes, jobs):
+    mismatches = 0
+    for text in resumes:
+        expected = legacy_extract_resume_info(text)
+        actual = engine.extract_resume(text)
+        if (actual["skills"] != _capped(expected["skills"], MAX_SKILLS)
+                or actual["companies"] != _capped(expected["companies"], MAX_COMPANIES)):
+            mismatches += 1
+    for text in jobs:
+        expected = legacy_extract_job_info(text)
+        actual = engine.extract_job(text)
+        if (actual["required_skills"] != _capped(expected["required_skills"], MAX_REQUIRED_SKILLS)
+                or actual["preferred_skills"] != _capped(expected["preferred_skills"], MAX_PREFERRED_SKILLS)):
+            mismatches += 1
+    return mismatches
+
+
+def legacy_full(resume_text, job_description):
+    resume = legacy_extract_resume_info(resume_text)
+    job = legacy_extract_job_info(job_description)
+    # Include the original dedupe step in the timed path
+    list(set(resume["skills"]))[:MAX_SKILLS]
+    list(set(resume["companies"]))[:MAX_COMPANIES]
+    list(set(job["required_skills"]))[:MAX_REQUIRED_SKILLS]
+    list(set(job["preferred_skills"]))[:MAX_PREFERRED_SKILLS]
+
+
+def time_it(fn, pairs, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for resume, job in pairs:
+            fn(resume, job)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the extraction engine")
+    parser.add_argument("--docs", type=int, default=10000, help="Synthetic resumes/jobs to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resumes = [synth_resume(rng) for _ in range(args.docs)]
+    jobs = [synth_job(rng) for _ in range(args.docs)]
+    engine = ExtractionEngine()
+
+    print("=" * 60)
+    print(f"Extraction benchmark: {args.docs} resumes + {args.docs} job descriptions")
+    print("=" * 60)
+
+    mismatches = check_equivalence(engine, resumes, jobs)
+    print(f"Output equivalence: {'OK' if mismatches == 0 else f'{mismatches} MISMATCHES'}")
+
+    pairs = list(zip(resumes, jobs))
+    legacy = time_it(legacy_full, pairs, args.repeat)
+    engine_time = time_it(
+        lambda r, j: (engine.extract_resume(r), engine.extract_job(j)),
+        pairs,
+        args.repeat
+    )
+
+    print(f"Legacy regex functions: {legacy * 1000:.1f}ms ({legacy / args.docs * 1e6:.1f}us/doc pair)")
+    print(f"ExtractionEngine:       {engine_time * 1000:.1f}ms ({engine_time / args.docs * 1e6:.1f}us/doc pair)")
+    print(f"Speedup: {legacy / engine_time:.2f}x")
+    print("=" * 60)
+
+    sys.exit(0 if mismatches == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
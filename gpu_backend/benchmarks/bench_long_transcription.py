@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark: long-form transcription real-time factor vs audio length
+
+For answers of increasing length, reports how speech_chunks splits the
+audio (chunk count, longest chunk, time and peak memory of the VAD pass)
+and, with --whisper, the real-time factor of the whole transcription
+(processing time / audio duration) through VoiceService, which needs
+the Whisper model and preferably a GPU.
+
+Audio is synthetic speech-like bursts separated by pauses, or a real
+recording (--audio) looped to each length.
+
+Usage:
+    python benchmarks/bench_long_transcription.py
+    python benchmarks/bench_long_transcription.py --whisper --audio answer.wav
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.audio_io import ASR_SAMPLE_RATE, get_audio_decoder
+from services.audio_segmentation import speech_chunks
+
+
+LENGTHS = [15, 30, 60, 120, 180, 300, 600]
+
+
+def synthetic_speech(seconds: float, seed: int = 0) -> np.ndarray:
+    """Modulated noise bursts of 1-8 s separated by 0.3-1.2 s pauses"""
+    rng = np.random.default_rng(seed)
+    total = int(seconds * ASR_SAMPLE_RATE)
+    audio = (rng.standard_normal(total) * 0.002).astype(np.float32)
+    position = 0
+    while position < total:
+        burst = int(rng.uniform(1, 8) * ASR_SAMPLE_RATE)
+        end = min(total, position + burst)
+        t = np.arange(end - position) / ASR_SAMPLE_RATE
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)  # syllable rate
+        audio[position:end] += (rng.standard_normal(end - position) * 0.1 * envelope).astype(np.float32)
+        position = end + int(rng.uniform(0.3, 1.2) * ASR_SAMPLE_RATE)
+    return audio
+
+
+def looped(recording: np.ndarray, seconds: float) -> np.ndarray:
+    total = int(seconds * ASR_SAMPLE_RATE)
+    return np.resize(recording, total).astype(np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark long-form transcription")
+    parser.add_argument("--audio", help="Recording looped to each length (default: synthetic)")
+    parser.add_argument("--whisper", action="store_true", help="Also run full transcription")
+    parser.add_argument("--lengths", type=float, nargs="+", default=LENGTHS, help="Seconds")
+    args = parser.parse_args()
+
+    recording = None
+    if args.audio:
+        with open(args.audio, "rb") as f:
+            recording = get_audio_decoder().decode(f.read())
+
+    service = None
+    if args.whisper:
+        from models.schemas import TranscriptionRequest
+        from services.voice_service import VoiceService
+        service = VoiceService()
+        if not service.load_whisper():
+            print("❌ Whisper model not available")
+            sys.exit(1)
+        request = TranscriptionRequest()
+
+    header = f"{'seconds':>8} {'chunks':>7} {'longest s':>10} {'vad ms':>8} {'vad peak MB':>12}"
+    if service:
+        header += f" {'asr s':>8} {'RTF':>7} {'words':>7}"
+    print(header)
+
+    for seconds in args.lengths:
+        audio = looped(recording, seconds) if recording is not None else synthetic_speech(seconds)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        chunks = speech_chunks(audio, ASR_SAMPLE_RATE)
+        vad_ms = (time.perf_counter() - start) * 1000
+        peak = tracemalloc.get_traced_memory()[1] / 1e6
+        tracemalloc.stop()
+
+        longest = max((end - begin for begin, end in chunks), default=0) / ASR_SAMPLE_RATE
+        line = f"{seconds:>8.0f} {len(chunks):>7} {longest:>10.1f} {vad_ms:>8.1f} {peak:>12.1f}"
+
+        if service:
+            buffer = io.BytesIO()
+            sf.write(buffer, audio, ASR_SAMPLE_RATE, format="WAV", subtype="PCM_16")
+            response = asyncio.run(service.transcribe(buffer.getvalue(), request))
+            asr_seconds = response.processing_time_ms / 1000
+            line += f" {asr_seconds:>8.2f} {asr_seconds / seconds:>7.3f} {len(response.text.split()):>7}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
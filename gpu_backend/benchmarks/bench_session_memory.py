@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory and stored size per interview session
+
+Builds many concurrent sessions that have answered several questions
+drawn from a shared question bank, in three layouts:
+- original: its own InterviewQuestion objects, a question.dict() copy per
+  response and every InterviewFeedback
+- inline: InterviewSession with every question stored inline in its state
+- refs: InterviewSession as the service stores it, questions referenced
+  by bank ID and rebuilt through the question registry
+
+Reports the packed state size (what the session store holds per session,
+rewritten every turn), traced heap bytes per live session, and the load
+time with a warm registry and on a cold worker that has to read the
+referenced questions back from the bank (held in memory here, so the
+cold load excludes Chroma read latency).
+
+Usage:
+    python benchmarks/bench_session_memory.py --sessions 2000 --turns 10
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import hashlib
+import tracemalloc
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.schemas import (
+    InterviewCategory,
+    InterviewConfig,
+    InterviewFeedback,
+    InterviewQuestion
+)
+from services import question_registry
+from services.interview_service import InterviewSession
+from services.prerag_service import PREBUILT_QUESTIONS
+from services.question_registry import GENERAL_SOURCE, QuestionRegistry, general_ref
+from services.session_store import pack_state, unpack_state
+
+
+ANSWER = (
+    "When I was leading the recommendation team we needed to cut inference "
+    "latency, so I developed a batching layer and the result improved p99 by 40%. "
+) * 2
+
+CATEGORIES = [InterviewCategory.TECHNICAL, InterviewCategory.BEHAVIORAL]
+
+
+def make_bank():
+    """The pre-RAG bank, with the IDs and fields PreRAGService stores"""
+    return [
+        InterviewQuestion(
+            id=f"{category.value}_{hashlib.md5(q['question'].encode()).hexdigest()[:16]}",
+            question=q["question"],
+            category=category,
+            subcategory=q.get("subcategory", "general"),
+            difficulty=q.get("difficulty", "medium"),
+            tags=q.get("tags", []),
+            sample_answer=q.get("sample_answer", ""),
+            evaluation_criteria=q.get("evaluation_criteria", [])
+        )
+        for category, questions in PREBUILT_QUESTIONS.items()
+        for q in questions
+    ]
+
+
+def fresh_registry(bank) -> QuestionRegistry:
+    """A worker's registry, reading the bank like PreRAGService.get_questions_by_id"""
+    by_id = {q.id: q for q in bank}
+    registry = QuestionRegistry()
+    registry.register_source(
+        GENERAL_SOURCE,
+        lambda scope, ids: [by_id[q_id].copy() for q_id in ids if q_id in by_id]
+    )
+    question_registry._registry = registry
+    return registry
+
+
+def make_feedback(question: InterviewQuestion) -> InterviewFeedback:
+    return InterviewFeedback(
+        question_id=question.id,
+        overall_score=random.uniform(55, 90),
+        strengths=["Great comprehensive response.", "Shows understanding of the question"],
+        growth_areas=["Good use of STAR method", "Good use of metrics"],
+        star_analysis={"situation": 80, "task": 80, "action": 80, "result": 80},
+        suggestions=["Try to quantify your achievements", "Include the impact of your actions"],
+        keywords_used=["ml_systems"]
+    )
+
+
+def build_session(registry: QuestionRegistry, bank, turns: int) -> InterviewSession:
+    """A session that answered `turns` questions"""
+    session = InterviewSession(
+        session_id=str(uuid.uuid4()),
+        user_id=f"user_{uuid.uuid4().hex[:8]}",
+        config=InterviewConfig(categories=CATEGORIES, max_questions=turns + 5),
+        rag_id="rag_bench"
+    )
+    questions = [registry.intern(q.copy(), general_ref(q.id)) for q in random.sample(bank, turns + 5)]
+    for question in questions[:turns]:
+        session.questions_asked.append(question)
+        session.record_response(question, ANSWER)
+        session.record_feedback(make_feedback(question), question)
+    session.plan.extend(questions[turns:])
+    session.current_question_index = turns
+    session.state = "in_progress"
+    return session
+
+
+def inline_state(session: InterviewSession) -> dict:
+    """State with every question stored inline instead of by reference"""
+    state = session.to_state()
+    state["q"] = [q.dict(exclude_defaults=True) for q in session.questions_asked]
+    state["p"] = [q.dict(exclude_defaults=True) for q in session.plan]
+    state["a"]["q"] = [q.id if q else None for q in session.answered_questions]
+    return state
+
+
+# ---------------------------------------------------------------------------
+# Reference layout (InterviewSession before the compact representation)
+# ---------------------------------------------------------------------------
+
+class LegacySession:
+    def __init__(self, state: dict, feedback):
+        self.session_id = state["id"]
+        self.user_id = state["u"]
+        self.config = InterviewConfig(**state["c"])
+        self.rag_id = state["r"]
+        self.started_at = datetime.utcfromtimestamp(state["t"])
+        self.questions_asked = [InterviewQuestion(**q) for q in state["q"]]
+        self.plan = [InterviewQuestion(**q) for q in state["p"]]
+        self.feedback_history = [InterviewFeedback(**f) for f in feedback]
+        by_id = {q.id: q for q in self.questions_asked}
+        self.responses = [
+            {
+                "question": by_id[question_id].dict(),
+                "response": text,
+                "timestamp": datetime.utcfromtimestamp(timestamp).isoformat()
+            }
+            for question_id, text, timestamp in zip(state["a"]["q"], state["a"]["r"], state["a"]["t"])
+        ]
+        self.current_question_index = state["qi"]
+        self.current_category_index = state["ci"]
+        self.current_question = None
+        self.state = state["s"]
+        self.version = 0
+
+
+def legacy_payload(state: dict, feedback) -> bytes:
+    """Packed state in the original layout (every feedback, one list per answer)"""
+    legacy = dict(state)
+    legacy["a"] = [
+        [question_id, text, datetime.utcfromtimestamp(timestamp).isoformat()]
+        for question_id, text, timestamp in zip(state["a"]["q"], state["a"]["r"], state["a"]["t"])
+    ]
+    legacy["f"] = feedback
+    legacy.pop("g")
+    return pack_state(legacy)
+
+
+def measure(build):
+    """(traced bytes, seconds) of building the objects; timed without tracing"""
+    gc.collect()
+    start = time.perf_counter()
+    objects = build()
+    seconds = time.perf_counter() - start
+    del objects
+
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memory and stored size per interview session")
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--turns", type=int, default=10, help="Answers per session (bank permitting)")
+    args = parser.parse_args()
+
+    random.seed(3)
+    bank = make_bank()
+    registry = fresh_registry(bank)
+    sessions = [build_session(registry, bank, args.turns) for _ in range(args.sessions)]
+    inline_states = [inline_state(session) for session in sessions]
+    ref_payloads = [pack_state(session.to_state()) for session in sessions]
+    del sessions
+    inline_payloads = [pack_state(state) for state in inline_states]
+    # All feedback, as the original layout kept it
+    feedbacks = [
+        [make_feedback(bank[0]).dict(exclude_defaults=True) for _ in range(args.turns)]
+        for _ in inline_states
+    ]
+
+    def cold_load():
+        fresh_registry(bank)
+        return [InterviewSession.from_state(unpack_state(payload)) for payload in ref_payloads]
+
+    layouts = [
+        (
+            "original",
+            sum(len(legacy_payload(s, f)) for s, f in zip(inline_states, feedbacks)),
+            measure(lambda: [
+                LegacySession(unpack_state(payload), feedback)
+                for payload, feedback in zip(inline_payloads, feedbacks)
+            ])
+        ),
+        (
+            "inline",
+            sum(len(p) for p in inline_payloads),
+            measure(lambda: [InterviewSession.from_state(unpack_state(payload)) for payload in inline_payloads])
+        ),
+        (
+            "refs",
+            sum(len(p) for p in ref_payloads),
+            measure(lambda: [InterviewSession.from_state(unpack_state(payload)) for payload in ref_payloads])
+        ),
+        ("refs cold", sum(len(p) for p in ref_payloads), measure(cold_load)),
+    ]
+
+    print(f"{args.sessions} sessions, {args.turns} answers + 5 planned each, bank of {len(bank)} questions")
+    print(f"{'layout':<10} {'state bytes':>12} {'heap/session':>14} {'load us':>9}")
+    for name, payload, (size, seconds) in layouts:
+        print(
+            f"{name:<10} {payload / args.sessions:>12,.0f} {size / args.sessions:>12,.0f} B "
+            f"{seconds / args.sessions * 1e6:>9.1f}"
+        )
+    stored = {name: payload for name, payload, _ in layouts}
+    print(f"Stored state per session: {stored['refs'] / stored['inline']:.0%} of inline questions, "
+          f"{stored['refs'] / stored['original']:.0%} of the original layout")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-turn session store overhead for each backend
+
+Simulates interview turns against a realistic session (questions, responses
+and feedback accumulating over the interview). Each turn is one
+load + decode + encode + compare-and-set save, i.e. exactly what
+GPUInterviewService adds around a message. Also checks that concurrent
+saves from a stale version are rejected.
+
+Usage:
+    python benchmarks/bench_session_store.py --sessions 200 --turns 10
+    python benchmarks/bench_session_store.py --redis fake     # fakeredis
+    python benchmarks/bench_session_store.py --redis url      # REDIS_URL
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import get_settings
+from models.schemas import (
+    InterviewCategory,
+    InterviewConfig,
+    InterviewFeedback,
+    InterviewQuestion
+)
+from services.interview_service import InterviewSession
+from services.session_store import (
+    InMemorySessionStore,
+    SQLiteSessionStore,
+    RedisSessionStore,
+    SessionConflictError,
+    pack_state,
+    unpack_state
+)
+
+
+ANSWER = (
+    "When I was leading the recommendation team we needed to cut inference "
+    "latency, so I developed a batching layer and the result improved p99 by 40%. "
+) * 2
+
+
+def new_session() -> InterviewSession:
+    return InterviewSession(
+        session_id=str(uuid.uuid4()),
+        user_id=f"user_{uuid.uuid4().hex[:8]}",
+        config=InterviewConfig(
+            categories=[InterviewCategory.TECHNICAL, InterviewCategory.BEHAVIORAL],
+            max_questions=10
+        ),
+        rag_id="rag_bench"
+    )
+
+
+def advance(session: InterviewSession, turn: int):
+    """Apply the state changes of one interview turn"""
+    question = InterviewQuestion(
+        id=f"technical_{turn}",
+        question=f"Describe how you would design system number {turn} for low-latency inference.",
+        category=InterviewCategory.TECHNICAL,
+        tags=["ml_systems", "latency"],
+        evaluation_criteria=["Trade-offs", "Metrics"]
+    )
+    if session.current_question is not None:
+        session.record_response(session.current_question, ANSWER)
+        session.record_feedback(InterviewFeedback(
+            question_id=session.current_question.id,
+            overall_score=78.5,
+            strengths=["Great comprehensive response.", "Shows understanding of the question"],
+            growth_areas=["Good use of STAR method", "Good use of metrics"],
+            star_analysis={"situation": 80, "task": 80, "action": 80, "result": 80},
+            suggestions=["Try to quantify your achievements", "Include the impact of your actions"],
+            keywords_used=["ml_systems"]
+        ), session.current_question)
+        session.current_question_index += 1
+    session.questions_asked.append(question)
+    session.current_question = question
+    session.state = "in_progress"
+
+
+def bench(store, sessions: int, turns: int) -> dict:
+    ids = []
+    for _ in range(sessions):
+        session = new_session()
+        store.create(session.session_id, pack_state(session.to_state()))
+        ids.append(session.session_id)
+
+    latencies = []
+    payload_sizes = []
+    for turn in range(turns):
+        for session_id in ids:
+            start = time.perf_counter()
+            version, payload = store.load(session_id)
+            session = InterviewSession.from_state(unpack_state(payload), version)
+            advance(session, turn)
+            payload = pack_state(session.to_state())
+            session.version = store.save(session_id, payload, session.version)
+            latencies.append((time.perf_counter() - start) * 1000)
+            payload_sizes.append(len(payload))
+
+    # A stale writer must be rejected
+    version, payload = store.load(ids[0])
+    store.save(ids[0], payload, version)
+    try:
+        store.save(ids[0], payload, version)
+        conflict_detected = False
+    except SessionConflictError:
+        conflict_detected = True
+
+    for session_id in ids:
+        store.delete(session_id)
+
+    latencies.sort()
+    return {
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1],
+        "payload_bytes": statistics.mean(payload_sizes),
+        "conflict_detected": conflict_detected
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark session store backends")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--redis", choices=["none", "fake", "url"], default="none",
+                        help="Also benchmark Redis via fakeredis or REDIS_URL")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    tmp = tempfile.mkdtemp(prefix="session_bench_")
+
+    stores = [
+        InMemorySessionStore(ttl=settings.SESSION_TTL),
+        SQLiteSessionStore(os.path.join(tmp, "sessions.db"), ttl=settings.SESSION_TTL)
+    ]
+    if args.redis == "fake":
+        import fakeredis
+        stores.append(RedisSessionStore(ttl=settings.SESSION_TTL, client=fakeredis.FakeRedis()))
+    elif args.redis == "url":
+        stores.append(RedisSessionStore(ttl=settings.SESSION_TTL, url=settings.REDIS_URL))
+
+    print(f"{args.sessions} sessions x {args.turns} turns")
+    print(f"{'backend':<8} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'bytes':>8}  conflict check")
+    for store in stores:
+        result = bench(store, args.sessions, args.turns)
+        print(
+            f"{store.name:<8} {result['mean_ms']:>9.3f} {result['p50_ms']:>9.3f} "
+            f"{result['p99_ms']:>9.3f} {result['payload_bytes']:>8.0f}  "
+            f"{'ok' if result['conflict_detected'] else 'FAILED'}"
+        )
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-utterance savings from cached XTTS speaker latents
+
+Loads the TTS model and, for each voice preset's reference wav, reports:
+- compute: get_conditioning_latents on the wav (what every request paid
+  when passing speaker_wav)
+- disk load: reading the cached latents back (restart / other workers)
+- per-utterance synthesis with speaker_wav vs with cached latents, for a
+  short and a longer interviewer line
+
+XTTS samples, so utterance times vary; use --repeat for stable medians.
+Needs the TTS model and preferably a GPU.
+
+Usage:
+    python benchmarks/bench_speaker_latents.py
+    python benchmarks/bench_speaker_latents.py --repeat 10 --presets professional_female
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.schemas import VoicePreset
+from services.speaker_latents import SpeakerLatentCache
+from services.voice_service import VOICE_PRESETS, VoiceService
+
+
+TEXTS = [
+    "Tell me about yourself.",
+    "Can you walk me through a project where you had to balance technical debt against delivery deadlines?",
+]
+
+
+def median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cached XTTS speaker latents")
+    parser.add_argument("--presets", nargs="+", choices=[p.value for p in VoicePreset],
+                        help="Voice presets (default: all)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    service = VoiceService()
+    if not service.load_tts():
+        print("❌ TTS model not available")
+        sys.exit(1)
+    xtts = service._xtts()
+    if xtts is None:
+        print(f"❌ {service.model_config.TTS_MODEL_NAME} is not an XTTS model")
+        sys.exit(1)
+
+    presets = [VoicePreset(p) for p in args.presets] if args.presets else list(VOICE_PRESETS)
+    model = service.tts_model
+    sr = model.synthesizer.output_sample_rate
+
+    with tempfile.TemporaryDirectory() as disk_dir:
+        for preset in presets:
+            filename = VOICE_PRESETS[preset]["speaker_wav"]
+            speaker_wav = service._get_speaker_wav(filename)
+            print(f"▶ {preset.value} ({os.path.basename(speaker_wav)})")
+
+            cache = SpeakerLatentCache(service.model_config.TTS_MODEL_NAME, disk_dir)
+            start = time.perf_counter()
+            _, latents = cache.get(speaker_wav, xtts, service.device)
+            compute_ms = (time.perf_counter() - start) * 1000
+
+            cache.clear()
+            start = time.perf_counter()
+            cache.get(speaker_wav, xtts, service.device)
+            disk_ms = (time.perf_counter() - start) * 1000
+            print(f"   latents: compute {compute_ms:.0f} ms, disk load {disk_ms:.1f} ms")
+
+            for text in TEXTS:
+                with_wav = median_ms(
+                    lambda: model.tts(text=text, speaker_wav=speaker_wav, language="en"), args.repeat
+                )
+                cached = median_ms(
+                    lambda: service._xtts_inference(text, "en", latents, 1.0), args.repeat
+                )
+                seconds = len(service._xtts_inference(text, "en", latents, 1.0)) / sr
+                print(
+                    f"   {len(text):>4} chars ({seconds:.1f}s audio): speaker_wav {with_wav:.0f} ms, "
+                    f"cached latents {cached:.0f} ms, saved {with_wav - cached:.0f} ms "
+                    f"({100 * (with_wav - cached) / with_wav:.0f}%)"
+                )
+
+
+if __name__ == "__main__":
+    main()
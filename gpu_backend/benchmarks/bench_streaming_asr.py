@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Replay benchmark: streaming vs upload-then-transcribe latency
+
+Feeds recorded WAV files to a running server in real time (frames of
+--frame-ms, paced by the wall clock) over /api/voice/transcribe/stream
+and measures:
+- time to first partial hypothesis after the first frame
+- finalization latency: from the end of the recording ("end" sent) to
+  the "done" message, i.e. what the user waits for after they stop talking
+
+For comparison each file is also uploaded whole to /api/voice/transcribe
+once the recording would have finished, where the user waits for the
+full decode.
+
+Usage:
+    python benchmarks/bench_streaming_asr.py answer1.wav answer2.wav --url http://localhost:8000
+    python benchmarks/bench_streaming_asr.py answer.wav --clients 4 --speed 2
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import aiohttp
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.audio_io import ASR_SAMPLE_RATE, get_audio_decoder
+
+
+def load_pcm(path: str) -> bytes:
+    """16 kHz mono PCM s16le of an audio file"""
+    with open(path, "rb") as f:
+        audio = get_audio_decoder().decode(f.read())
+    return (np.clip(audio, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+
+async def stream_file(http: aiohttp.ClientSession, args, pcm: bytes, results: Dict[str, List[float]]):
+    ws_url = args.url.replace("http", "ws", 1) + "/api/voice/transcribe/stream"
+    frame_bytes = ASR_SAMPLE_RATE * 2 * args.frame_ms // 1000
+    interval = args.frame_ms / 1000 / args.speed
+
+    async with http.ws_connect(ws_url, max_msg_size=0) as ws:
+        await ws.send_str(json.dumps({"type": "start", "sample_rate": ASR_SAMPLE_RATE}))
+        started = time.perf_counter()
+        first_partial = []
+        finals = []
+
+        async def receive():
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    raise RuntimeError(f"Connection closed: {msg.type}")
+                event = json.loads(msg.data)
+                kind = event["type"]
+                if kind == "ping":
+                    await ws.send_str(json.dumps({"type": "pong"}))
+                elif kind == "partial" and not first_partial:
+                    first_partial.append(time.perf_counter() - started)
+                elif kind == "final":
+                    finals.append(time.perf_counter())
+                elif kind == "error":
+                    raise RuntimeError(f"Transcription failed: {event}")
+                elif kind == "done":
+                    return event
+
+        receiver = asyncio.create_task(receive())
+        for i, offset in enumerate(range(0, len(pcm), frame_bytes)):
+            await ws.send_bytes(pcm[offset:offset + frame_bytes])
+            # Pace against the start time so sending overhead does not drift
+            delay = started + (i + 1) * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        ended = time.perf_counter()
+        await ws.send_str(json.dumps({"type": "end"}))
+        done = await receiver
+        results["finalize_ms"].append((time.perf_counter() - ended) * 1000)
+        # Segments already decoded while the user was still talking
+        results["finals_before_end"].append(sum(1 for received in finals if received < ended))
+        if first_partial:
+            results["first_partial_ms"].append(first_partial[0] * 1000)
+        results["words"].append(len(done["text"].split()))
+
+
+async def upload_file(http: aiohttp.ClientSession, args, pcm: bytes, results: Dict[str, List[float]]):
+    buffer = io.BytesIO()
+    sf.write(buffer, np.frombuffer(pcm, dtype="<i2"), ASR_SAMPLE_RATE, format="WAV", subtype="PCM_16")
+    form = aiohttp.FormData()
+    form.add_field("audio", buffer.getvalue(), filename="answer.wav", content_type="audio/wav")
+    form.add_field("word_timestamps", "false")
+
+    start = time.perf_counter()
+    async with http.post(f"{args.url}/api/voice/transcribe", data=form) as resp:
+        resp.raise_for_status()
+        await resp.json()
+    results["upload_ms"].append((time.perf_counter() - start) * 1000)
+
+
+def summarize(name: str, values: List[float]):
+    if not values:
+        return
+    values = sorted(values)
+    print(
+        f"{name:<22} n={len(values):<4} mean={statistics.mean(values):>9.1f} "
+        f"p50={values[len(values) // 2]:>9.1f} max={values[-1]:>9.1f}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Streaming ASR replay benchmark")
+    parser.add_argument("files", nargs="+", help="Recorded answers (any format AudioDecoder reads)")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--frame-ms", type=int, default=20)
+    parser.add_argument("--clients", type=int, default=1, help="Concurrent streams per file")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed (1 = real time)")
+    args = parser.parse_args()
+
+    recordings = {path: load_pcm(path) for path in args.files}
+    results: Dict[str, List[float]] = {
+        key: [] for key in ("first_partial_ms", "finalize_ms", "upload_ms", "finals_before_end", "words")
+    }
+
+    async with aiohttp.ClientSession() as http:
+        for path, pcm in recordings.items():
+            seconds = len(pcm) / 2 / ASR_SAMPLE_RATE
+            print(f"▶ {os.path.basename(path)}: {seconds:.1f}s")
+            outcomes = await asyncio.gather(
+                *(stream_file(http, args, pcm, results) for _ in range(args.clients)),
+                return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    print(f"   ❌ {outcome}")
+            await upload_file(http, args, pcm, results)
+
+    print("Latency after the user stops talking:")
+    summarize("streaming finalize ms", results["finalize_ms"])
+    summarize("upload + decode ms", results["upload_ms"])
+    summarize("first partial ms", results["first_partial_ms"])
+    summarize("finals before end", results["finals_before_end"])
+    summarize("words", results["words"])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: TTS output path, temp file + base64 round trip vs in memory
+
+For utterances of increasing length, compares per-utterance latency and
+peak allocated memory (tracemalloc) of:
+- file: the old path (waveform written to a temp WAV and read back,
+  written again into a BytesIO, base64-encoded for the JSON response and
+  base64-decoded again for /synthesize/stream)
+- json: WavAudio built from the waveform and base64-encoded once
+- stream: WAV pieces from StreamEncoder, one per SENTENCE_SECONDS of
+  audio, as sent by /synthesize/stream (no base64)
+
+The waveform stands in for the model output. With --tts the XTTS call
+itself is also timed both ways (tts_to_file + sf.read vs tts()), which
+needs the TTS model and a speaker reference.
+
+Usage:
+    python benchmarks/bench_tts_encoding.py
+    python benchmarks/bench_tts_encoding.py --tts --speaker data/voice_presets/professional_male.wav
+"""
+import argparse
+import base64
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.schemas import AudioFormat
+from services.audio_io import StreamEncoder, WavAudio
+
+
+SAMPLE_RATE = 24000  # XTTS-v2 output rate
+LENGTHS = [2, 5, 15, 30]
+SENTENCE_SECONDS = 3  # Audio per synthesized sentence in the stream path
+TEXT = "Tell me about a time you had to make a difficult technical decision under a tight deadline."
+
+
+def file_path(audio: np.ndarray, sr: int) -> int:
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+        sf.write(tmp.name, audio, sr)
+        audio, sr = sf.read(tmp.name)
+        os.unlink(tmp.name)
+    buffer = io.BytesIO()
+    sf.write(buffer, audio, sr, format="WAV")
+    encoded = base64.b64encode(buffer.getvalue()).decode("utf-8")
+    return len(base64.b64decode(encoded))
+
+
+def json_path(audio: np.ndarray, sr: int) -> int:
+    return len(WavAudio(audio, sr).to_base64())
+
+
+def stream_path(audio: np.ndarray, sr: int) -> int:
+    encoder = StreamEncoder(AudioFormat.WAV, sr)
+    step = int(SENTENCE_SECONDS * sr)
+    sent = sum(len(encoder.write(audio[i:i + step]).data) for i in range(0, len(audio), step))
+    return sent + len(encoder.close().data)
+
+
+def measure(fn, audio: np.ndarray, repeat: int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(audio, SAMPLE_RATE)
+        times.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    fn(audio, SAMPLE_RATE)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(times), peak / 1e6
+
+
+def bench_model(speaker: str, repeat: int):
+    from TTS.api import TTS
+    from config import get_model_config, get_device
+
+    model = TTS(get_model_config().TTS_MODEL_NAME).to(get_device())
+    model.tts(text=TEXT, speaker_wav=speaker, language="en")  # warm-up
+
+    def to_file():
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            model.tts_to_file(text=TEXT, speaker_wav=speaker, language="en", file_path=tmp.name)
+            sf.read(tmp.name)
+            os.unlink(tmp.name)
+
+    def in_memory():
+        np.asarray(model.tts(text=TEXT, speaker_wav=speaker, language="en"), dtype=np.float32)
+
+    print("XTTS call:")
+    for name, fn in (("tts_to_file + read", to_file), ("tts()", in_memory)):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append((time.perf_counter() - start) * 1000)
+        print(f"  {name:<20} median {statistics.median(times):>8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TTS output encoding")
+    parser.add_argument("--lengths", type=float, nargs="+", default=LENGTHS, help="Seconds")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tts", action="store_true", help="Also time the XTTS call")
+    parser.add_argument("--speaker", help="Speaker reference wav for --tts")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'seconds':>8} {'path':>7} {'ms':>8} {'peak MB':>9}")
+    for seconds in args.lengths:
+        audio = (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 0.1).astype(np.float32)
+        for name, fn in (("file", file_path), ("json", json_path), ("stream", stream_path)):
+            ms, peak = measure(fn, audio, args.repeat)
+            print(f"{seconds:>8.0f} {name:>7} {ms:>8.2f} {peak:>9.2f}")
+
+    if args.tts:
+        if not args.speaker:
+            print("❌ --tts needs --speaker")
+            sys.exit(1)
+        bench_model(args.speaker, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
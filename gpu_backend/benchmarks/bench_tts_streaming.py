@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark: time to first audio, streamed vs whole-utterance TTS
+
+Sends interviewer prompts of increasing length to a running server and
+measures, per prompt:
+- stream TTFA: time from the request to the first PCM bytes of
+  /api/voice/synthesize/stream (sentence-level streaming)
+- stream total: time until the last byte
+- full: time until /api/voice/synthesize returns the whole utterance,
+  which is what the listener waits for without streaming
+
+Each prompt is sent with a unique suffix so the TTS cache does not hide
+synthesis time (--allow-cache to measure cached prompts instead).
+
+Usage:
+    python benchmarks/bench_tts_streaming.py --url http://localhost:8000
+    python benchmarks/bench_tts_streaming.py --repeat 5 --allow-cache
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from typing import Dict, List
+
+import aiohttp
+
+
+PROMPTS = [
+    "Tell me about yourself.",
+    "Thanks for walking me through that. Can you tell me about a project where you had to "
+    "balance technical debt against delivery deadlines?",
+    "That's a great example, and I appreciate the detail on how you communicated with stakeholders. "
+    "Let's move on to system design. Imagine you need to build a rate limiter for a public API "
+    "that serves millions of requests per day. How would you approach it, what data structures "
+    "would you use, and how would you handle bursts of traffic across multiple regions?",
+]
+
+WAV_HEADER_BYTES = 44
+
+
+async def stream_once(http: aiohttp.ClientSession, url: str, text: str) -> Dict[str, float]:
+    start = time.perf_counter()
+    first = None
+    received = 0
+    async with http.post(f"{url}/api/voice/synthesize/stream", data={"text": text}) as resp:
+        resp.raise_for_status()
+        async for chunk in resp.content.iter_any():
+            received += len(chunk)
+            if first is None and received > WAV_HEADER_BYTES:
+                first = time.perf_counter() - start
+    return {"ttfa_ms": first * 1000, "stream_total_ms": (time.perf_counter() - start) * 1000}
+
+
+async def full_once(http: aiohttp.ClientSession, url: str, text: str) -> float:
+    start = time.perf_counter()
+    async with http.post(f"{url}/api/voice/synthesize", json={"text": text}) as resp:
+        resp.raise_for_status()
+        await resp.json()
+    return (time.perf_counter() - start) * 1000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Streaming TTS time-to-first-audio benchmark")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--allow-cache", action="store_true", help="Reuse identical prompts")
+    args = parser.parse_args()
+
+    def prompt(text: str) -> str:
+        return text if args.allow_cache else f"{text} Reference {uuid.uuid4().hex[:6]}."
+
+    timeout = aiohttp.ClientTimeout(total=600)
+    async with aiohttp.ClientSession(timeout=timeout) as http:
+        # Warm-up (model load)
+        await full_once(http, args.url, prompt(PROMPTS[0]))
+
+        print(f"{'chars':>6} {'stream TTFA ms':>15} {'stream total ms':>16} {'full ms':>9} {'TTFA gain':>10}")
+        for text in PROMPTS:
+            results: Dict[str, List[float]] = {"ttfa_ms": [], "stream_total_ms": [], "full_ms": []}
+            for _ in range(args.repeat):
+                for key, value in (await stream_once(http, args.url, prompt(text))).items():
+                    results[key].append(value)
+                results["full_ms"].append(await full_once(http, args.url, prompt(text)))
+
+            ttfa = statistics.median(results["ttfa_ms"])
+            full = statistics.median(results["full_ms"])
+            print(
+                f"{len(text):>6} {ttfa:>15.0f} {statistics.median(results['stream_total_ms']):>16.0f} "
+                f"{full:>9.0f} {full / ttfa:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
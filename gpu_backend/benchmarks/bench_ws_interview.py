@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Load test: time-to-first-audio over the interview WebSocket
+
+Starts concurrent interviews against a running server, drives each over
+/api/interview/ws/{session_id} and measures, per turn, the time from
+submitting an answer to the first pushed event, the next question text,
+the first audio frame and turn completion. Answers are sent as text, or
+as binary audio frames when --audio is given.
+
+Usage:
+    python benchmarks/bench_ws_interview.py --url http://localhost:8000 --clients 20 --turns 5
+    python benchmarks/bench_ws_interview.py --audio answer.wav --voice
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import aiohttp
+
+
+ANSWER = (
+    "When I was leading the recommendation team we needed to cut inference "
+    "latency, so I developed a batching layer and the result improved p99 by 40%."
+)
+
+
+async def run_client(
+    http: aiohttp.ClientSession,
+    args,
+    audio: Optional[bytes],
+    results: Dict[str, List[float]]
+):
+    async with http.post(f"{args.url}/api/interview/start", json={
+        "user_id": f"loadtest_{uuid.uuid4().hex[:8]}",
+        "config": {"max_questions": args.turns + 1, "use_voice": args.voice}
+    }) as resp:
+        resp.raise_for_status()
+        session_id = (await resp.json())["session_id"]
+
+    ws_url = args.url.replace("http", "ws", 1) + f"/api/interview/ws/{session_id}"
+    async with http.ws_connect(ws_url, max_msg_size=0) as ws:
+        for turn in range(args.turns + 1):
+            # Turn 0 starts the interview; the rest answer a question
+            if turn and audio:
+                for offset in range(0, len(audio), args.chunk_bytes):
+                    await ws.send_bytes(audio[offset:offset + args.chunk_bytes])
+            sent = time.perf_counter()
+            await ws.send_str(json.dumps({"type": "answer", "message": ANSWER if turn else ""}))
+
+            first_event = None
+            first_audio = None
+            question_at = None
+            async for msg in ws:
+                now = (time.perf_counter() - sent) * 1000
+                if msg.type == aiohttp.WSMsgType.BINARY:
+                    if first_audio is None:
+                        first_audio = now
+                    continue
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    raise RuntimeError(f"Connection closed: {msg.type}")
+
+                event = json.loads(msg.data)
+                kind = event["type"]
+                if kind == "ping":
+                    await ws.send_str(json.dumps({"type": "pong"}))
+                    continue
+                if first_event is None:
+                    first_event = now
+                if kind == "question":
+                    question_at = now
+                elif kind == "error":
+                    raise RuntimeError(f"Turn failed: {event}")
+                elif kind == "turn_complete":
+                    results["turn_ms"].append(now)
+                    break
+
+            key = "first_turn" if turn == 0 else "answer"
+            results[f"{key}_first_event_ms"].append(first_event)
+            if question_at is not None:
+                results[f"{key}_question_ms"].append(question_at)
+            if first_audio is not None:
+                results[f"{key}_first_audio_ms"].append(first_audio)
+
+            await asyncio.sleep(args.think_time)
+
+    async with http.post(f"{args.url}/api/interview/session/{session_id}/end") as resp:
+        await resp.read()
+
+
+def summarize(name: str, values: List[float]):
+    if not values:
+        return
+    values = sorted(values)
+    print(
+        f"{name:<30} n={len(values):<5} mean={statistics.mean(values):>8.1f}ms "
+        f"p50={values[len(values) // 2]:>8.1f}ms "
+        f"p95={values[max(0, int(len(values) * 0.95) - 1)]:>8.1f}ms "
+        f"max={values[-1]:>8.1f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Interview WebSocket load test")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--voice", action="store_true", help="Request synthesized audio")
+    parser.add_argument("--audio", help="WAV file streamed as each answer")
+    parser.add_argument("--chunk-bytes", type=int, default=16000)
+    parser.add_argument("--think-time", type=float, default=0.5, help="Seconds between turns")
+    args = parser.parse_args()
+
+    audio = None
+    if args.audio:
+        with open(args.audio, "rb") as f:
+            audio = f.read()
+
+    results: Dict[str, List[float]] = {
+        key: [] for key in (
+            "first_turn_first_event_ms", "first_turn_question_ms", "first_turn_first_audio_ms",
+            "answer_first_event_ms", "answer_question_ms", "answer_first_audio_ms", "turn_ms"
+        )
+    }
+
+    start = time.perf_counter()
+    async with aiohttp.ClientSession() as http:
+        outcomes = await asyncio.gather(
+            *(run_client(http, args, audio, results) for _ in range(args.clients)),
+            return_exceptions=True
+        )
+    elapsed = time.perf_counter() - start
+
+    failures = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    print(f"{args.clients} clients x {args.turns} turns in {elapsed:.1f}s, {len(failures)} failed")
+    for failure in failures[:5]:
+        print(f"   ❌ {failure}")
+    for name, values in results.items():
+        summarize(name, values)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Batch-build personalized RAGs for a cohort
+
+Reads one PersonalizedRAGRequest JSON object per line and builds all of them
+through MatchWiseIntegrationService.build_personalized_rags_batch, which
+embeds question texts across users in large de-duplicated batches.
+
+Usage:
+    python build_personalized_rags.py cohort.jsonl
+    python build_personalized_rags.py cohort.jsonl --chunk-size 200 --output results.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models.schemas import PersonalizedRAGRequest
+
+
+def load_requests(path: str):
+    requests = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                requests.append(PersonalizedRAGRequest(**json.loads(line)))
+            except Exception as e:
+                print(f"⚠️  Skipping line {line_no}: {e}")
+    return requests
+
+
+async def run(args):
+    from services import get_matchwise_service
+
+    requests = load_requests(args.input)
+    if not requests:
+        print("❌ No valid requests found")
+        return 1
+
+    service = get_matchwise_service()
+    out = open(args.output, "w", encoding="utf-8") if args.output else None
+
+    total_users = 0
+    succeeded = 0
+    total_questions = 0
+    total_ms = 0.0
+
+    try:
+        for offset in range(0, len(requests), args.chunk_size):
+            chunk = requests[offset:offset + args.chunk_size]
+            response = await service.build_personalized_rags_batch(chunk)
+
+            total_users += response.total_users
+            succeeded += response.succeeded
+            total_questions += response.total_questions
+            total_ms += response.total_time_ms
+
+            print(
+                f"Chunk {offset // args.chunk_size + 1}: "
+                f"{response.succeeded}/{response.total_users} users, "
+                f"{response.total_questions} questions "
+                f"({response.unique_texts_embedded} unique texts embedded), "
+                f"{response.total_time_ms:.0f}ms, "
+                f"{response.users_per_second:.1f} users/s, "
+                f"{response.questions_per_second:.1f} questions/s"
+            )
+
+            for stats in response.per_user:
+                if out:
+                    out.write(stats.model_dump_json() + "\n")
+                if stats.status != "ready":
+                    print(f"   ❌ {stats.user_id}: {stats.error}")
+    finally:
+        if out:
+            out.close()
+
+    seconds = total_ms / 1000
+    print("=" * 60)
+    print(f"Built {succeeded}/{total_users} personalized RAGs in {seconds:.2f}s")
+    if seconds > 0:
+        print(f"Throughput: {succeeded / seconds:.1f} users/s, {total_questions / seconds:.1f} questions/s")
+    print("=" * 60)
+    return 0 if succeeded == total_users else 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-build personalized RAGs from a JSONL file")
+    parser.add_argument("input", help="JSONL file with one PersonalizedRAGRequest per line")
+    parser.add_argument("--chunk-size", type=int, default=100, help="Users per batch build (default: 100)")
+    parser.add_argument("--output", help="Write per-user build stats as JSONL")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
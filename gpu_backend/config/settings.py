@@ -74,10 +74,50 @@ class Settings(BaseSettings):
     MAX_CONCURRENT_REQUESTS: int = 10
     REQUEST_TIMEOUT: int = 60
     BATCH_SIZE: int = 8
+    MAX_RAG_BATCH_USERS: int = 500  # Max users per batch personalized-RAG build
     
     # Interview Settings
     MAX_QUESTIONS_PER_SESSION: int = 20
     QUESTION_TIMEOUT: int = 300  # 5 minutes per question
+    QUESTION_REGISTRY_SIZE: int = 4096  # Distinct questions shared between sessions per worker
+    SESSION_FEEDBACK_HISTORY: int = 3  # Per-answer feedback kept on a session (scores are aggregated)
+    
+    # Session Store (shared across workers)
+    SESSION_STORE: str = "auto"  # auto, memory, sqlite, redis
+    SESSION_TTL: int = 7200  # Seconds without a turn before a session expires
+    SESSION_DB_PATH: str = "./data/sessions/sessions.db"
+    SESSION_KEY_PREFIX: str = "smartsuccess:session:"
+    
+    # Session Lifecycle
+    MAX_ACTIVE_SESSIONS: int = 1000  # Least recently active sessions are evicted beyond this
+    SESSION_IDLE_FACTOR: float = 2.0  # Idle timeout = QUESTION_TIMEOUT * factor
+    SESSION_SWEEP_INTERVAL: int = 60  # Seconds between background sweeps
+    SESSION_SNAPSHOT_ON_EVICT: bool = True  # Write final feedback of evicted sessions
+    SESSION_SNAPSHOT_DIR: str = "./data/sessions/snapshots"
+    
+    # Interview WebSocket
+    WS_HEARTBEAT_INTERVAL: int = 15  # Seconds between server pings
+    WS_HEARTBEAT_TIMEOUT: int = 45  # Close when nothing was received for this long
+    WS_SEND_QUEUE_SIZE: int = 64  # Outgoing frames buffered per connection
+    WS_SEND_TIMEOUT: float = 10.0  # Close a client that stops reading for this long
+    WS_AUDIO_CHUNK_BYTES: int = 32768  # Size of outgoing binary audio frames
+    WS_MAX_AUDIO_BYTES: int = 25 * 1024 * 1024  # Max buffered answer audio
+    
+    # Streaming transcription
+    ASR_STREAM_ENDPOINT_MS: int = 600  # Pause after speech that commits a segment
+    ASR_STREAM_PARTIAL_INTERVAL_MS: int = 1000  # New speech between partial hypotheses
+    
+    # Cross-request ASR batching (up to WHISPER_BATCH_SIZE windows per pass)
+    ASR_BATCHING_ENABLED: bool = True
+    ASR_BATCH_WINDOW_MS: int = 10  # Wait after the first queued window for others
+    
+    # Personalized RAG
+    PERSONALIZED_DEDUP_THRESHOLD: float = 0.92  # Cosine similarity above which questions are near-duplicates
+    PERSONALIZED_CANDIDATE_FACTOR: int = 3  # Candidate pool size as a multiple of num_questions
+    
+    # Federated Retrieval
+    FEDERATED_PERSONALIZED_WEIGHT: float = 1.0  # Score multiplier for personalized RAG hits
+    FEDERATED_GENERAL_WEIGHT: float = 0.85  # Score multiplier for pre-RAG hits
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -109,6 +149,7 @@ class GPUConfig(BaseSettings):
     
     # Batch processing
     EMBEDDING_BATCH_SIZE: int = 32
+    EMBEDDING_BULK_BATCH_SIZE: int = 256  # Cross-user bulk encoding (batch RAG builds)
     INFERENCE_BATCH_SIZE: int = 4
     TTS_BATCH_SIZE: int = 1  # TTS is memory intensive
     
@@ -132,6 +173,14 @@ class ModelConfig(BaseSettings):
     WHISPER_TASK: str = "transcribe"
     WHISPER_VAD_FILTER: bool = True
     WHISPER_BEAM_SIZE: int = 5
+    WHISPER_ENGINE: str = "auto"  # auto, openai-whisper or faster-whisper
+    WHISPER_CPU_MODEL_SIZE: str = "auto"  # "auto" sizes the model by cores and memory
+    WHISPER_CPU_COMPUTE_TYPE: str = "int8"
+    WHISPER_CPU_THREADS: int = 0  # 0 = all available cores
+    WHISPER_LONG_FORM: bool = True  # Split answers over 30 s at pauses instead of truncating
+    WHISPER_BATCH_SIZE: int = 8  # Windows decoded together (long-form and across requests)
+    VAD_MIN_SILENCE_MS: int = 300  # Shortest pause a chunk is cut at
+    VAD_THRESHOLD_DB: float = 12.0  # Speech = frames this far above the noise floor
     
     # TTS
     TTS_MODEL_NAME: str = "tts_models/multilingual/multi-dataset/xtts_v2"
@@ -139,6 +188,34 @@ class ModelConfig(BaseSettings):
     TTS_LANGUAGE: str = "en"
     TTS_SPEED: float = 1.0
     
+    # TTS audio cache
+    TTS_CACHE_ENABLED: bool = True
+    TTS_CACHE_VERSION: str = "1"  # Bump to invalidate cached audio (e.g. new speaker wavs)
+    TTS_CACHE_MEMORY_MB: int = 256
+    TTS_CACHE_DISK_MB: int = 2048  # 0 disables the disk tier
+    TTS_CACHE_DIR: str = "./data/tts_cache"
+    TTS_SEGMENT_GAP_MS: int = 150  # Silence between stitched segments
+    
+    # Compressed TTS output (libsndfile level: 0 = highest bitrate, 1 = smallest)
+    TTS_OPUS_COMPRESSION_LEVEL: float = 0.8  # ~58 kbps at 24 kHz; 0.9 (~32 kbps) encodes ~2.5x slower
+    TTS_MP3_COMPRESSION_LEVEL: float = 0.8  # ~33 kbps VBR, ~40 kbps CBR when streamed
+    
+    # TTS post-processing, in order: peak_normalize, loudness_normalize,
+    # noise_gate, noise_reduction (spectral, several times the cost of the
+    # others). Each stage skips audio it would not change much.
+    TTS_ENHANCEMENT_STAGES: List[str] = Field(default=["noise_gate", "loudness_normalize"])
+    TTS_ENHANCEMENT_WORKERS: int = 2
+    TTS_LOUDNESS_TARGET_DB: float = -20.0  # Speech RMS, dBFS
+    
+    # XTTS speaker conditioning latents, computed once per preset wav
+    TTS_LATENT_CACHE_ENABLED: bool = True
+    TTS_LATENT_CACHE_DIR: str = "./data/tts_latents"  # Empty keeps them in memory only
+    
+    # Sentence-level streaming TTS
+    TTS_STREAM_MAX_CHARS: int = 200  # Longer sentences are cut at clauses
+    TTS_STREAM_FIRST_CHARS: int = 80  # Shorter first piece for faster first audio
+    TTS_STREAM_LOOKAHEAD: int = 2  # Sentences synthesized ahead of the client
+    
     # Embedding
     EMBEDDING_MODEL_NAME: str = "sentence-transformers/all-mpnet-base-v2"
     EMBEDDING_DIMENSION: int = 768
@@ -155,6 +232,8 @@ class ModelConfig(BaseSettings):
     CHROMA_PERSIST_DIR: str = "./data/pre_rag/chroma"
     CHROMA_COLLECTION_PREFIX: str = "smartsuccess"
     CHROMA_DISTANCE_FN: str = "cosine"
+    CHROMA_WRITE_LINGER_MS: int = 20  # Write-behind queue: wait to merge concurrent builds
+    CHROMA_MAX_BATCH_ROWS: int = 5000  # Rows per collection.add call
     
     class Config:
         env_file = ".env"
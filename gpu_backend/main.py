@@ -83,6 +83,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize Embedding service: {e}")
     
+    try:
+        logger.info("Starting interview session sweeper...")
+        from services import get_gpu_interview_service
+        get_gpu_interview_service().lifecycle.start()
+    except Exception as e:
+        logger.error(f"Failed to start session sweeper: {e}")
+    
     logger.info("=" * 60)
     logger.info(f"Server ready at http://{settings.HOST}:{settings.PORT}")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
@@ -95,6 +102,19 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down GPU Backend...")
     
     # Cleanup resources
+    try:
+        from services import get_gpu_interview_service
+        await get_gpu_interview_service().lifecycle.stop()
+    except:
+        pass
+    
+    try:
+        from services import matchwise_service
+        if matchwise_service._service_instance is not None:
+            matchwise_service._service_instance.flush_pending_writes()
+    except:
+        pass
+    
     try:
         from services import get_voice_service
         voice_service = get_voice_service()
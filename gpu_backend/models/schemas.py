@@ -3,7 +3,7 @@ SmartSuccess.AI GPU Backend - Pydantic Schemas
 Data models for API requests and responses
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
@@ -42,6 +42,13 @@ class EmotionStyle(str, Enum):
     WARM = "warm"
 
 
+class AudioFormat(str, Enum):
+    WAV = "wav"  # 16-bit PCM WAV
+    OPUS = "opus"  # Opus in an Ogg container
+    MP3 = "mp3"
+    PCM = "pcm"  # Headerless 16-bit little-endian mono PCM
+
+
 # ============================================================================
 # Health & Status
 # ============================================================================
@@ -99,6 +106,7 @@ class TTSRequest(BaseModel):
     emotion: EmotionStyle = EmotionStyle.NEUTRAL
     speed: float = Field(default=1.0, ge=0.5, le=2.0)
     language: str = "en"
+    format: Optional[AudioFormat] = None  # None: negotiated from Accept, else WAV
 
 
 class TTSResponse(BaseModel):
@@ -136,6 +144,9 @@ class InterviewQuestion(BaseModel):
     tags: List[str] = []
     follow_up_questions: Optional[List[str]] = None
     relevance_score: Optional[float] = None
+    
+    # Question bank reference, set by the question registry (not serialized)
+    _bank_ref: Optional[str] = PrivateAttr(default=None)
 
 
 class RAGQueryRequest(BaseModel):
@@ -193,6 +204,37 @@ class PersonalizedRAGResponse(BaseModel):
     expires_at: Optional[datetime] = None
 
 
+class PersonalizedRAGBatchRequest(BaseModel):
+    """Request to build personalized RAGs for a cohort of users"""
+    requests: List[PersonalizedRAGRequest] = Field(min_length=1)
+
+
+class PersonalizedRAGBuildStats(BaseModel):
+    """Per-user build result within a batch"""
+    user_id: str
+    rag_id: Optional[str] = None
+    status: str
+    question_count: int = 0
+    build_time_ms: float
+    questions_per_second: float = 0
+    error: Optional[str] = None
+
+
+class PersonalizedRAGBatchResponse(BaseModel):
+    """Response from batch personalized RAG building"""
+    results: List[PersonalizedRAGResponse]
+    per_user: List[PersonalizedRAGBuildStats]
+    total_users: int
+    succeeded: int
+    failed: int
+    total_questions: int
+    unique_texts_embedded: int
+    embedding_time_ms: float
+    total_time_ms: float
+    users_per_second: float
+    questions_per_second: float
+
+
 class PersonalizedQuestionRequest(BaseModel):
     """Request for personalized question"""
     rag_id: str
@@ -201,6 +243,35 @@ class PersonalizedQuestionRequest(BaseModel):
     exclude_ids: List[str] = []
 
 
+class FederatedQueryRequest(BaseModel):
+    """Semantic query across a user's personalized RAG and the pre-RAG bank"""
+    query: str
+    rag_id: Optional[str] = None
+    categories: Optional[List[InterviewCategory]] = None  # Pre-RAG categories (default: all)
+    difficulty: Optional[InterviewDifficulty] = None
+    n_results: int = Field(default=5, ge=1, le=20)
+    include_general: bool = True
+    include_sample_answers: bool = False
+    personalized_weight: Optional[float] = Field(default=None, ge=0)
+    general_weight: Optional[float] = Field(default=None, ge=0)
+
+
+class FederatedQuestion(BaseModel):
+    """Question from a federated query with its source and weighted score"""
+    question: InterviewQuestion
+    source: str  # "personalized" or "general"
+    score: float
+
+
+class FederatedQueryResponse(BaseModel):
+    """Response from a federated query"""
+    results: List[FederatedQuestion]
+    total_results: int
+    source_counts: Dict[str, int]
+    embedding_time_ms: float
+    query_time_ms: float
+
+
 # ============================================================================
 # Interview Session
 # ============================================================================
@@ -212,11 +283,18 @@ class InterviewConfig(BaseModel):
     use_personalized_rag: bool = False
     rag_id: Optional[str] = None
     voice_preset: VoicePreset = VoicePreset.PROFESSIONAL_MALE
+    audio_format: AudioFormat = AudioFormat.WAV
     difficulty: InterviewDifficulty = InterviewDifficulty.MEDIUM
     max_questions: int = 10
     time_limit_minutes: Optional[int] = None
 
 
+class ReplanRequest(BaseModel):
+    """Request to re-plan the remaining questions of a session"""
+    difficulty: Optional[InterviewDifficulty] = None
+    categories: Optional[List[InterviewCategory]] = None
+
+
 class StartInterviewRequest(BaseModel):
     """Request to start interview"""
     user_id: str
@@ -241,6 +319,7 @@ class InterviewMessageRequest(BaseModel):
     session_id: str
     message: str
     audio_base64: Optional[str] = None  # If voice input
+    audio_format: Optional[AudioFormat] = None  # Voice output format from this turn on
 
 
 class InterviewMessageResponse(BaseModel):
@@ -248,10 +327,14 @@ class InterviewMessageResponse(BaseModel):
     session_id: str
     response: str
     audio_base64: Optional[str] = None  # If voice output
+    audio_format: Optional[AudioFormat] = None  # Format of audio_base64
     question: Optional[InterviewQuestion] = None
     feedback: Optional[Dict[str, Any]] = None
     session_complete: bool = False
     next_action: str = "continue"  # continue, feedback, complete
+    stage_timings_ms: Optional[Dict[str, float]] = None  # Per-stage spans of this turn
+    critical_path_ms: Optional[float] = None  # Longest chain of dependent stages
+    critical_path: Optional[List[str]] = None
 
 
 class InterviewFeedback(BaseModel):
@@ -363,10 +446,17 @@ __all__ = [
     "MatchWiseAnalysisData",
     "PersonalizedRAGRequest",
     "PersonalizedRAGResponse",
+    "PersonalizedRAGBatchRequest",
+    "PersonalizedRAGBuildStats",
+    "PersonalizedRAGBatchResponse",
     "PersonalizedQuestionRequest",
+    "FederatedQueryRequest",
+    "FederatedQuestion",
+    "FederatedQueryResponse",
     # Interview
     "InterviewConfig",
     "StartInterviewRequest",
+    "ReplanRequest",
     "InterviewSessionResponse",
     "InterviewMessageRequest",
     "InterviewMessageResponse",
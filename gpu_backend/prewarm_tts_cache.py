@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Pre-render interview audio into the TTS cache
+
+Synthesizes the fixed interview phrases and every pre-RAG question for
+each voice preset, with the same settings GPUInterviewService uses, into
+the disk tier of the TTS audio cache (MODEL_TTS_CACHE_DIR). Segments that
+are already cached are skipped, so the job can be re-run after the
+question bank grows.
+
+Usage:
+    python prewarm_tts_cache.py
+    python prewarm_tts_cache.py --presets professional_male neutral --category technical
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models.schemas import EmotionStyle, InterviewCategory, TTSRequest, VoicePreset
+
+
+def collect_texts(categories):
+    from services import get_prerag_service
+    from services.interview_service import (
+        FIRST_QUESTION_PREFIX,
+        NEXT_QUESTION_PREFIX,
+        CLOSING_MESSAGE,
+        FALLBACK_QUESTION
+    )
+
+    texts = [FIRST_QUESTION_PREFIX, NEXT_QUESTION_PREFIX, CLOSING_MESSAGE, FALLBACK_QUESTION]
+
+    prerag_service = get_prerag_service()
+    for category in categories:
+        questions = prerag_service.get_questions(category)
+        print(f"{category.value}: {len(questions)} questions")
+        texts.extend(question.question for question in questions)
+
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render the pre-RAG question bank into the TTS cache")
+    parser.add_argument("--presets", nargs="+", choices=[p.value for p in VoicePreset],
+                        help="Voice presets to render (default: all)")
+    parser.add_argument("--category", action="append", choices=[c.value for c in InterviewCategory],
+                        help="Only render these categories (repeatable, default: all)")
+    args = parser.parse_args()
+
+    from services.voice_service import VOICE_PRESETS, get_voice_service
+
+    presets = [VoicePreset(p) for p in args.presets] if args.presets else list(VOICE_PRESETS)
+    categories = [InterviewCategory(c) for c in args.category] if args.category else list(InterviewCategory)
+
+    texts = collect_texts(categories)
+    print(f"{len(texts)} segments x {len(presets)} presets")
+
+    voice_service = get_voice_service()
+    if voice_service.tts_cache is None:
+        print("❌ TTS cache is disabled (MODEL_TTS_CACHE_ENABLED=false)")
+        sys.exit(1)
+    if not voice_service.load_tts():
+        print("❌ TTS model not available")
+        sys.exit(1)
+
+    failed = 0
+    for preset in presets:
+        start = time.time()
+        counts = voice_service.prewarm_cache(
+            texts,
+            TTSRequest(text=preset.value, voice_preset=preset, emotion=EmotionStyle.NEUTRAL, speed=1.0)
+        )
+        failed += counts["failed"]
+        print(
+            f"{preset.value}: {counts['rendered']} rendered, {counts['cached']} already cached, "
+            f"{counts['failed']} failed in {time.time() - start:.1f}s"
+        )
+
+    stats = voice_service.tts_cache.get_stats()
+    print("=" * 60)
+    print(f"TTS cache: {stats['disk_entries']} segments, {stats['disk_bytes'] / 1e6:.1f}MB on disk")
+    print("=" * 60)
+    sys.exit(2 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Re-score a corpus of interview answers offline
+
+Reads one answer per JSONL line and scores the corpus in batches with
+AnswerScoringEngine, e.g. to re-score historical sessions after changing
+the lexicons or thresholds. Accepted line formats:
+
+    {"response": "...", "question": {...InterviewQuestion...}}   (session responses)
+    {"response": "...", "question_id": "...", "tags": ["..."]}
+
+If a line carries a previous "feedback" with an "overall_score", the
+change against it is reported.
+
+Usage:
+    python rescore_answers.py answers.jsonl
+    python rescore_answers.py answers.jsonl --batch-size 20000 --output rescored.jsonl
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.answer_scoring import STAR_COMPONENTS, LENGTH_FEEDBACK, get_answer_scoring_engine
+
+
+def parse_record(record: dict):
+    """(question_id, response, tags, previous score) of one corpus line"""
+    question = record.get("question") or {}
+    question_id = record.get("question_id") or question.get("id") or ""
+    tags = record.get("tags") or question.get("tags") or []
+    previous = (record.get("feedback") or {}).get("overall_score")
+    return question_id, record.get("response") or "", tags, previous
+
+
+def read_batches(path: str, batch_size: int):
+    batch = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                batch.append(parse_record(json.loads(line)))
+            except Exception as e:
+                print(f"⚠️  Skipping line {line_no}: {e}")
+                continue
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score interview answers from a JSONL corpus")
+    parser.add_argument("input", help="JSONL file with one answer per line")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Answers per scoring batch (default: 10000)")
+    parser.add_argument("--output", help="Write per-answer feedback as JSONL")
+    args = parser.parse_args()
+
+    engine = get_answer_scoring_engine()
+    out = open(args.output, "w", encoding="utf-8") if args.output else None
+
+    total = 0
+    scoring_seconds = 0.0
+    overall_sum = 0.0
+    star_hits = [0] * len(STAR_COMPONENTS)
+    bands = [0] * len(LENGTH_FEEDBACK)
+    deltas = []
+
+    try:
+        for batch in read_batches(args.input, args.batch_size):
+            question_ids, responses, tags, previous = zip(*batch)
+
+            start = time.perf_counter()
+            scores = engine.score_batch(responses, tags)
+            scoring_seconds += time.perf_counter() - start
+
+            total += len(batch)
+            overall_sum += float(scores.overall.sum())
+            for index, hits in enumerate(scores.star.sum(axis=0)):
+                star_hits[index] += int(hits)
+            for band in scores.length_bands:
+                bands[band] += 1
+            for row, old in enumerate(previous):
+                if old is not None:
+                    deltas.append(float(scores.overall[row]) - old)
+
+            if out:
+                for row, question_id in enumerate(question_ids):
+                    out.write(engine.feedback(scores, row, question_id).model_dump_json() + "\n")
+    finally:
+        if out:
+            out.close()
+
+    if not total:
+        print("❌ No answers found")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"Scored {total} answers in {scoring_seconds:.2f}s ({total / max(scoring_seconds, 1e-9):,.0f} answers/s)")
+    print(f"Mean overall score: {overall_sum / total:.1f}")
+    print("STAR coverage: " + ", ".join(
+        f"{component} {hits / total:.0%}" for component, hits in zip(STAR_COMPONENTS, star_hits)
+    ))
+    print("Length bands: " + ", ".join(
+        f"{feedback.split()[0].lower()} {count / total:.0%}" for feedback, count in zip(LENGTH_FEEDBACK, bands)
+    ))
+    if deltas:
+        print(
+            f"Change vs previous scores ({len(deltas)} answers): "
+            f"mean {statistics.mean(deltas):+.1f}, "
+            f"mean absolute {statistics.mean(abs(d) for d in deltas):.1f}, "
+            f"changed {sum(1 for d in deltas if abs(d) > 1e-9) / len(deltas):.0%}"
+        )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ SmartSuccess.AI GPU Backend - Interview Routes
 Interview session management endpoints
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, WebSocket
 from typing import Dict, Any, Optional
 import logging
 
@@ -13,9 +13,18 @@ from models.schemas import (
     InterviewMessageRequest,
     InterviewMessageResponse,
     SessionFeedback,
-    ErrorResponse
+    ReplanRequest,
+    ErrorResponse,
+    AudioFormat
 )
-from services import get_gpu_interview_service, GPUInterviewService
+from services import (
+    get_gpu_interview_service,
+    GPUInterviewService,
+    SessionConflictError,
+    InterviewChannel,
+    get_question_registry
+)
+from services.audio_io import supported_output_formats
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/interview", tags=["Interview"])
@@ -26,6 +35,15 @@ def get_service() -> GPUInterviewService:
     return get_gpu_interview_service()
 
 
+def check_audio_format(audio_format: Optional[AudioFormat]):
+    """Reject voice output formats this server cannot encode"""
+    if audio_format is not None and audio_format not in supported_output_formats():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Audio format not supported on this server: {audio_format.value}"
+        )
+
+
 @router.post("/start", response_model=InterviewSessionResponse)
 async def start_interview(
     request: StartInterviewRequest,
@@ -44,6 +62,8 @@ async def start_interview(
     Returns:
         InterviewSessionResponse with session_id and initial state
     """
+    check_audio_format(request.config.audio_format)
+    
     try:
         response = await service.start_interview(request)
         logger.info(f"Started interview session: {response.session_id} for user: {request.user_id}")
@@ -66,15 +86,20 @@ async def process_message(
     the next question and/or feedback.
     
     Args:
-        request: Message content including session_id and text/audio
+        request: Message content including session_id and text/audio,
+            optionally a new voice output format (audio_format)
         
     Returns:
         InterviewMessageResponse with response, question, and feedback
     """
+    check_audio_format(request.audio_format)
+    
     try:
         response = await service.process_message(request)
         return response
         
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -82,6 +107,25 @@ async def process_message(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.websocket("/ws/{session_id}")
+async def interview_websocket(
+    websocket: WebSocket,
+    session_id: str
+):
+    """
+    Full-duplex interview channel
+    
+    Send answer audio as binary frames and {"type": "answer"} to submit.
+    The transcript, next question, feedback and audio chunks are pushed
+    as soon as each is ready (see InterviewChannel for the protocol).
+    
+    Args:
+        session_id: Session created with POST /interview/start
+    """
+    channel = InterviewChannel(websocket, session_id, get_service())
+    await channel.run()
+
+
 @router.get("/session/{session_id}")
 async def get_session(
     session_id: str,
@@ -104,6 +148,40 @@ async def get_session(
     return session.to_dict()
 
 
+@router.post("/session/{session_id}/replan")
+async def replan_session(
+    session_id: str,
+    request: ReplanRequest,
+    service: GPUInterviewService = Depends(get_service)
+):
+    """
+    Re-plan the remaining questions of a session
+    
+    The question plan is computed when the interview starts; use this to
+    adapt it mid-session (e.g. raise difficulty or change categories).
+    
+    Args:
+        session_id: The session ID to re-plan
+        request: New difficulty and/or categories
+        
+    Returns:
+        Updated session information
+    """
+    try:
+        session = await service.replan_session(
+            session_id,
+            difficulty=request.difficulty,
+            categories=request.categories
+        )
+    except SessionConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    return session.to_dict()
+
+
 @router.post("/session/{session_id}/end", response_model=SessionFeedback)
 async def end_session(
     session_id: str,
@@ -141,5 +219,8 @@ async def get_interview_stats(
     """
     return {
         "active_sessions": service.get_active_sessions_count(),
-        "gpu_mode": service.gpu_mode
+        "gpu_mode": service.gpu_mode,
+        "lifecycle": service.lifecycle.get_stats(),
+        "prefetch": service.get_prefetch_stats(),
+        "question_registry": get_question_registry().get_stats()
     }
@@ -15,17 +15,24 @@ from models.schemas import (
     RAGQueryResponse,
     PersonalizedRAGRequest,
     PersonalizedRAGResponse,
+    PersonalizedRAGBatchRequest,
+    PersonalizedRAGBatchResponse,
     PersonalizedQuestionRequest,
+    FederatedQueryRequest,
+    FederatedQueryResponse,
     QuestionBankStats,
     EmbeddingRequest,
     EmbeddingResponse
 )
+from config import get_settings
 from services import (
     get_prerag_service, 
     get_matchwise_service,
     get_embedding_service,
+    get_federated_retrieval_service,
     PreRAGService,
     MatchWiseIntegrationService,
+    FederatedRetrievalService,
     EmbeddingService
 )
 
@@ -162,6 +169,44 @@ async def build_personalized_rag(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/personalized/build/batch", response_model=PersonalizedRAGBatchResponse)
+async def build_personalized_rags_batch(
+    request: PersonalizedRAGBatchRequest,
+    service: MatchWiseIntegrationService = Depends(get_matchwise_service)
+):
+    """
+    Build personalized RAGs for a cohort of users
+    
+    Accepts many PersonalizedRAGRequests at once (e.g. a bootcamp or career
+    center cohort). Question texts are embedded in large de-duplicated
+    batches across all users and the collections are written in bulk.
+    
+    Args:
+        request: List of per-user PersonalizedRAGRequests
+        
+    Returns:
+        PersonalizedRAGBatchResponse with per-user results and throughput
+    """
+    max_users = get_settings().MAX_RAG_BATCH_USERS
+    if len(request.requests) > max_users:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(request.requests)} users (max {max_users})"
+        )
+    
+    try:
+        response = await service.build_personalized_rags_batch(request.requests)
+        logger.info(
+            f"Batch-built {response.succeeded}/{response.total_users} personalized RAGs "
+            f"in {response.total_time_ms:.0f}ms"
+        )
+        return response
+        
+    except Exception as e:
+        logger.error(f"Failed to batch-build personalized RAGs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/personalized/question", response_model=InterviewQuestion)
 async def get_personalized_question(
     request: PersonalizedQuestionRequest,
@@ -247,7 +292,7 @@ async def delete_personalized_rag(
     Returns:
         Confirmation of deletion
     """
-    success = service.delete_user_rag(rag_id)
+    success = await service.delete_user_rag(rag_id)
     
     if not success:
         raise HTTPException(status_code=404, detail=f"RAG not found: {rag_id}")
@@ -255,6 +300,36 @@ async def delete_personalized_rag(
     return {"status": "success", "message": f"Deleted RAG: {rag_id}"}
 
 
+# ============================================================================
+# Federated Retrieval
+# ============================================================================
+
+@router.post("/federated/query", response_model=FederatedQueryResponse)
+async def federated_query(
+    request: FederatedQueryRequest,
+    service: FederatedRetrievalService = Depends(get_federated_retrieval_service)
+):
+    """
+    Query the personalized RAG and the general question bank together
+    
+    The query is embedded once and searched against the user's RAG (if
+    rag_id is given) and the selected pre-RAG categories concurrently.
+    Results are merged by source-weighted relevance score.
+    
+    Args:
+        request: Query text, optional rag_id, categories, and source weights
+        
+    Returns:
+        FederatedQueryResponse with merged results and their sources
+    """
+    try:
+        return await service.query(request)
+        
+    except Exception as e:
+        logger.error(f"Federated query failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ============================================================================
 # Embedding Service
 # ============================================================================
@@ -3,12 +3,12 @@ SmartSuccess.AI GPU Backend - Voice Routes
 ASR (Speech-to-Text) and TTS (Text-to-Speech) endpoints
 """
 
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends, Header, WebSocket
 from fastapi.responses import StreamingResponse
 from typing import Optional
 import logging
-import io
 import base64
+import uuid
 
 from models.schemas import (
     TranscriptionRequest,
@@ -16,9 +16,12 @@ from models.schemas import (
     TTSRequest,
     TTSResponse,
     VoicePreset,
-    EmotionStyle
+    EmotionStyle,
+    AudioFormat
 )
-from services import get_voice_service, VoiceService
+from services import get_voice_service, VoiceService, AudioDecodeError, TranscriptionChannel
+from services.audio_io import negotiate_audio_format, supported_output_formats
+from services.ws_channel import WS_CLOSE_TRY_AGAIN
 from config import is_gpu_available
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,18 @@ def get_service() -> VoiceService:
     return get_voice_service()
 
 
+def resolve_audio_format(requested: Optional[AudioFormat], accept: Optional[str]) -> AudioFormat:
+    """Explicitly requested output format, else the Accept header's, else WAV"""
+    if requested is None:
+        return negotiate_audio_format(accept)
+    if requested not in supported_output_formats():
+        raise HTTPException(
+            status_code=400,
+            detail=f"Audio format not supported on this server: {requested.value}"
+        )
+    return requested
+
+
 @router.post("/transcribe", response_model=TranscriptionResponse)
 async def transcribe_audio(
     audio: UploadFile = File(..., description="Audio file (WAV, MP3, etc.)"),
@@ -55,10 +70,10 @@ async def transcribe_audio(
     Returns:
         TranscriptionResponse with text and metadata
     """
-    if not is_gpu_available():
+    if not service.asr_available:
         raise HTTPException(
             status_code=503,
-            detail="GPU not available. Use Web Speech API for transcription."
+            detail="ASR not available. Use Web Speech API for transcription."
         )
     
     try:
@@ -79,6 +94,8 @@ async def transcribe_audio(
         logger.info(f"Transcribed {audio.filename}: {len(response.text)} chars")
         return response
         
+    except AudioDecodeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Transcription failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -108,10 +125,10 @@ async def transcribe_base64(
     Returns:
         TranscriptionResponse with text and metadata
     """
-    if not is_gpu_available():
+    if not service.asr_available:
         raise HTTPException(
             status_code=503,
-            detail="GPU not available. Use Web Speech API for transcription."
+            detail="ASR not available. Use Web Speech API for transcription."
         )
     
     try:
@@ -130,23 +147,49 @@ async def transcribe_base64(
         response = await service.transcribe(audio_data, request)
         return response
         
+    except AudioDecodeError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Transcription failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.websocket("/transcribe/stream")
+async def transcribe_stream(websocket: WebSocket):
+    """
+    Streaming transcription
+    
+    Send PCM s16le mono frames as they are recorded; partial and final
+    hypotheses are pushed back while the user is still speaking, and
+    {"type": "end"} returns the full text (see TranscriptionChannel for
+    the protocol).
+    """
+    service = get_voice_service()
+    if not service.asr_available:
+        await websocket.accept()
+        await websocket.close(code=WS_CLOSE_TRY_AGAIN, reason="ASR not available. Use Web Speech API for transcription.")
+        return
+    
+    channel = TranscriptionChannel(websocket, uuid.uuid4().hex[:12], service)
+    await channel.run()
+
+
 @router.post("/synthesize", response_model=TTSResponse)
 async def synthesize_speech(
     request: TTSRequest,
+    accept: Optional[str] = Header(default=None),
     service: VoiceService = Depends(get_service)
 ):
     """
     Synthesize speech using XTTS-v2
     
     Generate natural-sounding speech from text with voice presets.
+    The audio format is request.format, or else the first audio type of
+    the Accept header this server encodes (audio/ogg, audio/mpeg,
+    audio/L16, audio/wav), or else WAV.
     
     Args:
-        request: Text, voice preset, emotion, and speed settings
+        request: Text, voice preset, emotion, speed and format settings
         
     Returns:
         TTSResponse with base64-encoded audio
@@ -157,6 +200,8 @@ async def synthesize_speech(
             detail="GPU not available. Use Web Speech API for TTS."
         )
     
+    request.format = resolve_audio_format(request.format, accept)
+    
     try:
         response = await service.synthesize(request)
         logger.info(f"Synthesized {len(request.text)} chars -> {response.duration_seconds:.2f}s audio")
@@ -173,22 +218,29 @@ async def synthesize_stream(
     voice_preset: VoicePreset = Form(default=VoicePreset.PROFESSIONAL_MALE),
     emotion: EmotionStyle = Form(default=EmotionStyle.NEUTRAL),
     speed: float = Form(default=1.0),
+    format: Optional[AudioFormat] = Form(default=None),
+    accept: Optional[str] = Header(default=None),
     service: VoiceService = Depends(get_service)
 ):
     """
-    Synthesize speech and return as streaming audio
+    Synthesize speech and stream it sentence by sentence
     
-    Returns audio as a streaming response instead of base64.
-    Useful for direct audio playback.
+    Returns audio as a chunked streaming response instead of base64.
+    Playback can start after the first sentence is synthesized; later
+    sentences are synthesized while earlier ones are sent. The sentences
+    go through one StreamEncoder, so the response is a single continuous
+    stream in every format (a WAV header with open-ended sizes, one Ogg
+    Opus stream, or constant-bitrate MP3).
     
     Args:
         text: Text to synthesize
         voice_preset: Voice preset to use
         emotion: Emotion style
         speed: Speech speed (0.5 to 2.0)
+        format: Audio format (defaults to the Accept header's, else WAV)
         
     Returns:
-        Streaming audio response (WAV format)
+        Streaming audio response (WAV, raw 16-bit PCM, Ogg Opus or MP3)
     """
     if not is_gpu_available():
         raise HTTPException(
@@ -196,30 +248,44 @@ async def synthesize_stream(
             detail="GPU not available. Use Web Speech API for TTS."
         )
     
+    audio_format = resolve_audio_format(format, accept)
+    
     try:
         request = TTSRequest(
             text=text,
             voice_preset=voice_preset,
             emotion=emotion,
-            speed=speed
+            speed=speed,
+            format=audio_format
         )
         
-        response = await service.synthesize(request)
-        
-        # Decode base64 to bytes
-        audio_bytes = base64.b64decode(response.audio_base64)
-        
-        return StreamingResponse(
-            io.BytesIO(audio_bytes),
-            media_type="audio/wav",
-            headers={
-                "Content-Disposition": "attachment; filename=speech.wav"
-            }
-        )
+        # Synthesize the first sentence before answering, so failures
+        # still get a proper status code
+        chunks = service.stream_audio(request)
+        first = await chunks.__anext__()
         
     except Exception as e:
         logger.error(f"TTS streaming failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    async def body():
+        try:
+            yield first.data
+            async for chunk in chunks:
+                yield chunk.data
+        except Exception as e:
+            # Headers are already sent; the client sees a truncated stream
+            logger.error(f"TTS streaming failed mid-stream: {e}")
+        finally:
+            await chunks.aclose()
+    
+    return StreamingResponse(
+        body(),
+        media_type=first.media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename=speech.{first.extension}"
+        }
+    )
 
 
 @router.get("/presets")
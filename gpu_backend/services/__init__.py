@@ -2,9 +2,33 @@
 
 from .embedding_service import EmbeddingService, get_embedding_service
 from .prerag_service import PreRAGService, get_prerag_service
+from .extraction_engine import ExtractionEngine, get_extraction_engine
+from .chroma_writer import ChromaWriteBehindQueue
 from .matchwise_service import MatchWiseIntegrationService, get_matchwise_service
+from .federated_retrieval import FederatedRetrievalService, get_federated_retrieval_service
+from .tts_cache import TTSAudioCache
+from .speaker_latents import SpeakerLatentCache
+from .audio_io import AudioDecoder, AudioDecodeError, get_audio_decoder
+from .audio_enhancement import AudioEnhancer, create_audio_enhancer
+from .asr_engines import ASREngine, OpenAIWhisperEngine, FasterWhisperEngine, create_asr_engine
+from .asr_batcher import ASRBatcher
 from .voice_service import VoiceService, get_voice_service, get_voice_service_with_fallback
+from .session_store import (
+    SessionStore,
+    InMemorySessionStore,
+    SQLiteSessionStore,
+    RedisSessionStore,
+    SessionConflictError,
+    get_session_store
+)
+from .session_lifecycle import SessionLifecycleManager
+from .answer_scoring import AnswerScoringEngine, get_answer_scoring_engine
+from .feedback_aggregates import FeedbackAggregates
+from .question_registry import QuestionRegistry, get_question_registry
 from .interview_service import GPUInterviewService, get_gpu_interview_service
+from .ws_channel import WebSocketChannel
+from .interview_channel import InterviewChannel
+from .streaming_asr import StreamingTranscriber, TranscriptionChannel
 
 __all__ = [
     # Embedding
@@ -13,14 +37,51 @@ __all__ = [
     # Pre-RAG
     "PreRAGService", 
     "get_prerag_service",
+    # Extraction
+    "ExtractionEngine",
+    "get_extraction_engine",
     # MatchWise
+    "ChromaWriteBehindQueue",
     "MatchWiseIntegrationService",
     "get_matchwise_service",
+    # Federated retrieval
+    "FederatedRetrievalService",
+    "get_federated_retrieval_service",
     # Voice
+    "AudioDecoder",
+    "AudioDecodeError",
+    "get_audio_decoder",
+    "AudioEnhancer",
+    "create_audio_enhancer",
+    "ASREngine",
+    "OpenAIWhisperEngine",
+    "FasterWhisperEngine",
+    "create_asr_engine",
+    "ASRBatcher",
+    "TTSAudioCache",
+    "SpeakerLatentCache",
     "VoiceService",
     "get_voice_service",
     "get_voice_service_with_fallback",
+    "StreamingTranscriber",
+    "TranscriptionChannel",
+    # Session store
+    "SessionStore",
+    "InMemorySessionStore",
+    "SQLiteSessionStore",
+    "RedisSessionStore",
+    "SessionConflictError",
+    "get_session_store",
+    "SessionLifecycleManager",
+    # Answer scoring
+    "AnswerScoringEngine",
+    "get_answer_scoring_engine",
+    "FeedbackAggregates",
     # Interview
+    "QuestionRegistry",
+    "get_question_registry",
     "GPUInterviewService",
-    "get_gpu_interview_service"
+    "get_gpu_interview_service",
+    "WebSocketChannel",
+    "InterviewChannel"
 ]
@@ -0,0 +1,256 @@
+"""
+SmartSuccess.AI GPU Backend - Answer Scoring Engine
+Batch heuristic scoring of interview answers (length, STAR, keywords)
+"""
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.schemas import InterviewFeedback, InterviewQuestion
+
+
+# STAR component lexicons. Phrases match whole words only, so "at" no
+# longer matches inside "that"; inflections that the substring scan used
+# to catch implicitly are listed explicitly.
+STAR_LEXICON: Dict[str, List[str]] = {
+    "situation": ["when", "while", "during", "at"],
+    "task": ["needed", "required", "had to", "goal", "goals"],
+    "action": ["i did", "i made", "i created", "i developed"],
+    "result": ["result", "results", "resulted", "outcome", "outcomes", "achieved", "improved"],
+}
+STAR_COMPONENTS: Tuple[str, ...] = tuple(STAR_LEXICON)
+STAR_HIT_SCORE = 80
+STAR_EXPLICIT_THRESHOLD = 60  # Average STAR score below which the method is flagged
+
+# Response length bands: answers with fewer than LENGTH_LIMITS[i] words get
+# LENGTH_SCORES[i]; longer answers get the last score
+LENGTH_LIMITS = (20, 50, 150)
+LENGTH_SCORES = np.array([50.0, 70.0, 85.0, 90.0])
+LENGTH_FEEDBACK = (
+    "Consider providing more detail in your response.",
+    "Good level of detail.",
+    "Great comprehensive response.",
+    "Excellent thorough response.",
+)
+
+# Question tags that file the question (its source, category or bank
+# section) rather than name a skill; never reported as keywords
+QUESTION_LABEL_TAGS = frozenset({
+    "general", "behavioral", "technical", "strength", "gap", "growth",
+    "matched_skill", "contribution", "introduction", "career", "project",
+    "preparation", "motivation", "challenges", "fundamentals", "theory"
+})
+
+# Words inside a phrase may be separated by whitespace, "_" or "-"
+_PHRASE_SEPARATOR = re.compile(r"[\s_\-]+")
+
+# Letters and digits, plus "+" and "#" so "c++" and "c#" stay words; any
+# other character separates words ("node.js" is "node js", "ml_systems"
+# is "ml systems"). The ASCII table lower-cases in the same pass.
+_ASCII_WORD_TABLE = bytes(
+    ord(chr(code).lower()) if chr(code).isalnum() or chr(code) in "+#" or code >= 128 else ord(" ")
+    for code in range(256)
+)
+_SEPARATORS = re.compile(r"[^\w+#]|_")
+
+
+def normalize_phrase(phrase: str) -> str:
+    """Lower-case a phrase and join its words with single spaces"""
+    return " ".join(_PHRASE_SEPARATOR.split(phrase.lower())).strip()
+
+
+def word_text(text: str) -> str:
+    """A text lower-cased, with every word separator a space, padded with spaces"""
+    if text.isascii():
+        return f" {text.encode('ascii').translate(_ASCII_WORD_TABLE).decode('ascii')} "
+    return f" {_SEPARATORS.sub(' ', text.lower())} "
+
+
+@lru_cache(maxsize=4096)
+def phrase_key(phrase: str) -> Optional[str]:
+    """
+    The substring of word_text() output in which phrase occurs as whole words
+
+    A phrase occurs in a text when its key is in the text's word_text().
+    Its words must be one separator apart in the text, so "ml systems",
+    "ml-systems" and "ml_systems" all match the tag "ml_systems". None for
+    a phrase with no words.
+    """
+    key = word_text(normalize_phrase(phrase))
+    return key if key.strip() else None
+
+
+class AnswerScores(NamedTuple):
+    """Scores of a batch of answers (one row per answer)"""
+    word_counts: np.ndarray  # (n,) int
+    length_bands: np.ndarray  # (n,) index into LENGTH_SCORES / LENGTH_FEEDBACK
+    length_scores: np.ndarray  # (n,) float
+    star: np.ndarray  # (n, 4) bool, columns in STAR_COMPONENTS order
+    star_avg: np.ndarray  # (n,) float
+    has_metrics: np.ndarray  # (n,) bool, answer contains a "%"
+    overall: np.ndarray  # (n,) float
+    keywords_used: List[List[str]]
+    keywords_missing: List[List[str]]
+
+
+class AnswerScoringEngine:
+    """
+    Heuristic answer scorer for interview feedback
+
+    Scores are the mean of a length score (by word-count band) and the
+    average STAR score (STAR_HIT_SCORE per component mentioned). Skill
+    tags of the question are its keywords (QUESTION_LABEL_TAGS are not):
+    a keyword counts as used when it occurs as whole words in the answer.
+
+    Each answer is mapped once to word_text(), where every STAR phrase
+    and keyword is one substring test (phrase_key) run by str's own
+    search; a component's remaining phrases are skipped once one is
+    found. The length, STAR and overall scores are computed as arrays
+    over the batch; score() skips the arrays for a single answer.
+    """
+
+    def __init__(self, star_lexicon: Optional[Dict[str, List[str]]] = None):
+        self.star_lexicon = star_lexicon or STAR_LEXICON
+        self._star_keys: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(filter(None, map(phrase_key, self.star_lexicon[component])))
+            for component in STAR_COMPONENTS
+        )
+
+    def _scan(self, answer: str, answer_tags: Sequence[str]) -> Tuple[int, bool, List[bool], List[str], List[str]]:
+        """Word count, "%" present, STAR hits and used/missing keywords of one answer"""
+        words = word_text(answer)
+        star = []
+        for keys in self._star_keys:
+            for key in keys:
+                if key in words:
+                    star.append(True)
+                    break
+            else:
+                star.append(False)
+
+        used, missing = [], []
+        for tag in answer_tags:
+            if tag in QUESTION_LABEL_TAGS:
+                continue
+            key = phrase_key(tag)
+            if key is not None:
+                (used if key in words else missing).append(tag)
+        return len(answer.split()), "%" in answer, star, used, missing
+
+    def score_batch(
+        self,
+        answers: Sequence[str],
+        tags: Optional[Sequence[Sequence[str]]] = None
+    ) -> AnswerScores:
+        """
+        Score a batch of answers
+
+        Args:
+            answers: Answer texts
+            tags: Tags of each answer's question (optional)
+
+        Returns:
+            AnswerScores with one row per answer
+        """
+        n = len(answers)
+        if tags is None:
+            tags = [()] * n
+
+        word_counts: List[int] = []
+        has_metrics: List[bool] = []
+        star: List[bool] = []  # flattened (n, 4)
+        keywords_used: List[List[str]] = []
+        keywords_missing: List[List[str]] = []
+        for answer, answer_tags in zip(answers, tags):
+            word_count, metrics, star_row, used, missing = self._scan(answer, answer_tags or ())
+            word_counts.append(word_count)
+            has_metrics.append(metrics)
+            star.extend(star_row)
+            keywords_used.append(used)
+            keywords_missing.append(missing)
+
+        star_matrix = np.array(star, dtype=bool).reshape(n, len(STAR_COMPONENTS))
+        word_count_array = np.array(word_counts, dtype=np.int64)
+
+        length_bands = np.searchsorted(LENGTH_LIMITS, word_count_array, side="right")
+        length_scores = LENGTH_SCORES[length_bands]
+        star_avg = star_matrix.sum(axis=1) * STAR_HIT_SCORE / len(STAR_COMPONENTS)
+        overall = (length_scores + star_avg) / 2
+
+        return AnswerScores(
+            word_counts=word_count_array,
+            length_bands=length_bands,
+            length_scores=length_scores,
+            star=star_matrix,
+            star_avg=star_avg,
+            has_metrics=np.array(has_metrics, dtype=bool),
+            overall=overall,
+            keywords_used=keywords_used,
+            keywords_missing=keywords_missing
+        )
+
+    def feedback(self, scores: AnswerScores, row: int, question_id: str) -> InterviewFeedback:
+        """Build the InterviewFeedback of one scored answer"""
+        return self._feedback(
+            question_id,
+            int(scores.length_bands[row]),
+            scores.star[row].tolist(),
+            bool(scores.has_metrics[row]),
+            scores.keywords_used[row],
+            scores.keywords_missing[row]
+        )
+
+    def _feedback(
+        self,
+        question_id: str,
+        length_band: int,
+        star: List[bool],
+        has_metrics: bool,
+        keywords_used: List[str],
+        keywords_missing: List[str]
+    ) -> InterviewFeedback:
+        """Build an InterviewFeedback from one answer's length band and STAR hits"""
+        star_avg = sum(star) * STAR_HIT_SCORE / len(STAR_COMPONENTS)
+
+        return InterviewFeedback(
+            question_id=question_id,
+            overall_score=(float(LENGTH_SCORES[length_band]) + star_avg) / 2,
+            strengths=[
+                LENGTH_FEEDBACK[length_band],
+                "Shows understanding of the question"
+            ],
+            growth_areas=[
+                "Consider using the STAR method more explicitly" if star_avg < STAR_EXPLICIT_THRESHOLD else "Good use of STAR method",
+                "Include specific metrics or outcomes" if not has_metrics else "Good use of metrics"
+            ],
+            star_analysis={
+                component: STAR_HIT_SCORE if hit else 0
+                for component, hit in zip(STAR_COMPONENTS, star)
+            },
+            suggestions=[
+                "Try to quantify your achievements",
+                "Include the impact of your actions"
+            ],
+            keywords_used=keywords_used,
+            keywords_missing=keywords_missing
+        )
+
+    def score(self, question: InterviewQuestion, response: str) -> InterviewFeedback:
+        """Score a single answer (scalar path: no arrays for one row)"""
+        word_count, has_metrics, star, used, missing = self._scan(response, question.tags or ())
+        return self._feedback(question.id, bisect_right(LENGTH_LIMITS, word_count), star, has_metrics, used, missing)
+
+
+# Singleton accessor
+_engine: Optional[AnswerScoringEngine] = None
+
+def get_answer_scoring_engine() -> AnswerScoringEngine:
+    """Get the answer scoring engine singleton"""
+    global _engine
+    if _engine is None:
+        _engine = AnswerScoringEngine()
+    return _engine
@@ -0,0 +1,165 @@
+"""
+SmartSuccess.AI GPU Backend - ASR Batcher
+Decodes Whisper windows from concurrent transcription requests together
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.schemas import TranscriptionRequest
+from services.asr_engines import (
+    ASREngine,
+    WHISPER_WINDOW_SECONDS,
+    chunk_result,
+    long_form_chunks
+)
+from services.audio_io import ASR_SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingChunk:
+    __slots__ = ("audio", "request", "future")
+
+    def __init__(self, audio: np.ndarray, request: TranscriptionRequest, future: asyncio.Future):
+        self.audio = audio
+        self.request = request
+        self.future = future
+
+    @property
+    def key(self) -> Tuple[Optional[str], str, Optional[str]]:
+        # Decoding options are shared by the whole batch
+        return (self.request.language, self.request.task, self.request.initial_prompt)
+
+
+class ASRBatcher:
+    """
+    Scheduler that batches Whisper windows across requests
+
+    Each request is split into windows of at most 30 s (pause-aligned
+    chunks for long answers) and queued. A single scheduler task waits
+    window_ms after the first pending chunk for others to arrive, then
+    takes the model lock and decodes up to max_batch chunks with one
+    log-mel stack and one batched encoder/decoder pass per set of
+    decoding options. Chunks queued while a batch runs go into the next
+    one, so under load batches fill without waiting. Results are routed
+    back to each awaiting request.
+
+    Only used for requests without word timestamps on engines that
+    implement decode_batch; the rest go through ASREngine.transcribe.
+    """
+
+    def __init__(
+        self,
+        engine: ASREngine,
+        lock: asyncio.Lock,
+        max_batch: int = 8,
+        window_ms: int = 10
+    ):
+        self.engine = engine
+        self.lock = lock
+        self.max_batch = max(1, max_batch)
+        self.window = window_ms / 1000
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self._batches = 0
+        self._chunks = 0
+        self._largest = 0
+
+    async def transcribe(self, audio: np.ndarray, request: TranscriptionRequest) -> Dict[str, Any]:
+        """
+        Transcribe 16 kHz samples through the shared batches
+
+        Returns:
+            A whisper.transcribe()-shaped result with one segment per
+            window, plus "duration"
+        """
+        duration = len(audio) / ASR_SAMPLE_RATE
+        if duration <= WHISPER_WINDOW_SECONDS:
+            spans = [(0, len(audio))]
+        elif self.engine.model_config.WHISPER_LONG_FORM:
+            spans = long_form_chunks(audio, self.engine.model_config)
+        else:
+            spans = [(0, WHISPER_WINDOW_SECONDS * ASR_SAMPLE_RATE)]
+            duration = WHISPER_WINDOW_SECONDS
+
+        futures = [self._submit(audio[start:end], request) for start, end in spans]
+        try:
+            decoded = await asyncio.gather(*futures)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+        result = chunk_result(spans, decoded, request.language)
+        result["duration"] = duration
+        return result
+
+    def _submit(self, chunk: np.ndarray, request: TranscriptionRequest) -> asyncio.Future:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_PendingChunk(chunk, request, future))
+        return future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            async with self.lock:
+                # Chunks that arrived while another request held the model
+                while len(batch) < self.max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+                await self._decode(batch)
+
+    async def _decode(self, batch: List[_PendingChunk]):
+        groups: Dict[Tuple, List[_PendingChunk]] = {}
+        for item in batch:
+            # The request may have gone away while queued
+            if not item.future.done():
+                groups.setdefault(item.key, []).append(item)
+
+        for items in groups.values():
+            self._batches += 1
+            self._chunks += len(items)
+            self._largest = max(self._largest, len(items))
+            try:
+                decoded = await asyncio.to_thread(
+                    self.engine.decode_batch, [item.audio for item in items], items[0].request
+                )
+            except Exception as e:
+                logger.error(f"Batched transcription failed ({len(items)} chunks): {e}")
+                for item in items:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                continue
+
+            for item, segment in zip(items, decoded):
+                if not item.future.done():
+                    item.future.set_result(segment)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self._batches,
+            "chunks": self._chunks,
+            "mean_batch_size": round(self._chunks / self._batches, 2) if self._batches else 0.0,
+            "max_batch_size": self._largest,
+            "queued": self._queue.qsize() if self._queue is not None else 0
+        }
@@ -0,0 +1,533 @@
+"""
+SmartSuccess.AI GPU Backend - ASR Engines
+Whisper inference backends (openai-whisper on GPU, CTranslate2 int8 on CPU)
+"""
+
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    import whisper
+    WHISPER_AVAILABLE = True
+except ImportError:
+    whisper = None
+    WHISPER_AVAILABLE = False
+    logging.warning("Whisper not available - GPU transcription will use faster-whisper if installed")
+
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    WhisperModel = None
+    FASTER_WHISPER_AVAILABLE = False
+
+try:
+    # faster-whisper >= 1.1
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+from config import ModelConfig
+from models.schemas import TranscriptionRequest
+from services.audio_io import ASR_SAMPLE_RATE
+from services.audio_segmentation import speech_chunks
+
+logger = logging.getLogger(__name__)
+
+
+WHISPER_WINDOW_SECONDS = 30  # Audio Whisper sees per decoding pass
+
+# CPU model size by available cores: (min cores, min memory GB, size).
+# Sizes keep int8 decoding of a one-minute answer within a few seconds.
+CPU_MODEL_TIERS = [
+    (16, 8, "medium"),
+    (8, 4, "small"),
+    (4, 2, "base"),
+    (0, 0, "tiny"),
+]
+
+
+def cpu_cores() -> int:
+    """Cores this process may run on"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def memory_gb() -> float:
+    """Physical memory in GB (0 if unknown)"""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 1024 ** 3
+    except (AttributeError, ValueError, OSError):
+        return 0.0
+
+
+def cpu_model_size(cores: Optional[int] = None, memory: Optional[float] = None) -> str:
+    """Largest Whisper size this CPU host can serve interactively"""
+    cores = cpu_cores() if cores is None else cores
+    memory = memory_gb() if memory is None else memory
+    for min_cores, min_memory, size in CPU_MODEL_TIERS:
+        # Unknown memory does not rule a tier out
+        if cores >= min_cores and (memory == 0 or memory >= min_memory):
+            return size
+    return CPU_MODEL_TIERS[-1][2]
+
+
+def long_form_chunks(audio: np.ndarray, model_config: ModelConfig) -> List[Tuple[int, int]]:
+    """Pause-aligned spans of at most one Whisper window (see speech_chunks)"""
+    return speech_chunks(
+        audio,
+        ASR_SAMPLE_RATE,
+        max_seconds=WHISPER_WINDOW_SECONDS,
+        min_silence_ms=model_config.VAD_MIN_SILENCE_MS,
+        threshold_db=model_config.VAD_THRESHOLD_DB
+    )
+
+
+def chunk_result(
+    spans: List[Tuple[int, int]],
+    decoded: List[Optional[Dict[str, Any]]],
+    language: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Assemble a whisper.transcribe()-shaped result from decoded chunks
+
+    Args:
+        spans: (start, end) sample offsets of each chunk in the recording
+        decoded: decode_batch output for each chunk
+        language: Requested language (None to take the detected one)
+    """
+    segments = []
+    for (start, end), segment in zip(spans, decoded):
+        if segment is None:
+            continue
+        language = language or segment["language"]
+        segments.append({
+            "id": len(segments),
+            "start": start / ASR_SAMPLE_RATE,
+            "end": end / ASR_SAMPLE_RATE,
+            "text": segment["text"],
+            "avg_logprob": segment["avg_logprob"],
+            "no_speech_prob": segment["no_speech_prob"],
+            "compression_ratio": segment["compression_ratio"]
+        })
+
+    return {
+        "text": "".join(segment["text"] for segment in segments),
+        "segments": segments,
+        "language": language
+    }
+
+
+class ASREngine(ABC):
+    """
+    Base class for Whisper inference backends
+
+    Engines load lazily and return whisper.transcribe()-shaped results
+    ({"text", "segments", "language"}) plus "duration", the seconds of
+    audio the text covers. Callers serialize access; an engine serves one
+    request at a time. Subclasses implement _load_model and transcribe;
+    decode_batch is optional and only called when batch_decoding is set.
+    """
+
+    name = "asr"
+    batch_decoding = False  # Implements decode_batch
+
+    def __init__(self, model_size: str, device: str, model_config: ModelConfig):
+        self.model_size = model_size
+        self.device = device
+        self.model_config = model_config
+        self.model: Optional[Any] = None
+
+    def load(self) -> bool:
+        """Load the model if needed; False when it cannot be loaded"""
+        if self.model is not None:
+            return True
+
+        try:
+            logger.info(f"Loading Whisper model: {self.model_size} ({self.name} on {self.device})")
+            start_time = time.time()
+            self.model = self._load_model()
+            logger.info(f"Whisper model loaded in {time.time() - start_time:.2f}s")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to load Whisper model: {e}")
+            return False
+
+    def unload(self):
+        self.model = None
+
+    @abstractmethod
+    def _load_model(self) -> Any:
+        """Load and return the backend model"""
+
+    @abstractmethod
+    def transcribe(self, audio: np.ndarray, request: TranscriptionRequest) -> Dict[str, Any]:
+        """Transcribe 16 kHz mono float32 samples (model must be loaded)"""
+
+    def decode_batch(
+        self,
+        chunks: List[np.ndarray],
+        request: TranscriptionRequest
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Decode up to 30 s chunks together, without timestamps
+
+        Returns:
+            Per chunk, a segment dict without start/end ({"text",
+            "avg_logprob", "no_speech_prob", "compression_ratio",
+            "language"}), or None for chunks without speech
+        """
+        raise NotImplementedError(f"{self.name} does not decode batches (batch_decoding is False)")
+
+    def get_info(self) -> Dict[str, Any]:
+        return {
+            "engine": self.name,
+            "model": self.model_size,
+            "device": self.device,
+            "loaded": self.model is not None
+        }
+
+
+class OpenAIWhisperEngine(ASREngine):
+    """
+    Reference openai-whisper (PyTorch) backend, fp16 on GPU
+
+    Answers over 30 s are cut at pauses and decoded in batches (see
+    _transcribe_long) unless WHISPER_LONG_FORM is off, in which case
+    only the first window is transcribed.
+    """
+
+    name = "openai-whisper"
+    batch_decoding = True
+
+    def _load_model(self) -> Any:
+        model = whisper.load_model(self.model_size, device=self.device)
+        # Optimize for inference
+        if self.device.startswith("cuda"):
+            model = model.half()
+        return model
+
+    @property
+    def fp16(self) -> bool:
+        return self.device.startswith("cuda")
+
+    def transcribe(self, audio: np.ndarray, request: TranscriptionRequest) -> Dict[str, Any]:
+        duration = len(audio) / ASR_SAMPLE_RATE
+
+        if duration > WHISPER_WINDOW_SECONDS and self.model_config.WHISPER_LONG_FORM:
+            result = self._transcribe_long(audio, request)
+        else:
+            result = self.model.transcribe(
+                whisper.pad_or_trim(audio),
+                language=request.language,
+                task=request.task,
+                fp16=self.fp16,
+                verbose=False,
+                word_timestamps=request.word_timestamps,
+                initial_prompt=request.initial_prompt
+            )
+            duration = min(duration, WHISPER_WINDOW_SECONDS)
+
+        result["duration"] = duration
+        return result
+
+    def _transcribe_long(self, audio: np.ndarray, request: TranscriptionRequest) -> Dict[str, Any]:
+        """
+        Transcribe audio longer than Whisper's 30 s window
+
+        The audio is cut at pauses into chunks of at most 30 s (energy
+        VAD; only digital silence is skipped) and the chunks are decoded
+        WHISPER_BATCH_SIZE at a time. Chunks are views into the decoded
+        audio and only one batch of mel spectrograms exists at a time, so
+        memory stays flat for long recordings.
+
+        Returns:
+            A whisper.transcribe()-shaped result with one segment per chunk
+            (timestamps offset to the full recording)
+        """
+        chunks = long_form_chunks(audio, self.model_config)
+
+        if request.word_timestamps:
+            # Word alignment needs the full transcribe() pass per chunk
+            return self._transcribe_chunks_sequential(audio, chunks, request)
+
+        batch_size = max(1, self.model_config.WHISPER_BATCH_SIZE)
+        decoded = []
+        for i in range(0, len(chunks), batch_size):
+            decoded.extend(self.decode_batch(
+                [audio[start:end] for start, end in chunks[i:i + batch_size]], request
+            ))
+        return chunk_result(chunks, decoded, request.language)
+
+    def decode_batch(
+        self,
+        chunks: List[np.ndarray],
+        request: TranscriptionRequest
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        One batched encoder/decoder pass over a stack of log-mel windows
+
+        Greedy decoding without timestamps; chunks that fail Whisper's
+        quality thresholds (repetition loops, very low log-probability)
+        are retried one at a time through transcribe(), which falls back
+        to higher temperatures.
+        """
+        if not chunks:
+            return []
+
+        options = whisper.DecodingOptions(
+            language=request.language,
+            task=request.task,
+            fp16=self.fp16,
+            prompt=request.initial_prompt,
+            without_timestamps=True
+        )
+        n_mels = self.model.dims.n_mels
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(chunk), n_mels=n_mels)
+            for chunk in chunks
+        ]).to(self.model.device)
+        results = self.model.decode(mel, options)
+        del mel
+
+        decoded = []
+        for chunk, result in zip(chunks, results):
+            # Whisper's own no-speech rule
+            if result.no_speech_prob > 0.6 and result.avg_logprob < -1.0:
+                decoded.append(None)
+                continue
+            segment = {
+                "text": result.text.strip(),
+                "avg_logprob": result.avg_logprob,
+                "no_speech_prob": result.no_speech_prob,
+                "compression_ratio": result.compression_ratio,
+                "language": result.language
+            }
+            if result.compression_ratio > 2.4 or result.avg_logprob < -1.0:
+                segment = self._decode_with_fallback(chunk, request, segment)
+            if not segment["text"]:
+                decoded.append(None)
+                continue
+            segment["text"] = " " + segment["text"]
+            decoded.append(segment)
+        return decoded
+
+    def _decode_with_fallback(
+        self,
+        chunk: np.ndarray,
+        request: TranscriptionRequest,
+        greedy: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        result = self.model.transcribe(
+            chunk,
+            language=request.language,
+            task=request.task,
+            fp16=self.fp16,
+            verbose=False,
+            initial_prompt=request.initial_prompt,
+            condition_on_previous_text=False
+        )
+        segments = result.get("segments")
+        if not segments:
+            return greedy
+        return {
+            "text": result["text"].strip(),
+            "avg_logprob": float(np.mean([s["avg_logprob"] for s in segments])),
+            "no_speech_prob": max(s["no_speech_prob"] for s in segments),
+            "compression_ratio": max(s["compression_ratio"] for s in segments),
+            "language": result.get("language", greedy["language"])
+        }
+
+    def _transcribe_chunks_sequential(
+        self,
+        audio: np.ndarray,
+        chunks: List[Tuple[int, int]],
+        request: TranscriptionRequest
+    ) -> Dict[str, Any]:
+        """Long-form transcription with word timestamps, one chunk at a time"""
+        segments = []
+        language = request.language
+        for start, end in chunks:
+            offset = start / ASR_SAMPLE_RATE
+            result = self.model.transcribe(
+                audio[start:end],
+                language=request.language,
+                task=request.task,
+                fp16=self.fp16,
+                verbose=False,
+                word_timestamps=True,
+                initial_prompt=request.initial_prompt
+            )
+            language = language or result.get("language")
+            for segment in result.get("segments", []):
+                segment["id"] = len(segments)
+                segment["start"] += offset
+                segment["end"] += offset
+                for word in segment.get("words", []):
+                    word["start"] += offset
+                    word["end"] += offset
+                segments.append(segment)
+
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": language
+        }
+
+
+class FasterWhisperEngine(ASREngine):
+    """
+    faster-whisper (CTranslate2) backend
+
+    Honours WHISPER_COMPUTE_TYPE on GPU (WHISPER_CPU_COMPUTE_TYPE, int8 by
+    default, on CPU), WHISPER_BEAM_SIZE and WHISPER_VAD_FILTER. Long
+    audio is handled natively; with faster-whisper >= 1.1 answers over
+    30 s are decoded WHISPER_BATCH_SIZE VAD chunks at a time.
+    """
+
+    name = "faster-whisper"
+
+    def __init__(self, model_size: str, device: str, model_config: ModelConfig):
+        super().__init__(model_size, device, model_config)
+        self.on_gpu = device.startswith("cuda")
+        self.compute_type = (
+            model_config.WHISPER_COMPUTE_TYPE if self.on_gpu
+            else model_config.WHISPER_CPU_COMPUTE_TYPE
+        )
+        self.cpu_threads = model_config.WHISPER_CPU_THREADS or cpu_cores()
+        self._batched: Optional[Any] = None
+
+    def _load_model(self) -> Any:
+        device_index = 0
+        if self.on_gpu and ":" in self.device:
+            device_index = int(self.device.split(":", 1)[1])
+        model = WhisperModel(
+            self.model_size,
+            device="cuda" if self.on_gpu else "cpu",
+            device_index=device_index,
+            compute_type=self.compute_type,
+            cpu_threads=0 if self.on_gpu else self.cpu_threads
+        )
+        if BatchedInferencePipeline is not None and self.model_config.WHISPER_LONG_FORM:
+            self._batched = BatchedInferencePipeline(model=model)
+        return model
+
+    def unload(self):
+        self._batched = None
+        super().unload()
+
+    def transcribe(self, audio: np.ndarray, request: TranscriptionRequest) -> Dict[str, Any]:
+        duration = len(audio) / ASR_SAMPLE_RATE
+        options = dict(
+            language=request.language,
+            task=request.task,
+            beam_size=self.model_config.WHISPER_BEAM_SIZE,
+            word_timestamps=request.word_timestamps,
+            initial_prompt=request.initial_prompt,
+            vad_filter=self.model_config.WHISPER_VAD_FILTER,
+        )
+        if self.model_config.WHISPER_VAD_FILTER:
+            options["vad_parameters"] = {"min_silence_duration_ms": self.model_config.VAD_MIN_SILENCE_MS}
+
+        if self._batched is not None and duration > WHISPER_WINDOW_SECONDS:
+            segments, info = self._batched.transcribe(
+                audio, batch_size=max(1, self.model_config.WHISPER_BATCH_SIZE), **options
+            )
+        else:
+            segments, info = self.model.transcribe(audio, **options)
+
+        # Segments are decoded lazily while iterating
+        converted = [self._segment_dict(i, segment) for i, segment in enumerate(segments)]
+        return {
+            "text": "".join(segment["text"] for segment in converted),
+            "segments": converted,
+            "language": info.language or request.language,
+            "duration": duration
+        }
+
+    @staticmethod
+    def _segment_dict(index: int, segment: Any) -> Dict[str, Any]:
+        result = {
+            "id": index,
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text,
+            "avg_logprob": segment.avg_logprob,
+            "no_speech_prob": segment.no_speech_prob,
+            "compression_ratio": segment.compression_ratio
+        }
+        if segment.words:
+            result["words"] = [
+                {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+                for w in segment.words
+            ]
+        return result
+
+    def get_info(self) -> Dict[str, Any]:
+        info = super().get_info()
+        info.update({
+            "compute_type": self.compute_type,
+            "beam_size": self.model_config.WHISPER_BEAM_SIZE,
+            "vad_filter": self.model_config.WHISPER_VAD_FILTER,
+            "cpu_threads": None if self.on_gpu else self.cpu_threads,
+            "batched": BatchedInferencePipeline is not None
+        })
+        return info
+
+
+ENGINES = {
+    OpenAIWhisperEngine.name: (OpenAIWhisperEngine, lambda: WHISPER_AVAILABLE),
+    FasterWhisperEngine.name: (FasterWhisperEngine, lambda: FASTER_WHISPER_AVAILABLE),
+}
+
+
+def create_asr_engine(model_config: ModelConfig, device: str) -> Optional[ASREngine]:
+    """
+    Pick the ASR engine and model size for this host
+
+    WHISPER_ENGINE "auto" keeps openai-whisper on GPU (faster-whisper if
+    it is the only one installed) and uses faster-whisper on CPU, where
+    the PyTorch model is too slow to serve. CPU hosts get
+    WHISPER_CPU_MODEL_SIZE, or with "auto" the largest size their cores
+    and memory can run interactively (see CPU_MODEL_TIERS).
+
+    Returns:
+        The engine, or None when no suitable backend is installed
+    """
+    on_gpu = device.startswith("cuda")
+    choice = model_config.WHISPER_ENGINE
+
+    if choice == "auto":
+        preference = [OpenAIWhisperEngine.name, FasterWhisperEngine.name] if on_gpu else [FasterWhisperEngine.name]
+    elif choice in ENGINES:
+        preference = [choice]
+    else:
+        logger.error(f"Unknown WHISPER_ENGINE: {choice}")
+        return None
+
+    for name in preference:
+        engine_cls, available = ENGINES[name]
+        if not available():
+            continue
+        if on_gpu:
+            model_size = model_config.WHISPER_MODEL_SIZE
+        elif model_config.WHISPER_CPU_MODEL_SIZE == "auto":
+            model_size = cpu_model_size()
+        else:
+            model_size = model_config.WHISPER_CPU_MODEL_SIZE
+        return engine_cls(model_size, device, model_config)
+
+    logger.warning(f"No ASR engine available for {device} (WHISPER_ENGINE={choice})")
+    return None
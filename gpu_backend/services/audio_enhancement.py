@@ -0,0 +1,303 @@
+"""
+SmartSuccess.AI GPU Backend - Audio Enhancement
+Configurable post-processing of synthesized speech, cheapest stages first
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import numpy as np
+
+from config import ModelConfig
+from services.audio_segmentation import ABSOLUTE_FLOOR_DB, frame_energy_db
+
+try:
+    import noisereduce as nr
+    NOISEREDUCE_AVAILABLE = True
+except ImportError:
+    nr = None
+    NOISEREDUCE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+FRAME_MS = 20  # Analysis frame length
+SPEECH_THRESHOLD_DB = 12.0  # Speech = frames this far above the noise floor
+
+
+class AudioLevels:
+    """
+    Levels of an utterance, measured once per stage that changed it
+
+    Frame energies over FRAME_MS frames: the noise floor is their 10th
+    percentile, the speech level the mean power of frames
+    SPEECH_THRESHOLD_DB above it, and snr_db the gap between the two.
+    """
+
+    __slots__ = ("frame", "frame_db", "peak_db", "noise_db", "speech_db", "snr_db")
+
+    def __init__(self, audio: np.ndarray, sample_rate: int):
+        self.frame = max(1, sample_rate * FRAME_MS // 1000)
+        self.frame_db = frame_energy_db(audio, self.frame)
+        peak = float(np.max(np.abs(audio))) if len(audio) else 0.0
+        self.peak_db = 20.0 * np.log10(peak + 1e-12)
+
+        if not len(self.frame_db):
+            self.noise_db = self.speech_db = self.peak_db
+            self.snr_db = 0.0
+            return
+        self.noise_db = float(np.percentile(self.frame_db, 10))
+        speech = self.frame_db[self.frame_db > self.noise_db + SPEECH_THRESHOLD_DB]
+        if len(speech):
+            self.speech_db = float(10.0 * np.log10(np.mean(10.0 ** (speech / 10.0))))
+        else:
+            self.speech_db = float(np.max(self.frame_db))
+        self.snr_db = self.speech_db - self.noise_db
+
+    @property
+    def silent(self) -> bool:
+        return self.peak_db < ABSOLUTE_FLOOR_DB
+
+
+class EnhancementStage(ABC):
+    """
+    One post-processing step
+
+    skip() decides from the measured levels whether the audio needs the
+    stage at all; apply() returns the processed audio.
+    """
+
+    name = "base"
+
+    @property
+    def signature(self) -> str:
+        """Name and parameters"""
+        params = ",".join(f"{key}={value}" for key, value in sorted(vars(self).items()))
+        return f"{self.name}({params})"
+
+    def skip(self, levels: AudioLevels) -> bool:
+        return levels.silent
+
+    @abstractmethod
+    def apply(self, audio: np.ndarray, sample_rate: int, levels: AudioLevels) -> np.ndarray:
+        """Return the processed audio"""
+
+
+class PeakNormalize(EnhancementStage):
+    """Scale so the peak sits at ceiling_db (skipped when it already does)"""
+
+    name = "peak_normalize"
+
+    def __init__(self, ceiling_db: float = -1.0, tolerance_db: float = 0.5):
+        self.ceiling_db = ceiling_db
+        self.tolerance_db = tolerance_db
+
+    def skip(self, levels: AudioLevels) -> bool:
+        return levels.silent or abs(levels.peak_db - self.ceiling_db) < self.tolerance_db
+
+    def apply(self, audio: np.ndarray, sample_rate: int, levels: AudioLevels) -> np.ndarray:
+        return audio * np.float32(10.0 ** ((self.ceiling_db - levels.peak_db) / 20.0))
+
+
+class LoudnessNormalize(EnhancementStage):
+    """
+    Scale so speech sits at target_db RMS, keeping the peak under ceiling_db
+
+    Gives stitched segments and voice presets the same loudness, which
+    peak normalization does not. Skipped when already within tolerance.
+    """
+
+    name = "loudness_normalize"
+
+    def __init__(self, target_db: float = -20.0, ceiling_db: float = -1.0, tolerance_db: float = 1.0):
+        self.target_db = target_db
+        self.ceiling_db = ceiling_db
+        self.tolerance_db = tolerance_db
+
+    def _gain_db(self, levels: AudioLevels) -> float:
+        return min(self.target_db - levels.speech_db, self.ceiling_db - levels.peak_db)
+
+    def skip(self, levels: AudioLevels) -> bool:
+        return levels.silent or abs(self._gain_db(levels)) < self.tolerance_db
+
+    def apply(self, audio: np.ndarray, sample_rate: int, levels: AudioLevels) -> np.ndarray:
+        return audio * np.float32(10.0 ** (self._gain_db(levels) / 20.0))
+
+
+class NoiseGate(EnhancementStage):
+    """
+    Attenuate frames near the noise floor (hiss and breaths between words)
+
+    Frames less than threshold_db above the floor are turned down by
+    reduction_db; the gate is held open hold_frames around speech and the
+    per-frame gain is interpolated per sample, so word edges are not cut.
+    Skipped when the floor is already inaudible (SNR over skip_snr_db or
+    floor under ABSOLUTE_FLOOR_DB).
+    """
+
+    name = "noise_gate"
+
+    def __init__(
+        self,
+        threshold_db: float = 6.0,
+        reduction_db: float = 24.0,
+        hold_frames: int = 3,
+        skip_snr_db: float = 50.0
+    ):
+        self.threshold_db = threshold_db
+        self.reduction_db = reduction_db
+        self.hold_frames = hold_frames
+        self.skip_snr_db = skip_snr_db
+
+    def skip(self, levels: AudioLevels) -> bool:
+        return (
+            levels.silent
+            or not len(levels.frame_db)
+            or levels.snr_db >= self.skip_snr_db
+            or levels.noise_db < ABSOLUTE_FLOOR_DB
+        )
+
+    def apply(self, audio: np.ndarray, sample_rate: int, levels: AudioLevels) -> np.ndarray:
+        is_open = levels.frame_db > levels.noise_db + self.threshold_db
+        window = np.ones(2 * self.hold_frames + 1)
+        is_open = np.convolve(is_open, window, mode="same") > 0
+
+        gains = np.where(is_open, 1.0, 10.0 ** (-self.reduction_db / 20.0)).astype(np.float32)
+        centers = (np.arange(len(gains)) + 0.5) * levels.frame
+        envelope = np.interp(np.arange(len(audio)), centers, gains).astype(np.float32)
+        return audio * envelope
+
+
+class SpectralNoiseReduction(EnhancementStage):
+    """
+    Spectral gating (noisereduce), for audio with audible steady noise
+
+    An STFT pass several times the cost of the other stages; clean
+    audio (SNR over skip_snr_db) is passed through.
+    """
+
+    name = "noise_reduction"
+
+    def __init__(self, prop_decrease: float = 0.6, skip_snr_db: float = 30.0):
+        self.prop_decrease = prop_decrease
+        self.skip_snr_db = skip_snr_db
+
+    def skip(self, levels: AudioLevels) -> bool:
+        return levels.silent or levels.snr_db >= self.skip_snr_db
+
+    def apply(self, audio: np.ndarray, sample_rate: int, levels: AudioLevels) -> np.ndarray:
+        return nr.reduce_noise(y=audio, sr=sample_rate, prop_decrease=self.prop_decrease)
+
+
+STAGES = {
+    PeakNormalize.name: (PeakNormalize, lambda: True),
+    LoudnessNormalize.name: (LoudnessNormalize, lambda: True),
+    NoiseGate.name: (NoiseGate, lambda: True),
+    SpectralNoiseReduction.name: (SpectralNoiseReduction, lambda: NOISEREDUCE_AVAILABLE),
+}
+
+
+class AudioEnhancer:
+    """
+    Ordered enhancement stages, run in a dedicated worker pool
+
+    Levels are measured before the first stage and again after each
+    stage that ran, so every skip decision sees the current audio. A
+    failing stage is logged and left out for that utterance. Stats count
+    applied/skipped/failed runs and time per stage ("measure" is the
+    level analysis).
+    """
+
+    def __init__(self, stages: List[EnhancementStage], max_workers: int = 2):
+        self.stages = stages
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="enhance")
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, float]] = {
+            name: {"applied": 0, "skipped": 0, "failed": 0, "ms": 0.0}
+            for name in ["measure"] + [stage.name for stage in stages]
+        }
+
+    @property
+    def signature(self) -> str:
+        """Stages and their parameters in order, for versioning cached output"""
+        return "+".join(stage.signature for stage in self.stages) or "none"
+
+    async def enhance(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Run the stages in the worker pool"""
+        if not self.stages:
+            return audio
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.process, audio, sample_rate)
+
+    def process(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """
+        Run the stages in the calling thread
+
+        Args:
+            audio: Mono waveform
+            sample_rate: Its sample rate
+
+        Returns:
+            Enhanced float32 waveform
+        """
+        audio = np.asarray(audio, dtype=np.float32)
+        levels = None
+        for stage in self.stages:
+            if levels is None:
+                start = time.perf_counter()
+                levels = AudioLevels(audio, sample_rate)
+                self._count("measure", "applied", start)
+
+            start = time.perf_counter()
+            if stage.skip(levels):
+                self._count(stage.name, "skipped", start)
+                continue
+            try:
+                audio = np.asarray(stage.apply(audio, sample_rate, levels), dtype=np.float32)
+                levels = None
+                self._count(stage.name, "applied", start)
+            except Exception as e:
+                logger.warning(f"Audio enhancement stage {stage.name} failed: {e}")
+                self._count(stage.name, "failed", start)
+        return audio
+
+    def _count(self, name: str, outcome: str, start: float):
+        with self._lock:
+            self.stats[name][outcome] += 1
+            self.stats[name]["ms"] += (time.perf_counter() - start) * 1000
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {name: dict(counts) for name, counts in self.stats.items()}
+        for counts in stages.values():
+            runs = counts["applied"] + counts["skipped"] + counts["failed"]
+            counts["mean_ms"] = counts["ms"] / runs if runs else 0.0
+        return {"stages": stages, "pipeline": [stage.name for stage in self.stages]}
+
+
+def create_audio_enhancer(model_config: ModelConfig) -> AudioEnhancer:
+    """
+    Build the TTS enhancement pipeline from TTS_ENHANCEMENT_STAGES
+
+    Unknown stages, and noise_reduction without noisereduce installed,
+    are left out with a warning.
+    """
+    stages = []
+    for name in model_config.TTS_ENHANCEMENT_STAGES:
+        if name not in STAGES:
+            logger.warning(f"Unknown audio enhancement stage: {name}")
+            continue
+        stage_cls, available = STAGES[name]
+        if not available():
+            logger.warning(f"Audio enhancement stage {name} is not available, skipping it")
+            continue
+        if stage_cls is LoudnessNormalize:
+            stages.append(LoudnessNormalize(target_db=model_config.TTS_LOUDNESS_TARGET_DB))
+        else:
+            stages.append(stage_cls())
+    return AudioEnhancer(stages, max_workers=model_config.TTS_ENHANCEMENT_WORKERS)
@@ -0,0 +1,601 @@
+"""
+SmartSuccess.AI GPU Backend - Audio I/O
+In-memory decoding of uploaded audio to 16 kHz mono float32 for ASR,
+and encoding of synthesized speech (WAV, raw PCM, Opus, MP3)
+"""
+
+import base64
+import io
+import logging
+import shutil
+import struct
+import subprocess
+import threading
+import time
+from functools import lru_cache
+from math import gcd
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from models.schemas import AudioFormat
+
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    sf = None
+    SOUNDFILE_AVAILABLE = False
+
+try:
+    from scipy.signal import resample_poly
+    SCIPY_AVAILABLE = True
+except ImportError:
+    resample_poly = None
+    SCIPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+ASR_SAMPLE_RATE = 16000  # Whisper's input rate
+
+# WAVE format tags
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+_WAV_STREAMING_SIZE = 0xFFFFFFFF
+# Sample sizes _pcm_to_float reads, by format tag
+_WAV_SAMPLE_BITS = {
+    _WAVE_FORMAT_PCM: (8, 16, 24, 32),
+    _WAVE_FORMAT_IEEE_FLOAT: (32, 64)
+}
+
+# Containers libsndfile reads from memory (by magic bytes)
+_SOUNDFILE_MAGIC = (b"fLaC", b"OggS", b"FORM", b"RIFF", b"RF64")
+
+# Output formats: media type, file extension
+_OUTPUT_FORMATS = {
+    AudioFormat.WAV: ("audio/wav", "wav"),
+    AudioFormat.OPUS: ("audio/ogg; codecs=opus", "ogg"),
+    AudioFormat.MP3: ("audio/mpeg", "mp3"),
+    AudioFormat.PCM: ("audio/L16", "pcm")
+}
+
+# Compressed output formats: libsndfile (>= 1.1) container and subtype
+_SOUNDFILE_ENCODERS = {
+    AudioFormat.OPUS: ("OGG", "OPUS"),
+    AudioFormat.MP3: ("MP3", "MPEG_LAYER_III")
+}
+
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+# Accept header media types
+_ACCEPT_TYPES = {
+    "audio/wav": AudioFormat.WAV,
+    "audio/wave": AudioFormat.WAV,
+    "audio/x-wav": AudioFormat.WAV,
+    "audio/vnd.wave": AudioFormat.WAV,
+    "audio/ogg": AudioFormat.OPUS,
+    "audio/opus": AudioFormat.OPUS,
+    "audio/mpeg": AudioFormat.MP3,
+    "audio/mp3": AudioFormat.MP3,
+    "audio/l16": AudioFormat.PCM,
+    "audio/pcm": AudioFormat.PCM
+}
+
+
+class AudioDecodeError(ValueError):
+    """Audio that none of the decoders could read"""
+
+
+def _pcm_to_float(raw: memoryview, bits: int, float_format: bool) -> np.ndarray:
+    """Interleaved little-endian PCM samples as float32 in [-1, 1]"""
+    if float_format:
+        if bits == 32:
+            return np.frombuffer(raw, dtype="<f4").astype(np.float32, copy=False)
+        if bits == 64:
+            return np.frombuffer(raw, dtype="<f8").astype(np.float32)
+    elif bits == 16:
+        return np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif bits == 32:
+        return np.frombuffer(raw, dtype="<i4").astype(np.float32) / 2147483648.0
+    elif bits == 8:
+        # 8-bit WAV is unsigned
+        return (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif bits == 24:
+        packed = np.frombuffer(raw, dtype=np.uint8)
+        packed = packed[:len(packed) - len(packed) % 3].reshape(-1, 3)
+        samples = (
+            packed[:, 0].astype(np.int32)
+            | (packed[:, 1].astype(np.int32) << 8)
+            | (packed[:, 2].astype(np.int8).astype(np.int32) << 16)
+        )
+        return samples.astype(np.float32) / 8388608.0
+    raise AudioDecodeError(f"Unsupported WAV sample format: {bits}-bit {'float' if float_format else 'PCM'}")
+
+
+def parse_wav(data: bytes) -> Optional[Tuple[np.ndarray, int]]:
+    """
+    Decode an uncompressed RIFF/WAVE file without copying the payload
+
+    Returns:
+        (samples as float32 (frames, channels), sample rate), or None when
+        the data is not a WAV this parser handles (compressed codecs, RF64,
+        unusual sample sizes, malformed headers); the other decoders then
+        get their turn
+    """
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+
+    view = memoryview(data)
+    offset = 12
+    fmt = None
+    while offset + 8 <= len(data):
+        chunk_id = data[offset:offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+        body = offset + 8
+
+        if chunk_id == b"fmt ":
+            if chunk_size < 16 or body + 16 > len(data):
+                return None
+            format_tag, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", data, body)
+            if format_tag == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40 and body + 26 <= len(data):
+                # The sub-format GUID starts with the actual format tag
+                (format_tag,) = struct.unpack_from("<H", data, body + 24)
+            fmt = (format_tag, channels, sample_rate, bits)
+
+        elif chunk_id == b"data":
+            if fmt is None:
+                return None
+            format_tag, channels, sample_rate, bits = fmt
+            if bits not in _WAV_SAMPLE_BITS.get(format_tag, ()) or not channels or not sample_rate:
+                return None
+            # Streamed WAVs often carry a placeholder size; trust the buffer
+            end = min(body + chunk_size, len(data)) if chunk_size else len(data)
+            frame_bytes = channels * bits // 8
+            end -= (end - body) % frame_bytes
+            samples = _pcm_to_float(view[body:end], bits, format_tag == _WAVE_FORMAT_IEEE_FLOAT)
+            return samples.reshape(-1, channels), sample_rate
+
+        # Chunks are word aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+def to_mono(samples: np.ndarray) -> np.ndarray:
+    """Average channels of a (frames, channels) array"""
+    if samples.ndim == 1:
+        return samples
+    if samples.shape[1] == 1:
+        return samples[:, 0]
+    return samples.mean(axis=1, dtype=np.float32)
+
+
+def resample(audio: np.ndarray, source_rate: int, target_rate: int = ASR_SAMPLE_RATE) -> np.ndarray:
+    """
+    Resample a mono float32 signal
+
+    Uses polyphase filtering (scipy) when available, which is both
+    anti-aliased and vectorized; otherwise linear interpolation.
+    """
+    if source_rate == target_rate or not len(audio):
+        return audio.astype(np.float32, copy=False)
+
+    if SCIPY_AVAILABLE:
+        divisor = gcd(source_rate, target_rate)
+        return resample_poly(audio, target_rate // divisor, source_rate // divisor).astype(np.float32)
+
+    target_length = int(round(len(audio) * target_rate / source_rate))
+    positions = np.arange(target_length, dtype=np.float64) * (source_rate / target_rate)
+    return np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+
+
+def wav_header(
+    num_frames: Optional[int],
+    sample_rate: int,
+    channels: int = 1,
+    sample_width: int = 2
+) -> bytes:
+    """
+    44-byte RIFF/WAVE header for PCM data of the given length
+
+    num_frames=None writes the maximum sizes, the usual marker for a
+    stream whose length is not known yet (players read until the end).
+    """
+    if num_frames is None:
+        data_size = riff_size = _WAV_STREAMING_SIZE
+    else:
+        data_size = num_frames * channels * sample_width
+        riff_size = 36 + data_size
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", riff_size, b"WAVE",
+        b"fmt ", 16, _WAVE_FORMAT_PCM, channels, sample_rate,
+        sample_rate * channels * sample_width, channels * sample_width, sample_width * 8,
+        b"data", data_size
+    )
+
+
+def float_to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Little-endian int16 samples of a float waveform in [-1, 1] (clipped)"""
+    scaled = np.multiply(audio, 32767.0, dtype=np.float32)
+    np.clip(scaled, -32767.0, 32767.0, out=scaled)
+    np.rint(scaled, out=scaled)
+    return scaled.astype("<i2")
+
+
+class WavAudio:
+    """
+    16-bit mono PCM WAV kept as a header plus the sample buffer
+
+    The samples are converted once; the WAV bytes are only assembled (or
+    base64-encoded) when a response needs them.
+    """
+
+    __slots__ = ("samples", "sample_rate", "header")
+
+    def __init__(self, audio: np.ndarray, sample_rate: int):
+        self.samples = float_to_pcm16(audio)
+        self.sample_rate = sample_rate
+        self.header = wav_header(len(self.samples), sample_rate)
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / self.sample_rate
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.header) + self.samples.nbytes
+
+    def to_bytes(self) -> bytes:
+        return b"".join((self.header, memoryview(self.samples).cast("B")))
+
+    def to_base64(self) -> str:
+        return base64.b64encode(self.to_bytes()).decode("ascii")
+
+
+@lru_cache()
+def supported_output_formats() -> Tuple[AudioFormat, ...]:
+    """Output formats this host can encode (Opus and MP3 need libsndfile >= 1.1)"""
+    formats = [AudioFormat.WAV, AudioFormat.PCM]
+    if SOUNDFILE_AVAILABLE:
+        for fmt, (container, subtype) in _SOUNDFILE_ENCODERS.items():
+            if container in sf.available_formats() and subtype in sf.available_subtypes(container):
+                formats.append(fmt)
+    return tuple(formats)
+
+
+def media_type(fmt: AudioFormat, sample_rate: int) -> str:
+    """Content type of audio in fmt (raw PCM carries its rate as a parameter)"""
+    if fmt == AudioFormat.PCM:
+        return f"audio/L16; rate={sample_rate}; channels=1"
+    return _OUTPUT_FORMATS[fmt][0]
+
+
+def negotiate_audio_format(accept: Optional[str], default: AudioFormat = AudioFormat.WAV) -> AudioFormat:
+    """
+    Preferred supported output format of an Accept header
+
+    Wildcards and unknown types express no preference, so the default
+    is returned unless an audio type this host can encode is listed.
+    """
+    supported = supported_output_formats()
+    best, best_q = None, 0.0
+    for media_range in (accept or "").split(","):
+        name, *params = [part.strip() for part in media_range.split(";")]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        fmt = _ACCEPT_TYPES.get(name.lower())
+        if fmt in supported and q > best_q:
+            best, best_q = fmt, q
+    return best or default
+
+
+class EncodedAudio:
+    """Speech encoded in an output format"""
+
+    __slots__ = ("data", "format", "sample_rate", "duration")
+
+    def __init__(self, data: bytes, fmt: AudioFormat, sample_rate: int, duration: float):
+        self.data = data
+        self.format = fmt
+        self.sample_rate = sample_rate
+        self.duration = duration
+
+    @property
+    def media_type(self) -> str:
+        return media_type(self.format, self.sample_rate)
+
+    @property
+    def extension(self) -> str:
+        return _OUTPUT_FORMATS[self.format][1]
+
+    def to_base64(self) -> str:
+        return base64.b64encode(self.data).decode("ascii")
+
+
+def _opus_rate(sample_rate: int) -> int:
+    """Opus only takes 8/12/16/24/48 kHz; other rates go up to the next of those"""
+    if sample_rate in OPUS_SAMPLE_RATES:
+        return sample_rate
+    return next((rate for rate in OPUS_SAMPLE_RATES if rate > sample_rate), OPUS_SAMPLE_RATES[-1])
+
+
+def _check_encodable(fmt: AudioFormat):
+    if fmt not in supported_output_formats():
+        raise ValueError(f"Audio format not supported on this host: {fmt.value}")
+
+
+def encode_audio(
+    audio: np.ndarray,
+    sample_rate: int,
+    fmt: AudioFormat,
+    compression_level: Optional[float] = None
+) -> EncodedAudio:
+    """
+    Encode a mono float waveform in an output format
+
+    CPU-bound (Opus in particular); call it off the event loop.
+
+    Args:
+        audio: Samples in [-1, 1]
+        sample_rate: Rate of audio (Opus output may be resampled)
+        fmt: Output format
+        compression_level: libsndfile compression level for Opus and MP3,
+            0 (highest bitrate) to 1 (smallest); None for the codec default
+
+    Raises:
+        ValueError: If this host cannot encode fmt
+    """
+    fmt = AudioFormat(fmt)
+    duration = len(audio) / sample_rate
+    if fmt == AudioFormat.WAV:
+        return EncodedAudio(WavAudio(audio, sample_rate).to_bytes(), fmt, sample_rate, duration)
+    if fmt == AudioFormat.PCM:
+        return EncodedAudio(float_to_pcm16(audio).tobytes(), fmt, sample_rate, duration)
+
+    _check_encodable(fmt)
+    if fmt == AudioFormat.OPUS:
+        audio = resample(audio, sample_rate, _opus_rate(sample_rate))
+        sample_rate = _opus_rate(sample_rate)
+
+    container, subtype = _SOUNDFILE_ENCODERS[fmt]
+    buffer = io.BytesIO()
+    sf.write(
+        buffer, np.clip(audio, -1.0, 1.0), sample_rate,
+        format=container, subtype=subtype, compression_level=compression_level
+    )
+    return EncodedAudio(buffer.getvalue(), fmt, sample_rate, duration)
+
+
+class _StreamSink(io.RawIOBase):
+    """
+    Append-only file object an encoder writes a stream into
+
+    take() hands out what was written since the last call. Writes that
+    land before the end (libsndfile patching headers on close) are
+    dropped, since those bytes are already sent.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._pending = bytearray()
+        self._sent = 0
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        size = len(memoryview(data).cast("B"))
+        if self._position == self._sent + len(self._pending):
+            self._pending += data
+        self._position += size
+        return size
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        else:
+            self._position = self._sent + len(self._pending) + offset
+        return self._position
+
+    def take(self) -> bytes:
+        data = bytes(self._pending)
+        self._sent += len(data)
+        self._pending.clear()
+        return data
+
+
+class StreamEncoder:
+    """
+    One continuous audio stream, encoded piece by piece as speech arrives
+
+    write() returns the bytes that are ready for a piece; close() the
+    rest. Concatenated, they form a single file of the format:
+    - WAV: header with open-ended sizes (see wav_header), then PCM
+    - PCM: 16-bit PCM only
+    - Opus: one Ogg stream. Ogg pages are cut as they fill, so the tail
+      of a piece goes out with the next one
+    - MP3: constant bitrate, since the VBR header written on close
+      cannot be patched into a stream that is already sent
+
+    Pieces must come in order from one thread at a time (encoding is
+    CPU-bound; call it off the event loop).
+    """
+
+    def __init__(self, fmt: AudioFormat, sample_rate: int, compression_level: Optional[float] = None):
+        self.format = AudioFormat(fmt)
+        self.source_rate = sample_rate
+        self.sample_rate = _opus_rate(sample_rate) if self.format == AudioFormat.OPUS else sample_rate
+
+        self._header = wav_header(None, sample_rate) if self.format == AudioFormat.WAV else b""
+        self._sink = None
+        self._file = None
+        if self.format in _SOUNDFILE_ENCODERS:
+            _check_encodable(self.format)
+            container, subtype = _SOUNDFILE_ENCODERS[self.format]
+            self._sink = _StreamSink()
+            self._file = sf.SoundFile(
+                self._sink, "w", self.sample_rate, 1,
+                format=container, subtype=subtype, compression_level=compression_level,
+                bitrate_mode="CONSTANT" if self.format == AudioFormat.MP3 else None
+            )
+
+    @property
+    def media_type(self) -> str:
+        return media_type(self.format, self.sample_rate)
+
+    def write(self, audio: np.ndarray) -> EncodedAudio:
+        """Encode the next piece of the stream"""
+        duration = len(audio) / self.source_rate
+        if self._file is None:
+            data = self._header + memoryview(float_to_pcm16(audio)).cast("B")
+            self._header = b""
+            return EncodedAudio(data, self.format, self.sample_rate, duration)
+
+        if self.sample_rate != self.source_rate:
+            audio = resample(audio, self.source_rate, self.sample_rate)
+        self._file.write(np.clip(audio, -1.0, 1.0))
+        return EncodedAudio(self._sink.take(), self.format, self.sample_rate, duration)
+
+    def close(self) -> EncodedAudio:
+        """Flush the encoder; the returned bytes end the stream"""
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+            return EncodedAudio(self._sink.take(), self.format, self.sample_rate, 0.0)
+        return EncodedAudio(self._header, self.format, self.sample_rate, 0.0)
+
+
+class AudioDecoder:
+    """
+    Decode uploaded audio bytes to ASR input (16 kHz mono float32)
+
+    Decoders, cheapest first:
+    - uncompressed WAV (PCM 8/16/24/32-bit, float): parsed in place with
+      numpy over a memoryview
+    - other containers libsndfile reads (FLAC, OGG, AIFF, WAV variants):
+      soundfile over an in-memory buffer
+    - anything else (MP3, M4A, WebM/Opus, ...): one ffmpeg process, fed
+      through stdin and read from stdout, so no temp files are written
+
+    Stats count decodes per path and ffmpeg process spawns.
+    """
+
+    def __init__(self, ffmpeg_binary: str = "ffmpeg"):
+        self.ffmpeg_binary = ffmpeg_binary
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.stats: Dict[str, float] = {
+            "wav": 0,
+            "soundfile": 0,
+            "ffmpeg": 0,
+            "failed": 0,
+            "ffmpeg_spawns": 0,
+            "decode_ms": 0.0
+        }
+
+    def decode(self, data: bytes, sample_rate: int = ASR_SAMPLE_RATE) -> np.ndarray:
+        """
+        Decode audio bytes
+
+        Args:
+            data: Encoded audio (any container ffmpeg understands)
+            sample_rate: Output sample rate
+
+        Returns:
+            Mono float32 samples at sample_rate
+
+        Raises:
+            AudioDecodeError: If the audio cannot be decoded
+        """
+        start = time.perf_counter()
+        try:
+            audio, path = self._decode(data, sample_rate)
+        except Exception:
+            self._count("failed", start)
+            raise
+        self._count(path, start)
+        return audio
+
+    def _decode(self, data: bytes, sample_rate: int) -> Tuple[np.ndarray, str]:
+        if not data:
+            raise AudioDecodeError("Empty audio")
+
+        decoded = parse_wav(data)
+        if decoded is not None:
+            samples, source_rate = decoded
+            return resample(to_mono(samples), source_rate, sample_rate), "wav"
+
+        if SOUNDFILE_AVAILABLE and data[:4] in _SOUNDFILE_MAGIC:
+            try:
+                samples, source_rate = sf.read(io.BytesIO(data), dtype="float32", always_2d=True)
+                return resample(to_mono(samples), source_rate, sample_rate), "soundfile"
+            except Exception as e:
+                logger.debug(f"soundfile could not decode audio, using ffmpeg: {e}")
+
+        return self._decode_ffmpeg(data, sample_rate), "ffmpeg"
+
+    def _decode_ffmpeg(self, data: bytes, sample_rate: int) -> np.ndarray:
+        """Decode with ffmpeg over pipes (same output as whisper.load_audio)"""
+        if shutil.which(self.ffmpeg_binary) is None:
+            raise AudioDecodeError("Unsupported audio format and ffmpeg is not installed")
+
+        cmd = [
+            self.ffmpeg_binary,
+            "-nostdin",
+            "-threads", "0",
+            "-i", "pipe:0",
+            "-f", "s16le",
+            "-ac", "1",
+            "-acodec", "pcm_s16le",
+            "-ar", str(sample_rate),
+            "-"
+        ]
+        with self._lock:
+            self.stats["ffmpeg_spawns"] += 1
+        try:
+            out = subprocess.run(cmd, input=data, capture_output=True, check=True).stdout
+        except subprocess.CalledProcessError as e:
+            raise AudioDecodeError(f"ffmpeg failed to decode audio: {e.stderr.decode(errors='replace')[-500:]}") from e
+        return np.frombuffer(out, dtype="<i2").astype(np.float32) / 32768.0
+
+    def _count(self, path: str, start: float):
+        with self._lock:
+            self.stats[path] += 1
+            self.stats["decode_ms"] += (time.perf_counter() - start) * 1000
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self.stats)
+        decodes = stats["wav"] + stats["soundfile"] + stats["ffmpeg"]
+        minutes = max((time.time() - self.started_at) / 60, 1e-9)
+        stats["mean_decode_ms"] = stats["decode_ms"] / decodes if decodes else 0.0
+        stats["ffmpeg_spawns_per_minute"] = stats["ffmpeg_spawns"] / minutes
+        return stats
+
+
+# Singleton accessor
+_decoder: Optional[AudioDecoder] = None
+
+def get_audio_decoder() -> AudioDecoder:
+    """Get the audio decoder singleton"""
+    global _decoder
+    if _decoder is None:
+        _decoder = AudioDecoder()
+    return _decoder
@@ -0,0 +1,105 @@
+"""
+SmartSuccess.AI GPU Backend - Audio Segmentation
+Energy-based voice activity detection and pause-aligned chunking
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+
+FRAME_MS = 30  # Analysis frame length
+PAD_MS = 150  # Audio kept around each chunk's speech
+ABSOLUTE_FLOOR_DB = -60.0  # Frames quieter than this are never speech
+
+
+def frame_energy_db(audio: np.ndarray, frame: int) -> np.ndarray:
+    """Mean energy (dB) of consecutive non-overlapping frames"""
+    n_frames = len(audio) // frame
+    if not n_frames:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[:n_frames * frame].reshape(n_frames, frame)
+    # einsum avoids materializing the squared signal
+    energy = np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame
+    return (10.0 * np.log10(energy + 1e-12)).astype(np.float32)
+
+
+def speech_mask(energy_db: np.ndarray, threshold_db: float) -> np.ndarray:
+    """Frames at least threshold_db above the estimated noise floor"""
+    if not len(energy_db):
+        return np.zeros(0, dtype=bool)
+    noise_floor = float(np.percentile(energy_db, 10))
+    return energy_db > max(noise_floor + threshold_db, ABSOLUTE_FLOOR_DB)
+
+
+def speech_chunks(
+    audio: np.ndarray,
+    sample_rate: int,
+    max_seconds: float = 30.0,
+    min_silence_ms: int = 300,
+    threshold_db: float = 12.0
+) -> List[Tuple[int, int]]:
+    """
+    Split audio into chunks of at most max_seconds, cut at pauses
+
+    The chunks cover the whole signal except stretches quieter than
+    ABSOLUTE_FLOOR_DB (digital silence) that are longer than
+    min_silence_ms once PAD_MS is kept on both sides. Speech detection
+    only chooses where to cut: a span longer than max_seconds is cut in
+    the second half of the allowed length, at the min_silence_ms window
+    with the fewest speech frames (the quietest one among those). With
+    no speech frames at all, as in a steady signal, the cuts fall every
+    max_seconds.
+
+    Works on frame energies only (one value per FRAME_MS), so a
+    10-minute recording costs about 20k frames however the chunks fall.
+
+    Returns:
+        (start, end) sample offsets of each chunk, in order
+    """
+    frame = max(1, sample_rate * FRAME_MS // 1000)
+    energy_db = frame_energy_db(audio, frame)
+    n_frames = len(energy_db)
+    if not n_frames:
+        return [(0, len(audio))] if len(audio) else []
+
+    max_frames = max(1, int(max_seconds * 1000 // FRAME_MS))
+    pad = PAD_MS // FRAME_MS
+    window = max(1, min_silence_ms // FRAME_MS)
+
+    # Audible runs, padded; silent gaps shorter than a pause are kept
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], energy_db > ABSOLUTE_FLOOR_DB, [0])).astype(np.int8)))
+    spans: List[List[int]] = []
+    for run_start, run_end in edges.reshape(-1, 2):
+        run_start, run_end = max(0, int(run_start) - pad), min(n_frames, int(run_end) + pad)
+        if spans and run_start - spans[-1][1] < window:
+            spans[-1][1] = run_end
+        else:
+            spans.append([run_start, run_end])
+
+    # Per pause window starting at each frame: speech frames in it, and
+    # its mean energy
+    speech = speech_mask(energy_db, threshold_db)
+    has_speech = bool(speech.any())
+    speech_count = np.convolve(speech, np.ones(window, dtype=np.int64), mode="valid")
+    cumulative = np.concatenate(([0.0], np.cumsum(energy_db, dtype=np.float64)))
+    quietness = (cumulative[window:] - cumulative[:-window]) / window
+
+    chunks = []
+    for start, end in spans:
+        while end - start > max_frames:
+            limit = start + max_frames
+            lo = start + max_frames // 2
+            hi = min(limit - window, len(quietness) - 1)
+            cut = limit
+            if has_speech and hi > lo:
+                counts = speech_count[lo:hi + 1]
+                candidates = np.where(counts == counts.min(), quietness[lo:hi + 1], np.inf)
+                cut = min(lo + int(np.argmin(candidates)) + window // 2, limit)
+            chunks.append((start, cut))
+            start = cut
+        chunks.append((start, end))
+
+    # Frames -> samples; a chunk reaching the last frame keeps the tail
+    # of the signal
+    return [(s * frame, len(audio) if e == n_frames else e * frame) for s, e in chunks]
@@ -0,0 +1,333 @@
+"""
+SmartSuccess.AI GPU Backend - Chroma Write-Behind Queue
+Batched single-writer ingestion for user RAG collections
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PendingCollection:
+    """Rows queued for a collection that are not yet durable"""
+
+    __slots__ = ("name", "replace", "ids", "embeddings", "documents", "metadatas", "acks")
+
+    def __init__(self, name: str, replace: bool):
+        self.name = name
+        self.replace = replace
+        self.ids: List[str] = []
+        self.embeddings: List[np.ndarray] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+        self.acks: List[Future] = []
+
+    def extend(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ):
+        self.ids.extend(ids)
+        self.embeddings.append(np.asarray(embeddings, dtype=np.float32))
+        self.documents.extend(documents)
+        self.metadatas.extend(metadatas)
+
+    def embedding_matrix(self) -> np.ndarray:
+        if not self.embeddings:
+            return np.empty((0, 0), dtype=np.float32)
+        if len(self.embeddings) > 1:
+            self.embeddings = [np.concatenate(self.embeddings)]
+        return self.embeddings[0]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class ChromaWriteBehindQueue:
+    """
+    Write-behind ingestion queue with a single writer thread
+
+    Builds enqueue their rows and return immediately with an ack future.
+    The writer thread waits a short linger window, then drains everything
+    pending in one pass: adds to the same collection are merged into one
+    (chunked) add call and all collections are written back to back, so
+    concurrent builds no longer interleave many small transactions on the
+    SQLite-backed PersistentClient.
+
+    Until a collection is durable its rows are visible through overlay(),
+    and flush()/aflush() or the returned ack guarantee the data has been
+    written before a caller reports it as ready.
+    """
+
+    def __init__(
+        self,
+        client_getter: Callable[[], Any],
+        linger_ms: int = 20,
+        max_batch_rows: int = 5000,
+        collection_metadata: Optional[Dict[str, Any]] = None
+    ):
+        self._client_getter = client_getter
+        self.linger_seconds = linger_ms / 1000
+        self.max_batch_rows = max_batch_rows
+        self.collection_metadata = collection_metadata or {"hnsw:space": "cosine"}
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._pending: Dict[str, PendingCollection] = {}
+        self._inflight: Dict[str, PendingCollection] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        self.stats = {
+            "submitted_rows": 0,
+            "written_rows": 0,
+            "write_passes": 0,
+            "collections_written": 0,
+            "failed_collections": 0,
+            "last_pass_ms": 0.0
+        }
+
+    # ------------------------------------------------------------------
+    # Producer API
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        name: str,
+        ids: List[str],
+        embeddings: np.ndarray,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        replace: bool = False
+    ) -> Future:
+        """
+        Queue rows for a collection
+
+        Args:
+            name: Collection name
+            replace: Drop and re-create the collection (and discard rows
+                still queued for it) before adding these rows
+
+        Returns:
+            Future resolved with True once the rows are durable, or False
+            when a later replace or discard() drops them before the write
+        """
+        ack: Future = Future()
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write-behind queue is closed")
+
+            pending = self._pending.get(name)
+            if pending is None or replace:
+                if pending is not None:
+                    # Superseded rows never reach disk; their writers are done
+                    for old_ack in pending.acks:
+                        old_ack.set_result(False)
+                pending = PendingCollection(name, replace)
+                self._pending[name] = pending
+
+            pending.extend(ids, embeddings, documents, metadatas)
+            pending.acks.append(ack)
+            self.stats["submitted_rows"] += len(ids)
+
+            self._ensure_writer()
+            self._wakeup.notify()
+
+        return ack
+
+    def overlay(self, name: str) -> Optional[PendingCollection]:
+        """
+        Rows for a collection that are queued or being written
+
+        Returns the newest non-durable state (queued rows supersede the
+        in-flight batch when they replace the collection), or None when the
+        collection has nothing pending.
+        """
+        with self._lock:
+            pending = self._pending.get(name)
+            inflight = self._inflight.get(name)
+
+            if pending is not None and (pending.replace or inflight is None):
+                return pending
+            if inflight is None:
+                return None
+            if pending is None:
+                return inflight
+
+            # Appends queued on top of an in-flight batch
+            merged = PendingCollection(name, inflight.replace)
+            merged.extend(inflight.ids, inflight.embedding_matrix(), inflight.documents, inflight.metadatas)
+            merged.extend(pending.ids, pending.embedding_matrix(), pending.documents, pending.metadatas)
+            return merged
+
+    def discard(self, name: str) -> bool:
+        """Drop queued (not yet in-flight) rows for a collection"""
+        with self._lock:
+            pending = self._pending.pop(name, None)
+        if pending is None:
+            return False
+        for ack in pending.acks:
+            ack.set_result(False)
+        return True
+
+    def flush(self, name: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """
+        Block until queued rows are durable
+
+        Args:
+            name: Only wait for this collection (default: everything)
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            True when every awaited write succeeded
+        """
+        acks = self._collect_acks(name)
+        deadline = None if timeout is None else time.time() + timeout
+        ok = True
+        for ack in acks:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            try:
+                ack.result(timeout=remaining)
+            except Exception:
+                ok = False
+        return ok
+
+    async def aflush(self, name: Optional[str] = None) -> bool:
+        """Async variant of flush() that does not block the event loop"""
+        acks = self._collect_acks(name)
+        if not acks:
+            return True
+        results = await asyncio.gather(
+            *(asyncio.wrap_future(ack) for ack in acks),
+            return_exceptions=True
+        )
+        return not any(isinstance(r, Exception) for r in results)
+
+    def pending_rows(self) -> int:
+        with self._lock:
+            return sum(len(p) for p in self._pending.values()) + \
+                sum(len(p) for p in self._inflight.values())
+
+    def close(self, timeout: Optional[float] = 30):
+        """Flush everything and stop the writer thread"""
+        self.flush(timeout=timeout)
+        with self._lock:
+            self._closed = True
+            self._wakeup.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    # ------------------------------------------------------------------
+    # Writer
+    # ------------------------------------------------------------------
+
+    def _collect_acks(self, name: Optional[str]) -> List[Future]:
+        with self._lock:
+            groups = [self._pending, self._inflight]
+            if name is None:
+                return [a for g in groups for p in g.values() for a in p.acks]
+            return [a for g in groups if name in g for a in g[name].acks]
+
+    def _ensure_writer(self):
+        """Start the writer thread (caller holds the lock)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name="chroma-write-behind",
+                daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._pending and not self._closed:
+                    self._wakeup.wait()
+                if not self._pending and self._closed:
+                    return
+
+            # Let concurrent builds pile up before draining
+            if self.linger_seconds > 0:
+                time.sleep(self.linger_seconds)
+
+            with self._lock:
+                batch = self._pending
+                self._pending = {}
+                self._inflight.update(batch)
+
+            self._write_pass(batch)
+
+    def _write_pass(self, batch: Dict[str, PendingCollection]):
+        start = time.time()
+        client = self._client_getter()
+
+        for name, pending in batch.items():
+            try:
+                self._write_collection(client, pending)
+                error = None
+                self.stats["written_rows"] += len(pending)
+                self.stats["collections_written"] += 1
+            except Exception as e:
+                logger.error(f"Write-behind flush failed for {name}: {e}")
+                error = e
+                self.stats["failed_collections"] += 1
+
+            with self._lock:
+                if self._inflight.get(name) is pending:
+                    del self._inflight[name]
+
+            for ack in pending.acks:
+                if ack.done():
+                    continue
+                if error is None:
+                    ack.set_result(True)
+                else:
+                    ack.set_exception(error)
+
+        self.stats["write_passes"] += 1
+        self.stats["last_pass_ms"] = (time.time() - start) * 1000
+        logger.debug(
+            f"Write-behind pass: {len(batch)} collections, "
+            f"{sum(len(p) for p in batch.values())} rows in {self.stats['last_pass_ms']:.1f}ms"
+        )
+
+    def _write_collection(self, client: Any, pending: PendingCollection):
+        if pending.replace:
+            try:
+                client.delete_collection(pending.name)
+            except Exception:
+                pass
+            collection = client.create_collection(
+                name=pending.name,
+                metadata=self.collection_metadata
+            )
+        else:
+            collection = client.get_or_create_collection(
+                name=pending.name,
+                metadata=self.collection_metadata
+            )
+
+        max_rows = min(
+            self.max_batch_rows,
+            getattr(client, "max_batch_size", None) or self.max_batch_rows
+        )
+        embeddings = pending.embedding_matrix()
+
+        for offset in range(0, len(pending), max_rows):
+            end = offset + max_rows
+            collection.add(
+                ids=pending.ids[offset:end],
+                embeddings=embeddings[offset:end].tolist(),
+                documents=pending.documents[offset:end],
+                metadatas=pending.metadatas[offset:end]
+            )
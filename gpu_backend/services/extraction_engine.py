@@ -0,0 +1,177 @@
+"""
+SmartSuccess.AI GPU Backend - Resume / Job Extraction Engine
+Precompiled single-pass field extraction for MatchWise analysis data
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+
+# Separators between items on a skills / requirements line
+_ITEM_SPLIT = re.compile(r"[,;|]")
+
+# Characters whose IGNORECASE matching differs from str.lower() (Turkish dotted
+# and dotless i, long s); documents containing them use the IGNORECASE scanner
+_CASEFOLD_EXCEPTIONS = ("\u0130", "\u0131", "\u017f")
+
+
+class _SectionScanner:
+    """
+    Combined scanner for a set of document sections
+
+    The keyword alternation is kept flat (no per-section groups) so the regex
+    engine can still use its fast literal prefix search; the section of each
+    hit is then resolved from the keyword at the match start.
+    """
+
+    def __init__(self, sections: Dict[str, List[str]]):
+        keywords = "|".join(kw for kws in sections.values() for kw in kws)
+        body = r"(?:%s)[\s:]+([^\n]+)" % keywords
+        self.sections = tuple(sections)
+        self.pattern = re.compile(body)
+        self.unicode_pattern = re.compile(body, re.IGNORECASE)
+        self.keywords = tuple(
+            (name, re.compile(r"(?:%s)" % "|".join(kws), re.IGNORECASE))
+            for name, kws in sections.items()
+        )
+
+    def section_at(self, text: str, pos: int) -> str:
+        for name, keyword in self.keywords:
+            if keyword.match(text, pos):
+                return name
+        raise ValueError(f"No section keyword at offset {pos}")
+
+
+# Resume sections. Section keywords are matched case-insensitively, so they are
+# scanned over a lower-cased copy of the document; the captured values are
+# always sliced from the original text.
+_RESUME_SCANNER = _SectionScanner({
+    "skills": ["skills?", "technologies?", "tools?"],
+    "proficiency": ["proficient in", "experienced with", "expertise in"],
+})
+
+# Company names are case-sensitive ([A-Z] start), so they scan the original text
+_COMPANY_SCANNER = re.compile(
+    r"(?:at|@|worked at|employed by)\s+([A-Z][A-Za-z\s]+(?:Inc|Corp|LLC|Ltd)?)"
+)
+
+# Job description sections
+_JOB_SCANNER = _SectionScanner({
+    "required": ["required", "must have", "essential"],
+    "requirements": ["requirements?"],
+    "preferred": ["preferred", "nice to have", "bonus"],
+})
+
+# Result caps (kept from the original extraction functions)
+MAX_SKILLS = 20
+MAX_COMPANIES = 5
+MAX_REQUIRED_SKILLS = 15
+MAX_PREFERRED_SKILLS = 10
+
+
+class ExtractionEngine:
+    """
+    Single-pass extractor for resumes and job descriptions
+
+    All patterns are compiled once at import time. Each document is
+    lower-cased a single time and scanned once with a combined section
+    pattern covering every section keyword; case-sensitive company names
+    take one extra scan of the original text. Matches of the same section
+    never overlap (same semantics as ``re.findall`` per pattern), while
+    different sections may overlap, e.g. "Skills: proficient in X" yields
+    both a skills and a proficiency value.
+
+    Deduplication keeps first-occurrence order, so results are
+    deterministic (the previous ``list(set(...))`` ordering was not).
+    """
+
+    def extract_resume(self, resume_text: str) -> Dict[str, Any]:
+        """Extract structured information from resume text"""
+        sections = self._scan(resume_text, _RESUME_SCANNER)
+
+        skills = self._split_items(sections["skills"] + sections["proficiency"])
+        companies = _COMPANY_SCANNER.findall(resume_text)
+
+        return {
+            "skills": self._dedupe(skills, MAX_SKILLS),
+            "experience": [],
+            "education": [],
+            "projects": [],
+            "companies": self._dedupe(companies, MAX_COMPANIES)
+        }
+
+    def extract_job(self, job_description: str) -> Dict[str, Any]:
+        """Extract structured information from a job description"""
+        sections = self._scan(job_description, _JOB_SCANNER)
+
+        required = self._split_items(sections["required"] + sections["requirements"])
+        preferred = self._split_items(sections["preferred"])
+
+        return {
+            "required_skills": self._dedupe(required, MAX_REQUIRED_SKILLS),
+            "preferred_skills": self._dedupe(preferred, MAX_PREFERRED_SKILLS),
+            "responsibilities": [],
+            "qualifications": []
+        }
+
+    @staticmethod
+    def _scan(text: str, scanner: _SectionScanner) -> Dict[str, List[str]]:
+        """
+        Scan a document once, collecting section values
+
+        The search restarts one character after each match start rather than
+        at its end, so values of other sections nested inside a match are
+        still found; a per-section end offset rejects same-section overlaps.
+        """
+        if any(c in text for c in _CASEFOLD_EXCEPTIONS):
+            folded = text
+            search = scanner.unicode_pattern.search
+        else:
+            # lower() keeps offsets aligned for everything except the exceptions
+            folded = text.lower()
+            search = scanner.pattern.search
+
+        values: Dict[str, List[str]] = {name: [] for name in scanner.sections}
+        last_end = dict.fromkeys(scanner.sections, 0)
+        pos = 0
+
+        while True:
+            match = search(folded, pos)
+            if match is None:
+                break
+
+            start = match.start()
+            section = scanner.section_at(folded, start)
+            if start >= last_end[section]:
+                last_end[section] = match.end()
+                values[section].append(text[match.start(1):match.end(1)])
+            pos = start + 1
+
+        return values
+
+    @staticmethod
+    def _split_items(lines: List[str]) -> List[str]:
+        """Split section values into individual stripped items"""
+        items = []
+        for line in lines:
+            for item in _ITEM_SPLIT.split(line):
+                item = item.strip()
+                if item:
+                    items.append(item)
+        return items
+
+    @staticmethod
+    def _dedupe(items: List[str], limit: int) -> List[str]:
+        """Order-preserving deduplication with a cap"""
+        return list(dict.fromkeys(items))[:limit]
+
+
+# Singleton accessor
+_engine: Optional[ExtractionEngine] = None
+
+def get_extraction_engine() -> ExtractionEngine:
+    """Get the extraction engine singleton"""
+    global _engine
+    if _engine is None:
+        _engine = ExtractionEngine()
+    return _engine
@@ -0,0 +1,146 @@
+"""
+SmartSuccess.AI GPU Backend - Federated Retrieval Service
+Single-encode semantic search across personalized and pre-RAG indexes
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from config import get_settings
+from models.schemas import (
+    InterviewCategory,
+    FederatedQueryRequest,
+    FederatedQuestion,
+    FederatedQueryResponse
+)
+from services.embedding_service import get_embedding_service
+from services.prerag_service import get_prerag_service
+from services.matchwise_service import get_matchwise_service
+
+logger = logging.getLogger(__name__)
+
+
+SOURCE_PERSONALIZED = "personalized"
+SOURCE_GENERAL = "general"
+
+
+class FederatedRetrievalService:
+    """
+    Federated query over a user's personalized RAG and the pre-RAG bank
+
+    The query is embedded once and the same vector is used for every
+    index: the user's collection and each selected pre-RAG category are
+    searched concurrently (Chroma queries are blocking, so each runs in a
+    worker thread). Raw cosine scores are multiplied by a per-source
+    weight, results are merged by weighted score and questions with the
+    same text are kept only once, preferring the higher-scored source.
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.embedding_service = get_embedding_service()
+        self.prerag_service = get_prerag_service()
+        self.matchwise_service = get_matchwise_service()
+
+    async def query(self, request: FederatedQueryRequest) -> FederatedQueryResponse:
+        """
+        Run a federated query
+
+        Args:
+            request: Query text, user RAG and pre-RAG scope
+
+        Returns:
+            Merged, weighted results from all searched sources
+        """
+        start_time = time.time()
+
+        query_embedding = self.embedding_service.encode_query(request.query)
+        embedding_time = (time.time() - start_time) * 1000
+
+        personalized_weight = request.personalized_weight
+        if personalized_weight is None:
+            personalized_weight = self.settings.FEDERATED_PERSONALIZED_WEIGHT
+        general_weight = request.general_weight
+        if general_weight is None:
+            general_weight = self.settings.FEDERATED_GENERAL_WEIGHT
+
+        # One search per index, all sharing the query embedding
+        searches = []
+        if request.rag_id:
+            searches.append((SOURCE_PERSONALIZED, personalized_weight, asyncio.to_thread(
+                self.matchwise_service.query_personalized_rag_by_embedding,
+                request.rag_id,
+                query_embedding,
+                request.n_results,
+                None,
+                request.difficulty
+            )))
+        if request.include_general:
+            for category in request.categories or list(InterviewCategory):
+                searches.append((SOURCE_GENERAL, general_weight, asyncio.to_thread(
+                    self.prerag_service.query_category,
+                    category,
+                    query_embedding,
+                    request.n_results,
+                    request.difficulty,
+                    request.include_sample_answers
+                )))
+
+        results = await asyncio.gather(
+            *(search for _, _, search in searches),
+            return_exceptions=True
+        )
+
+        merged = self._merge(
+            [(source, weight, result) for (source, weight, _), result in zip(searches, results)],
+            request.n_results
+        )
+
+        source_counts: Dict[str, int] = {}
+        for item in merged:
+            source_counts[item.source] = source_counts.get(item.source, 0) + 1
+
+        return FederatedQueryResponse(
+            results=merged,
+            total_results=len(merged),
+            source_counts=source_counts,
+            embedding_time_ms=embedding_time,
+            query_time_ms=(time.time() - start_time) * 1000
+        )
+
+    @staticmethod
+    def _merge(searches: list, n_results: int) -> List[FederatedQuestion]:
+        """Weight, de-duplicate by question text and keep the top results"""
+        best: Dict[str, FederatedQuestion] = {}
+
+        for source, weight, questions in searches:
+            if isinstance(questions, Exception):
+                logger.error(f"Federated {source} search failed: {questions}")
+                continue
+
+            for question in questions:
+                score = (question.relevance_score or 0) * weight
+                key = " ".join(question.question.casefold().split())
+                current = best.get(key)
+                if current is None or score > current.score:
+                    best[key] = FederatedQuestion(
+                        question=question,
+                        source=source,
+                        score=score
+                    )
+
+        merged = sorted(best.values(), key=lambda item: item.score, reverse=True)
+        return merged[:n_results]
+
+
+# Singleton accessor
+_service_instance: Optional[FederatedRetrievalService] = None
+
+def get_federated_retrieval_service() -> FederatedRetrievalService:
+    """Get the federated retrieval service singleton"""
+    global _service_instance
+    if _service_instance is None:
+        _service_instance = FederatedRetrievalService()
+    return _service_instance
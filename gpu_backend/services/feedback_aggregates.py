@@ -0,0 +1,132 @@
+"""
+SmartSuccess.AI GPU Backend - Feedback Aggregates
+Running per-session aggregates over interview answer feedback
+"""
+
+from array import array
+from typing import Dict, List, Optional
+
+from models.schemas import InterviewFeedback
+
+
+# Items reported per list (strengths, growth areas)
+TOP_ITEMS = 5
+
+# Trend: needs this many answers, and a change of more than TREND_MARGIN
+# points between the mean of the first and second half of the answers
+MIN_TREND_ANSWERS = 3
+TREND_MARGIN = 5
+
+
+class FeedbackAggregates:
+    """
+    Session feedback statistics maintained as each answer is scored
+
+    - count and sum of overall scores
+    - per-category [count, sum] accumulators
+    - frequency counters of strengths and growth areas (first-seen order
+      breaks ties, so results are deterministic)
+    - prefix sums of overall scores, so the first-half / second-half
+      trend split is two lookups however long the session is
+
+    Every query is O(1) in the number of answers (the counters hold a
+    handful of distinct feedback phrases).
+    """
+
+    __slots__ = ("count", "score_sum", "score_prefix", "categories", "strengths", "growth_areas")
+
+    def __init__(self):
+        self.count = 0
+        self.score_sum = 0.0
+        self.score_prefix = array("d", [0.0])
+        self.categories: Dict[str, List[float]] = {}
+        self.strengths: Dict[str, int] = {}
+        self.growth_areas: Dict[str, int] = {}
+
+    def add(self, feedback: InterviewFeedback, category: Optional[str] = None):
+        """Account for one more scored answer"""
+        score = feedback.overall_score
+        self.count += 1
+        self.score_sum += score
+        self.score_prefix.append(self.score_prefix[-1] + score)
+
+        if category is not None:
+            accumulator = self.categories.setdefault(category, [0, 0.0])
+            accumulator[0] += 1
+            accumulator[1] += score
+
+        for item in feedback.strengths:
+            self.strengths[item] = self.strengths.get(item, 0) + 1
+        for item in feedback.growth_areas:
+            self.growth_areas[item] = self.growth_areas.get(item, 0) + 1
+
+    @property
+    def mean_score(self) -> float:
+        return self.score_sum / self.count if self.count else 0.0
+
+    def category_scores(self) -> Dict[str, float]:
+        return {
+            category: total / count
+            for category, (count, total) in self.categories.items()
+        }
+
+    def top_strengths(self, limit: int = TOP_ITEMS) -> List[str]:
+        return self._top(self.strengths, limit)
+
+    def top_growth_areas(self, limit: int = TOP_ITEMS) -> List[str]:
+        return self._top(self.growth_areas, limit)
+
+    def trend(self) -> Optional[str]:
+        """improving / declining / stable between the two halves of the answers"""
+        if self.count < MIN_TREND_ANSWERS:
+            return None
+
+        half = self.count // 2
+        first_avg = self.score_prefix[half] / half
+        second_avg = (self.score_sum - self.score_prefix[half]) / (self.count - half)
+
+        if second_avg > first_avg + TREND_MARGIN:
+            return "improving"
+        if second_avg < first_avg - TREND_MARGIN:
+            return "declining"
+        return "stable"
+
+    def summary(self) -> dict:
+        """Live scores for session status responses"""
+        return {
+            "answered": self.count,
+            "overall_score": self.mean_score,
+            "category_scores": self.category_scores(),
+            "trend": self.trend()
+        }
+
+    @staticmethod
+    def _top(counter: Dict[str, int], limit: int) -> List[str]:
+        # sorted() is stable, so equal counts keep first-seen order
+        return sorted(counter, key=counter.get, reverse=True)[:limit]
+
+    # ------------------------------------------------------------------
+    # Serialization (session store)
+    # ------------------------------------------------------------------
+
+    def to_state(self) -> dict:
+        return {
+            "n": self.count,
+            "s": self.score_sum,
+            "p": self.score_prefix[1:].tolist(),
+            "c": self.categories,
+            "st": self.strengths,
+            "g": self.growth_areas
+        }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "FeedbackAggregates":
+        aggregates = cls()
+        aggregates.count = state["n"]
+        aggregates.score_sum = state["s"]
+        aggregates.score_prefix = array("d", [0.0])
+        aggregates.score_prefix.extend(state["p"])
+        aggregates.categories = state["c"]
+        aggregates.strengths = state["st"]
+        aggregates.growth_areas = state["g"]
+        return aggregates
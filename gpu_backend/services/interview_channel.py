@@ -0,0 +1,268 @@
+"""
+SmartSuccess.AI GPU Backend - Interview Channel
+Full-duplex WebSocket transport for interview sessions
+"""
+
+import asyncio
+import base64
+import logging
+from typing import Any, Optional, Tuple
+
+from fastapi import WebSocket
+
+from models.schemas import AudioFormat, InterviewMessageRequest, TranscriptionRequest
+from services.audio_io import ASR_SAMPLE_RATE, supported_output_formats
+from services.session_store import SessionConflictError
+from services.streaming_asr import StreamingTranscriber
+from services.ws_channel import (
+    ChannelClosed,
+    WebSocketChannel,
+    WS_CLOSE_NOT_FOUND,
+    WS_CLOSE_TOO_BIG
+)
+
+logger = logging.getLogger(__name__)
+
+
+class InterviewChannel(WebSocketChannel):
+    """
+    One interview session over a WebSocket
+
+    Client -> server:
+    - Binary frames: answer audio, buffered until the answer is submitted
+      and then transcribed in one piece
+    - {"type": "pcm_start", "sample_rate": 16000}: from now on binary
+      frames are PCM s16le mono, transcribed while the user speaks (see
+      StreamingTranscriber) instead of after the answer is submitted
+    - {"type": "answer", "message": "...", "audio_format": "opus"}: submit
+      the answer (text and/or audio); the first answer of a session just
+      starts it. audio_format (optional) switches the voice output format
+      from this turn on
+    - {"type": "reset_audio"}: drop the answer audio received so far
+    - {"type": "ping"} / {"type": "pong"}
+
+    Server -> client:
+    - {"type": "transcript", "text": ..., "final": false}: PCM answers
+      only, while the user speaks; text is the answer so far and may
+      still change
+    - As each turn stage finishes (see TurnTrace):
+      - {"type": "transcript", "text": ..., "final": true}
+      - {"type": "question", "question": {...}}
+      - {"type": "feedback", "feedback": {...}}
+    - {"type": "audio_start", "format": "wav"|"opus"|"mp3"|"pcm"}, then
+      binary frames of at most WS_AUDIO_CHUNK_BYTES as each sentence is
+      synthesized (together one stream, see StreamEncoder), then
+      {"type": "audio_end"} when the tts stage finishes
+    - {"type": "turn_complete", ...InterviewMessageResponse without audio}
+    - {"type": "error", "status": 400|404|409|500, "detail": ...}
+    - {"type": "ping"} every WS_HEARTBEAT_INTERVAL seconds
+
+    Outgoing frames go through the WebSocketChannel outbox: when it is
+    full the turn waits (see WebSocketChannel for timeouts).
+    """
+
+    name = "Interview channel"
+
+    def __init__(self, websocket: WebSocket, session_id: str, service):
+        super().__init__(websocket, session_id)
+        self.session_id = session_id
+        self.service = service
+
+        self._audio = bytearray()
+        self._audio_format = AudioFormat.WAV
+        self._audio_started = False
+        self._turn: Optional[asyncio.Task] = None
+
+        # PCM answers (after pcm_start): transcribed as they arrive
+        self._sample_rate: Optional[int] = None
+        self._transcriber: Optional[StreamingTranscriber] = None
+        self._transcriber_lock = asyncio.Lock()  # One decode at a time
+        self._wakeup = asyncio.Event()
+        self._decoder: Optional[asyncio.Task] = None
+
+    async def _on_open(self) -> bool:
+        session = self.service.get_session(self.session_id)
+        if session is None:
+            await self.websocket.close(code=WS_CLOSE_NOT_FOUND, reason="Session not found")
+            return False
+        self._audio_format = session.config.audio_format
+        return True
+
+    def _pending_tasks(self) -> Tuple[Optional[asyncio.Task], ...]:
+        return (self._turn, self._decoder)
+
+    # ------------------------------------------------------------------
+    # Inbound
+    # ------------------------------------------------------------------
+
+    async def _on_binary(self, chunk: bytes):
+        if self._transcriber is not None:
+            received = 2 * self._transcriber.received_samples
+        else:
+            received = len(self._audio)
+        if received + len(chunk) > self.settings.WS_MAX_AUDIO_BYTES:
+            await self._abort(WS_CLOSE_TOO_BIG, "Answer audio too large")
+            return
+
+        if self._transcriber is not None:
+            self._transcriber.push(chunk)
+            self._wakeup.set()
+        else:
+            self._audio.extend(chunk)
+
+    async def _on_message(self, kind: str, control: dict):
+        if kind == "reset_audio":
+            self._audio.clear()
+            if self._transcriber is not None:
+                self._transcriber = self._new_transcriber()
+        elif kind == "pcm_start":
+            try:
+                sample_rate = int(control.get("sample_rate") or ASR_SAMPLE_RATE)
+            except (ValueError, TypeError):
+                sample_rate = 0
+            if not 8000 <= sample_rate <= 192000:
+                await self._send_error(400, f"Unsupported sample rate: {control.get('sample_rate')}")
+                return
+            if self._audio or (self._transcriber is not None and self._transcriber.received_samples):
+                await self._send_error(400, "pcm_start must precede the audio of an answer")
+                return
+            self._sample_rate = sample_rate
+            self._transcriber = self._new_transcriber()
+            if self._decoder is None:
+                self._decoder = asyncio.create_task(self._decode_loop())
+        elif kind == "answer":
+            if self._turn is not None and not self._turn.done():
+                await self._send_error(409, "A turn is already in progress")
+                return
+            audio_format = None
+            if control.get("audio_format") is not None:
+                try:
+                    audio_format = AudioFormat(control["audio_format"])
+                except ValueError:
+                    audio_format = None
+                if audio_format not in supported_output_formats():
+                    await self._send_error(400, f"Unsupported audio format: {control['audio_format']}")
+                    return
+                self._audio_format = audio_format
+            request = InterviewMessageRequest(
+                session_id=self.session_id,
+                message=str(control.get("message") or ""),
+                audio_base64=base64.b64encode(self._audio).decode("ascii") if self._audio else None,
+                audio_format=audio_format
+            )
+            self._audio = bytearray()
+            # The next answer's audio goes to a fresh transcriber
+            transcriber = self._transcriber
+            if transcriber is not None:
+                self._transcriber = self._new_transcriber()
+            self._turn = asyncio.create_task(self._run_turn(request, transcriber))
+        else:
+            await self._send_error(400, f"Unknown message type: {kind}")
+
+    # ------------------------------------------------------------------
+    # Streaming transcription
+    # ------------------------------------------------------------------
+
+    def _new_transcriber(self) -> StreamingTranscriber:
+        return StreamingTranscriber(
+            self.service.voice_service,
+            TranscriptionRequest(language="en", word_timestamps=False),
+            sample_rate=self._sample_rate,
+            endpoint_ms=self.settings.ASR_STREAM_ENDPOINT_MS,
+            partial_interval_ms=self.settings.ASR_STREAM_PARTIAL_INTERVAL_MS
+        )
+
+    async def _decode_loop(self):
+        """Send the answer transcribed so far whenever a decode is due"""
+        while not self._closed:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                while True:
+                    async with self._transcriber_lock:
+                        transcriber = self._transcriber
+                        events = await transcriber.poll()
+                    if not events:
+                        break
+                    if transcriber is not self._transcriber:
+                        # The answer was submitted meanwhile
+                        continue
+                    texts = [final["text"] for final in transcriber.finals]
+                    if events[-1]["type"] == "partial":
+                        texts.append(events[-1]["text"])
+                    text = " ".join(text for text in texts if text)
+                    await self._send_json({"type": "transcript", "text": text, "final": False})
+            except ChannelClosed:
+                return
+            except Exception as e:
+                logger.error(f"Interview channel transcription failed: {e}")
+                await self._send_error(500, str(e))
+
+    async def _finish_transcript(self, transcriber: StreamingTranscriber, request: InterviewMessageRequest):
+        """Replace the answer text with the transcript of its PCM audio"""
+        if not transcriber.received_samples:
+            return
+        try:
+            async with self._transcriber_lock:
+                events = await transcriber.finish()
+        except Exception as e:
+            # Like a failed transcription of uploaded audio: keep the text
+            logger.error(f"Interview channel transcription failed: {e}")
+            return
+        request.message = events[-1]["text"]
+
+    # ------------------------------------------------------------------
+    # Turns
+    # ------------------------------------------------------------------
+
+    async def _run_turn(self, request: InterviewMessageRequest, transcriber: Optional[StreamingTranscriber] = None):
+        self._audio_started = False
+        try:
+            if transcriber is not None:
+                await self._finish_transcript(transcriber, request)
+            response = await self.service.process_message(
+                request,
+                on_stage=self._on_stage,
+                on_audio=self._on_audio
+            )
+        except ChannelClosed:
+            return
+        except SessionConflictError as e:
+            await self._send_error(409, str(e))
+            return
+        except ValueError as e:
+            await self._send_error(404, str(e))
+            return
+        except Exception as e:
+            logger.error(f"Interview channel turn failed: {e}")
+            await self._send_error(500, str(e))
+            return
+
+        try:
+            await self._send_json({
+                "type": "turn_complete",
+                **response.dict(exclude={"audio_base64"})
+            })
+        except ChannelClosed:
+            pass
+
+    async def _on_stage(self, name: str, result: Any):
+        """Stream each stage result as soon as it is ready"""
+        if name == "transcribe":
+            await self._send_json({"type": "transcript", "text": result, "final": True})
+        elif name == "next_question":
+            await self._send_json({"type": "question", "question": result.dict()})
+        elif name == "feedback":
+            await self._send_json({"type": "feedback", "feedback": result.dict()})
+        elif name == "tts" and self._audio_started:
+            self._audio_started = False
+            await self._send_json({"type": "audio_end"})
+
+    async def _on_audio(self, audio: bytes):
+        """Send synthesized speech as it arrives (between audio_start and the tts stage end)"""
+        if not self._audio_started:
+            self._audio_started = True
+            await self._send_json({"type": "audio_start", "format": self._audio_format.value})
+        chunk_size = self.settings.WS_AUDIO_CHUNK_BYTES
+        for offset in range(0, len(audio), chunk_size):
+            await self._enqueue(audio[offset:offset + chunk_size])
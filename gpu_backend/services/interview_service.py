@@ -4,12 +4,16 @@ GPU-accelerated interview service with advanced features
 """
 
 import asyncio
+import base64
 import logging
 import time
 import json
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Deque
+from array import array
+from datetime import datetime, timezone
 import uuid
+import random
+from collections import deque
 
 from config import get_settings, get_model_config, is_gpu_available
 from models.schemas import (
@@ -28,12 +32,26 @@ from models.schemas import (
     TranscriptionRequest,
     TTSRequest,
     VoicePreset,
-    EmotionStyle
+    EmotionStyle,
+    AudioFormat
 )
 from services.prerag_service import get_prerag_service
 from services.matchwise_service import get_matchwise_service
 from services.voice_service import get_voice_service, get_voice_service_with_fallback
 from services.embedding_service import get_embedding_service
+from services.answer_scoring import get_answer_scoring_engine
+from services.feedback_aggregates import FeedbackAggregates
+from services.question_registry import (
+    GENERAL_SOURCE,
+    PERSONALIZED_SOURCE,
+    general_ref,
+    get_question_registry,
+    personalized_ref,
+    question_ref
+)
+from services.session_store import get_session_store, pack_state, unpack_state
+from services.session_lifecycle import SessionLifecycleManager
+from services.turn_pipeline import AudioListener, TurnTrace, StageListener
 
 logger = logging.getLogger(__name__)
 
@@ -89,8 +107,37 @@ Generate a follow-up question that digs deeper into their experience.
 }
 
 
+# Spoken lead-ins before a question
+FIRST_QUESTION_PREFIX = "Let's begin the interview. "
+NEXT_QUESTION_PREFIX = "Good answer. Here's the next question: "
+
+# Spoken after the last answer
+CLOSING_MESSAGE = "Thank you for completing the interview! Here's your overall feedback."
+
+# Asked when no stored question is left
+FALLBACK_QUESTION = "Tell me about a challenging project you've worked on and how you handled it."
+
+
 class InterviewSession:
-    """Represents an active interview session"""
+    """
+    Represents an active interview session
+    
+    Kept compact, since every turn loads and saves the whole session:
+    questions are shared InterviewQuestion objects from the question
+    registry (answers and the current question refer to them instead of
+    holding copies), answers are stored column-wise, and only the last
+    few per-answer feedbacks are kept; session scores live in the running
+    aggregates. Full models (responses, to_dict) are built at the API
+    boundary only.
+    """
+    
+    __slots__ = (
+        "session_id", "user_id", "config", "rag_id", "started_at",
+        "questions_asked", "answered_questions", "answer_texts", "answer_times",
+        "feedback_history", "aggregates",
+        "current_question_index", "current_category_index", "current_question",
+        "plan", "state", "version"
+    )
     
     def __init__(
         self,
@@ -106,14 +153,149 @@ class InterviewSession:
         
         self.started_at = datetime.utcnow()
         self.questions_asked: List[InterviewQuestion] = []
-        self.responses: List[Dict[str, Any]] = []
-        self.feedback_history: List[InterviewFeedback] = []
+        
+        # Answers, one entry per column each: question answered (a reference,
+        # not a copy), transcribed text, and UTC epoch seconds
+        self.answered_questions: List[Optional[InterviewQuestion]] = []
+        self.answer_texts: List[str] = []
+        self.answer_times = array("d")
+        
+        self.feedback_history: Deque[InterviewFeedback] = deque(
+            maxlen=get_settings().SESSION_FEEDBACK_HISTORY
+        )
+        self.aggregates = FeedbackAggregates()
         
         self.current_question_index = 0
         self.current_category_index = 0
         self.current_question: Optional[InterviewQuestion] = None
         
+        # Questions still to ask, in order (see GPUInterviewService._build_question_plan)
+        self.plan: Deque[InterviewQuestion] = deque()
+        
         self.state = "started"  # started, in_progress, feedback, completed
+        self.version = 0  # Session store version this state was loaded at
+    
+    @property
+    def response_count(self) -> int:
+        return len(self.answer_texts)
+    
+    @property
+    def responses(self) -> List[Dict[str, Any]]:
+        """Answers as {"question", "response", "timestamp"} dicts (built on access)"""
+        return [
+            {
+                "question": question.dict() if question else None,
+                "response": text,
+                "timestamp": datetime.utcfromtimestamp(timestamp).isoformat()
+            }
+            for question, text, timestamp in zip(self.answered_questions, self.answer_texts, self.answer_times)
+        ]
+    
+    def record_response(self, question: Optional[InterviewQuestion], response: str):
+        """Append an answer to a question"""
+        self.answered_questions.append(question)
+        self.answer_texts.append(response)
+        self.answer_times.append(time.time())
+    
+    def record_feedback(self, feedback: InterviewFeedback, question: Optional[InterviewQuestion]):
+        """Append an answer's feedback and update the running aggregates"""
+        self.feedback_history.append(feedback)
+        self.aggregates.add(feedback, question.category.value if question else None)
+    
+    def to_state(self) -> dict:
+        """
+        Compact serializable state for the session store
+        
+        Bank questions are stored as registry references ("g:<id>",
+        "p:<rag_id>:<id>") and rebuilt from the shared bank on load; only
+        generated questions are stored inline, and answers and the current
+        question refer to those by ID. Answers are stored column-wise and
+        default-valued fields are omitted.
+        """
+        asked_ids = {q.id for q in self.questions_asked}
+        
+        def encode(question: InterviewQuestion):
+            return question_ref(question) or question.dict(exclude_defaults=True)
+        
+        def encode_reference(question: Optional[InterviewQuestion]):
+            if question is None:
+                return None
+            ref = question_ref(question)
+            if ref is not None:
+                return ref
+            return question.id if question.id in asked_ids else question.dict(exclude_defaults=True)
+        
+        return {
+            "id": self.session_id,
+            "u": self.user_id,
+            "c": self.config.dict(exclude_defaults=True),
+            "r": self.rag_id,
+            "t": self.started_at.replace(tzinfo=timezone.utc).timestamp(),
+            "q": [encode(q) for q in self.questions_asked],
+            "p": [encode(q) for q in self.plan],
+            "a": {
+                "q": [encode_reference(q) for q in self.answered_questions],
+                "r": self.answer_texts,
+                "t": self.answer_times.tolist()
+            },
+            "f": [f.dict(exclude_defaults=True) for f in self.feedback_history],
+            "g": self.aggregates.to_state(),
+            "qi": self.current_question_index,
+            "ci": self.current_category_index,
+            "cq": encode_reference(self.current_question),
+            "s": self.state
+        }
+    
+    @classmethod
+    def from_state(cls, state: dict, version: int = 0) -> "InterviewSession":
+        """Rebuild a session from to_state() output"""
+        registry = get_question_registry()
+        session = cls(
+            session_id=state["id"],
+            user_id=state["u"],
+            config=InterviewConfig(**state["c"]),
+            rag_id=state["r"]
+        )
+        session.started_at = datetime.utcfromtimestamp(state["t"])
+        answers = state["a"]
+        
+        # Every bank reference in the state, resolved in one pass
+        refs = [
+            value for value in (*state["q"], *state["p"], *answers["q"], state["cq"])
+            if isinstance(value, str) and registry.is_ref(value)
+        ]
+        resolved = registry.resolve(refs)
+        
+        def load(value) -> Optional[InterviewQuestion]:
+            if isinstance(value, str):
+                return resolved.get(value)
+            return InterviewQuestion(**value)
+        
+        session.questions_asked = [q for q in map(load, state["q"]) if q is not None]
+        session.plan = deque(q for q in map(load, state["p"]) if q is not None)
+        session.feedback_history.extend(InterviewFeedback(**f) for f in state["f"])
+        session.aggregates = FeedbackAggregates.from_state(state["g"])
+        session.current_question_index = state["qi"]
+        session.current_category_index = state["ci"]
+        session.state = state["s"]
+        session.version = version
+        
+        # Generated questions are referred to by the ID of their asked copy
+        by_id = {q.id: q for q in session.questions_asked}
+        
+        def resolve(value) -> Optional[InterviewQuestion]:
+            if value is None:
+                return None
+            if isinstance(value, str) and not registry.is_ref(value):
+                return by_id.get(value)
+            return load(value)
+        
+        session.current_question = resolve(state["cq"])
+        session.answered_questions = [resolve(q) for q in answers["q"]]
+        session.answer_texts = answers["r"]
+        session.answer_times.extend(answers["t"])
+        
+        return session
     
     def to_dict(self) -> dict:
         return {
@@ -124,10 +306,34 @@ class InterviewSession:
             "started_at": self.started_at.isoformat(),
             "current_question_index": self.current_question_index,
             "total_questions": len(self.questions_asked),
-            "state": self.state
+            "planned_questions": len(self.plan),
+            "state": self.state,
+            "scores": self.aggregates.summary()
         }
 
 
+class PrefetchedTurn:
+    """Next question and its voice response, prepared ahead of the turn"""
+    
+    __slots__ = ("key", "prefix", "selection", "audio", "loop", "created", "tts_started", "tts_finished")
+    
+    def __init__(self, key: tuple, prefix: str):
+        self.key = key
+        self.prefix = prefix
+        self.selection: Optional[asyncio.Task] = None
+        self.audio: Optional[asyncio.Task] = None
+        self.loop = asyncio.get_running_loop()
+        self.created = time.perf_counter()
+        self.tts_started: Optional[float] = None
+        self.tts_finished: Optional[float] = None
+    
+    def cancel(self):
+        """Cancel pending work (event loop thread only)"""
+        for task in (self.selection, self.audio):
+            if task is not None and not task.done():
+                task.cancel()
+
+
 class GPUInterviewService:
     """
     GPU-accelerated interview service
@@ -137,7 +343,7 @@ class GPUInterviewService:
     - Personalized questions from MatchWise integration
     - Pre-trained RAG for users without resumes
     - Real-time feedback generation
-    - Session management
+    - Session management (shared across workers via the session store)
     """
     
     def __init__(self):
@@ -145,8 +351,32 @@ class GPUInterviewService:
         self.prerag_service = get_prerag_service()
         self.matchwise_service = get_matchwise_service()
         self.voice_service = get_voice_service_with_fallback()
+        self.scoring_engine = get_answer_scoring_engine()
+        
+        self.session_store = get_session_store()
+        self.lifecycle = SessionLifecycleManager(
+            self.session_store,
+            snapshot_fn=self._eviction_snapshot,
+            on_evict=self._on_session_evicted
+        )
+        
+        # Session states refer to bank questions; any worker reads them back
+        registry = get_question_registry()
+        registry.register_source(
+            GENERAL_SOURCE,
+            lambda scope, question_ids: self.prerag_service.get_questions_by_id(question_ids)
+        )
+        registry.register_source(PERSONALIZED_SOURCE, self.matchwise_service.get_personalized_questions_by_id)
         
-        self.active_sessions: Dict[str, InterviewSession] = {}
+        # Per-worker speculative TTS of each session's next question
+        self.prefetches: Dict[str, PrefetchedTurn] = {}
+        self.prefetch_stats = {
+            "started": 0,
+            "hits": 0,
+            "misses": 0,
+            "discarded": 0,
+            "latency_saved_ms": 0.0
+        }
         self.gpu_mode = is_gpu_available()
         
         logger.info(f"GPUInterviewService initialized (GPU mode: {self.gpu_mode})")
@@ -184,8 +414,17 @@ class GPUInterviewService:
             config=request.config,
             rag_id=rag_id or request.config.rag_id
         )
+        session.plan = self._build_question_plan(session)
+        
+        self.lifecycle.make_room()
+        session.version = self.session_store.create(
+            session_id,
+            pack_state(session.to_state()),
+            deadline=self.lifecycle.deadline_for(session.config, session.started_at)
+        )
         
-        self.active_sessions[session_id] = session
+        # Prepare the first question's audio before the client asks for it
+        self._start_prefetch(session, 0, FIRST_QUESTION_PREFIX)
         
         return InterviewSessionResponse(
             session_id=session_id,
@@ -200,134 +439,266 @@ class GPUInterviewService:
     
     async def process_message(
         self,
-        request: InterviewMessageRequest
+        request: InterviewMessageRequest,
+        on_stage: Optional[StageListener] = None,
+        on_audio: Optional[AudioListener] = None
     ) -> InterviewMessageResponse:
-        """Process an interview message/response"""
+        """
+        Process an interview message/response
+        
+        The session is loaded from the shared store and written back with a
+        version check, so a turn may land on any worker. Raises
+        SessionConflictError if another turn updated the session meanwhile.
         
-        session = self.active_sessions.get(request.session_id)
+        Args:
+            request: Message content including session_id and text/audio
+            on_stage: Awaited with (stage name, result) as each turn stage
+                finishes ("transcribe", "feedback", "next_question", "tts")
+            on_audio: Awaited with the voice response piece by piece, in
+                the session's audio format, as sentences are synthesized;
+                the response then carries no audio_base64
+        """
+        
+        session = self._load_session(request.session_id)
         if not session:
             raise ValueError(f"Session not found: {request.session_id}")
         
-        message = request.message.strip()
-        audio_response = None
-        
-        # Handle voice input if provided
-        if request.audio_base64:
-            try:
-                import base64
-                audio_data = base64.b64decode(request.audio_base64)
-                transcription = await self.voice_service.transcribe(
-                    audio_data,
-                    TranscriptionRequest(language="en")
-                )
-                message = transcription.text
-            except Exception as e:
-                logger.error(f"Voice transcription failed: {e}")
+        response = await self._process_turn(session, request, on_stage, on_audio)
+        self._save_session(session)
+        return response
+    
+    async def _process_turn(
+        self,
+        session: InterviewSession,
+        request: InterviewMessageRequest,
+        on_stage: Optional[StageListener] = None,
+        on_audio: Optional[AudioListener] = None
+    ) -> InterviewMessageResponse:
+        """
+        Advance a loaded session by one message
         
-        # Process based on session state
-        if session.state == "started":
-            # Get first question
-            question = await self._get_next_question(session)
-            session.current_question = question
-            session.state = "in_progress"
-            
-            response_text = f"Let's begin the interview. {question.question}"
-            
-            # Generate voice response if enabled
-            if session.config.use_voice:
-                audio_response = await self._generate_voice_response(
-                    response_text,
-                    session.config.voice_preset
-                )
-            
+        The turn runs as a dependency graph (see TurnTrace): answer
+        transcription and scoring form one chain, next-question retrieval
+        and its TTS another, so they overlap instead of running in sequence.
+        """
+        if session.state not in ("started", "in_progress"):
             return InterviewMessageResponse(
                 session_id=session.session_id,
-                response=response_text,
-                audio_base64=audio_response,
-                question=question,
+                response="Interview session has ended.",
+                audio_base64=None,
+                question=None,
                 feedback=None,
-                session_complete=False,
-                next_action="continue"
+                session_complete=True,
+                next_action="complete"
             )
         
-        elif session.state == "in_progress":
-            # Record response
-            session.responses.append({
-                "question": session.current_question.dict() if session.current_question else None,
-                "response": message,
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            
-            # Generate feedback for current answer
-            feedback = await self._generate_feedback(
-                session.current_question,
-                message
-            )
-            session.feedback_history.append(feedback)
-            
-            # Check if we should continue or end
-            if session.current_question_index >= session.config.max_questions - 1:
-                # End of interview
-                session.state = "completed"
-                session_feedback = self._calculate_session_feedback(session)
-                
-                response_text = "Thank you for completing the interview! Here's your overall feedback."
-                
-                if session.config.use_voice:
-                    audio_response = await self._generate_voice_response(
-                        response_text,
-                        session.config.voice_preset
+        if request.audio_format is not None:
+            session.config.audio_format = request.audio_format
+        
+        trace = TurnTrace(on_stage, on_audio)
+        try:
+            if session.state == "started":
+                response = await self._first_turn(session, trace)
+            else:
+                response = await self._answer_turn(session, request, trace)
+        except BaseException:
+            trace.cancel()
+            raise
+        
+        # Speculatively prepare the following question while the user answers
+        if response.question is not None and not response.session_complete \
+                and session.current_question_index < session.config.max_questions - 1:
+            self._start_prefetch(session, session.current_question_index + 1, NEXT_QUESTION_PREFIX)
+        
+        if response.audio_base64:
+            response.audio_format = session.config.audio_format
+        
+        critical_ms, critical_path = trace.critical_path()
+        response.stage_timings_ms = trace.timings_ms()
+        response.critical_path_ms = critical_ms
+        response.critical_path = critical_path
+        logger.debug(
+            f"Turn {session.session_id}: {trace.elapsed_ms():.1f}ms "
+            f"(critical path {critical_ms:.1f}ms via {' -> '.join(critical_path)})"
+        )
+        return response
+    
+    async def _first_turn(
+        self,
+        session: InterviewSession,
+        trace: TurnTrace
+    ) -> InterviewMessageResponse:
+        """Ask the first question (next_question -> tts)"""
+        question_task, voice_task = self._next_question_stages(session, trace, FIRST_QUESTION_PREFIX)
+        
+        question = await question_task
+        session.current_question = question
+        session.state = "in_progress"
+        
+        return InterviewMessageResponse(
+            session_id=session.session_id,
+            response=FIRST_QUESTION_PREFIX + question.question,
+            audio_base64=await voice_task if voice_task else None,
+            question=question,
+            feedback=None,
+            session_complete=False,
+            next_action="continue"
+        )
+    
+    async def _answer_turn(
+        self,
+        session: InterviewSession,
+        request: InterviewMessageRequest,
+        trace: TurnTrace
+    ) -> InterviewMessageResponse:
+        """
+        Score an answer and move on
+        
+        Graph: transcribe -> feedback, and independently
+        next_question -> tts (or just tts of the closing line on the last
+        question).
+        """
+        answered = session.current_question
+        is_last = session.current_question_index >= session.config.max_questions - 1
+        
+        message_task = trace.stage("transcribe", lambda: self._transcribe_message(request))
+        feedback_task = trace.stage(
+            "feedback",
+            lambda message: self._generate_feedback(answered, message),
+            message_task
+        )
+        
+        question_task = None
+        voice_task = None
+        if is_last:
+            response_text = CLOSING_MESSAGE
+            if session.config.use_voice:
+                voice_task = trace.stage(
+                    "tts",
+                    lambda: self._generate_voice_response(
+                        response_text, session.config.voice_preset,
+                        audio_format=session.config.audio_format, on_audio=trace.on_audio
                     )
-                
-                return InterviewMessageResponse(
-                    session_id=session.session_id,
-                    response=response_text,
-                    audio_base64=audio_response,
-                    question=None,
-                    feedback={"question_feedback": feedback.dict(), "session_feedback": session_feedback.dict()},
-                    session_complete=True,
-                    next_action="complete"
                 )
-            
-            # Get next question
+        else:
+            # Next-question retrieval does not depend on the feedback
             session.current_question_index += 1
-            next_question = await self._get_next_question(session)
-            session.current_question = next_question
-            
-            response_text = f"Good answer. Here's the next question: {next_question.question}"
-            
-            if session.config.use_voice:
-                audio_response = await self._generate_voice_response(
-                    response_text,
-                    session.config.voice_preset
-                )
+            question_task, voice_task = self._next_question_stages(session, trace, NEXT_QUESTION_PREFIX)
+        
+        # Record response
+        message = await message_task
+        session.record_response(answered, message)
+        
+        # Feedback for current answer
+        feedback = await feedback_task
+        session.record_feedback(feedback, answered)
+        
+        if is_last:
+            # End of interview
+            session.state = "completed"
+            session_feedback = self._calculate_session_feedback(session)
             
             return InterviewMessageResponse(
                 session_id=session.session_id,
                 response=response_text,
-                audio_base64=audio_response,
-                question=next_question,
-                feedback={"question_feedback": feedback.dict()},
-                session_complete=False,
-                next_action="continue"
-            )
-        
-        else:
-            return InterviewMessageResponse(
-                session_id=session.session_id,
-                response="Interview session has ended.",
-                audio_base64=None,
+                audio_base64=await voice_task if voice_task else None,
                 question=None,
-                feedback=None,
+                feedback={"question_feedback": feedback.dict(), "session_feedback": session_feedback.dict()},
                 session_complete=True,
                 next_action="complete"
             )
+        
+        next_question = await question_task
+        session.current_question = next_question
+        
+        return InterviewMessageResponse(
+            session_id=session.session_id,
+            response=NEXT_QUESTION_PREFIX + next_question.question,
+            audio_base64=await voice_task if voice_task else None,
+            question=next_question,
+            feedback={"question_feedback": feedback.dict()},
+            session_complete=False,
+            next_action="continue"
+        )
+    
+    def _next_question_stages(
+        self,
+        session: InterviewSession,
+        trace: TurnTrace,
+        prefix: str
+    ) -> Tuple[asyncio.Task, Optional[asyncio.Task]]:
+        """next_question -> tts stages, served from the prefetch when it is still valid"""
+        prefetch = self._take_prefetch(session, session.current_question_index)
+        
+        if prefetch is not None:
+            question_task = trace.stage(
+                "next_question",
+                lambda: self._use_prefetched_question(session, prefetch)
+            )
+            voice_task = trace.stage(
+                "tts",
+                lambda q: self._use_prefetched_audio(prefetch, trace.on_audio),
+                question_task
+            )
+            return question_task, voice_task
+        
+        question_task = trace.stage("next_question", lambda: self._get_next_question(session))
+        voice_task = None
+        if session.config.use_voice:
+            # Generate voice response if enabled
+            voice_task = trace.stage(
+                "tts",
+                lambda q: self._generate_voice_response(
+                    q.question, session.config.voice_preset, prefix, session.config.audio_format, trace.on_audio
+                ),
+                question_task
+            )
+        return question_task, voice_task
+    
+    async def _transcribe_message(self, request: InterviewMessageRequest) -> str:
+        """Message text, transcribed from audio when provided"""
+        message = request.message.strip()
+        
+        # Handle voice input if provided
+        if request.audio_base64:
+            try:
+                import base64
+                audio_data = base64.b64decode(request.audio_base64)
+                transcription = await self.voice_service.transcribe(
+                    audio_data,
+                    TranscriptionRequest(language="en", word_timestamps=False)
+                )
+                message = transcription.text
+            except Exception as e:
+                logger.error(f"Voice transcription failed: {e}")
+        
+        return message
     
     async def _get_next_question(
         self,
         session: InterviewSession
     ) -> InterviewQuestion:
         """Get the next question for the session"""
+        question, source = await self._choose_next_question(session, session.current_question_index)
+        return self._apply_next_question(session, question, source)
+    
+    async def _choose_next_question(
+        self,
+        session: InterviewSession,
+        question_index: int
+    ) -> Tuple[InterviewQuestion, str]:
+        """
+        Pick the next question without changing the session
+        
+        Takes the head of the session plan; sessions without a plan (or
+        whose plan ran out) fall back to a per-turn retrieval.
+        
+        Returns:
+            (question, source) where source is "planned", "personalized",
+            "general" or "fallback"; pass both to _apply_next_question
+        """
+        if session.plan:
+            return session.plan[0], "planned"
         
         # Determine current category
         categories = session.config.categories
@@ -348,8 +719,7 @@ class GPUInterviewService:
                 )
             )
             if question:
-                session.questions_asked.append(question)
-                return question
+                return question, "personalized"
         
         # Fall back to pre-RAG
         question = self.prerag_service.get_random_question(
@@ -359,19 +729,297 @@ class GPUInterviewService:
         )
         
         if question:
-            session.questions_asked.append(question)
-            # Rotate category for next question
-            session.current_category_index += 1
-            return question
+            return question, "general"
         
         # Ultimate fallback - generic question
         return InterviewQuestion(
-            id=f"fallback_{session.current_question_index}",
-            question="Tell me about a challenging project you've worked on and how you handled it.",
+            id=f"fallback_{question_index}",
+            question=FALLBACK_QUESTION,
             category=category,
             difficulty=session.config.difficulty,
             tags=["general", "behavioral"]
+        ), "fallback"
+    
+    def _apply_next_question(
+        self,
+        session: InterviewSession,
+        question: InterviewQuestion,
+        source: str
+    ) -> InterviewQuestion:
+        """Record a question chosen by _choose_next_question (returns the session's copy)"""
+        if source == "planned":
+            session.plan.popleft()
+        elif source == "fallback":
+            return question
+        elif source == "personalized":
+            question = get_question_registry().intern(question, personalized_ref(session.rag_id, question.id))
+        else:
+            question = get_question_registry().intern(question, general_ref(question.id))
+        
+        session.questions_asked.append(question)
+        if source == "general":
+            # Rotate category for next question
+            session.current_category_index += 1
+        return question
+    
+    def _build_question_plan(self, session: InterviewSession) -> Deque[InterviewQuestion]:
+        """
+        Ordered questions for the rest of the session
+        
+        Each category's questions are read once per source (personalized
+        RAG first, then the general bank) and shuffled; categories rotate
+        per question. Questions at the configured difficulty come first,
+        other difficulties are used only once those run out, and no
+        question (by ID or text) is asked twice.
+        """
+        config = session.config
+        categories = config.categories
+        start = len(session.questions_asked)
+        
+        seen_ids = {q.id for q in session.questions_asked}
+        seen_texts = {self._question_text_key(q.question) for q in session.questions_asked}
+        
+        # One bulk read per source and category; (question, bank reference)
+        pools: Dict[InterviewCategory, Deque[Tuple[InterviewQuestion, str]]] = {}
+        for category in dict.fromkeys(categories):
+            candidates = []
+            if session.rag_id:
+                personalized = self.matchwise_service.get_personalized_questions(session.rag_id, category)
+                random.shuffle(personalized)
+                candidates.extend((q, personalized_ref(session.rag_id, q.id)) for q in personalized)
+            general = self.prerag_service.get_questions(category)
+            random.shuffle(general)
+            candidates.extend((q, general_ref(q.id)) for q in general)
+            
+            # Stable sort keeps personalized ahead of general within a difficulty
+            candidates.sort(key=lambda candidate: candidate[0].difficulty != config.difficulty)
+            pools[category] = deque(candidates)
+        
+        registry = get_question_registry()
+        plan: Deque[InterviewQuestion] = deque()
+        for slot in range(start, config.max_questions):
+            category = categories[slot % len(categories)]
+            pool = pools[category]
+            
+            question = ref = None
+            while pool:
+                candidate, candidate_ref = pool.popleft()
+                text_key = self._question_text_key(candidate.question)
+                if candidate.id in seen_ids or text_key in seen_texts:
+                    continue
+                seen_ids.add(candidate.id)
+                seen_texts.add(text_key)
+                question, ref = candidate, candidate_ref
+                break
+            
+            if question is None:
+                # Ultimate fallback - generic question
+                question = InterviewQuestion(
+                    id=f"fallback_{slot}",
+                    question=FALLBACK_QUESTION,
+                    category=category,
+                    difficulty=config.difficulty,
+                    tags=["general", "behavioral"]
+                )
+            plan.append(registry.intern(question, ref))
+        
+        return plan
+    
+    @staticmethod
+    def _question_text_key(text: str) -> str:
+        return " ".join(text.casefold().split())
+    
+    async def replan_session(
+        self,
+        session_id: str,
+        difficulty: Optional[InterviewDifficulty] = None,
+        categories: Optional[List[InterviewCategory]] = None
+    ) -> Optional[InterviewSession]:
+        """
+        Rebuild the remaining question plan (e.g. to adapt difficulty)
+        
+        Args:
+            session_id: Session to re-plan
+            difficulty: New target difficulty
+            categories: New category rotation
+            
+        Returns:
+            The updated session, or None if it does not exist
+        """
+        session = self._load_session(session_id)
+        if not session:
+            return None
+        
+        if difficulty:
+            session.config.difficulty = difficulty
+        if categories:
+            session.config.categories = categories
+        
+        session.plan = self._build_question_plan(session)
+        self._discard_prefetch(session_id)
+        self._save_session(session)
+        
+        # Re-prepare the next question against the new plan
+        if session.state == "started":
+            self._start_prefetch(session, 0, FIRST_QUESTION_PREFIX)
+        elif session.state == "in_progress" and \
+                session.current_question_index < session.config.max_questions - 1:
+            self._start_prefetch(session, session.current_question_index + 1, NEXT_QUESTION_PREFIX)
+        
+        return session
+    
+    # ------------------------------------------------------------------
+    # Speculative next-question TTS
+    # ------------------------------------------------------------------
+    
+    def _prefetch_key(self, session: InterviewSession, question_index: int) -> tuple:
+        """Session state a prefetched question was chosen from"""
+        return (
+            question_index,
+            session.plan[0].id if session.plan else None,
+            len(session.questions_asked),
+            session.current_category_index,
+            session.rag_id,
+            session.config.difficulty.value,
+            session.config.voice_preset.value,
+            session.config.audio_format.value
+        )
+    
+    def _start_prefetch(
+        self,
+        session: InterviewSession,
+        question_index: int,
+        prefix: str
+    ):
+        """
+        Choose the question for question_index and synthesize its audio in
+        the background, while the user is still answering
+        """
+        if not (session.config.use_voice and self.gpu_mode):
+            return
+        
+        self._discard_prefetch(session.session_id)
+        self._prune_prefetches()
+        
+        # The turn works on its own copy of the session, which is no longer
+        # modified once the response is built
+        prefetch = PrefetchedTurn(self._prefetch_key(session, question_index), prefix)
+        prefetch.selection = asyncio.ensure_future(
+            self._choose_next_question(session, question_index)
+        )
+        prefetch.audio = asyncio.ensure_future(
+            self._prefetch_audio(prefetch, session.config.voice_preset, session.config.audio_format)
         )
+        
+        self.prefetches[session.session_id] = prefetch
+        self.prefetch_stats["started"] += 1
+    
+    async def _prefetch_audio(
+        self,
+        prefetch: "PrefetchedTurn",
+        voice_preset: VoicePreset,
+        audio_format: AudioFormat
+    ) -> Optional[str]:
+        question, _ = await prefetch.selection
+        prefetch.tts_started = time.perf_counter()
+        try:
+            return await self._generate_voice_response(
+                question.question, voice_preset, prefetch.prefix, audio_format
+            )
+        finally:
+            prefetch.tts_finished = time.perf_counter()
+    
+    def _take_prefetch(
+        self,
+        session: InterviewSession,
+        question_index: int
+    ) -> Optional["PrefetchedTurn"]:
+        """Claim a prefetch that still matches the session, or count a miss"""
+        if not (session.config.use_voice and self.gpu_mode):
+            return None
+        
+        prefetch = self.prefetches.pop(session.session_id, None)
+        if prefetch is not None and prefetch.key != self._prefetch_key(session, question_index):
+            # The plan changed since the prefetch started
+            prefetch.cancel()
+            self.prefetch_stats["discarded"] += 1
+            prefetch = None
+        if prefetch is not None and prefetch.selection.done() and \
+                (prefetch.selection.cancelled() or prefetch.selection.exception()):
+            prefetch.cancel()
+            prefetch = None
+        
+        if prefetch is None:
+            self.prefetch_stats["misses"] += 1
+        else:
+            self.prefetch_stats["hits"] += 1
+        return prefetch
+    
+    async def _use_prefetched_question(
+        self,
+        session: InterviewSession,
+        prefetch: "PrefetchedTurn"
+    ) -> InterviewQuestion:
+        try:
+            question, source = await prefetch.selection
+        except Exception as e:
+            logger.error(f"Prefetched question selection failed: {e}")
+            question, source = await self._choose_next_question(session, session.current_question_index)
+        
+        return self._apply_next_question(session, question, source)
+    
+    async def _use_prefetched_audio(
+        self,
+        prefetch: "PrefetchedTurn",
+        on_audio: Optional[AudioListener] = None
+    ) -> Optional[str]:
+        needed_at = time.perf_counter()
+        audio = await prefetch.audio
+        
+        # Synthesis time that overlapped the user's answer
+        if prefetch.tts_started is not None and prefetch.tts_finished is not None:
+            saved = min(prefetch.tts_finished, needed_at) - prefetch.tts_started
+            self.prefetch_stats["latency_saved_ms"] += max(0.0, saved) * 1000
+        
+        if on_audio is not None and audio:
+            # Already synthesized: goes out as a single piece
+            await on_audio(base64.b64decode(audio))
+            return None
+        return audio
+    
+    def _on_session_evicted(self, session_id: str):
+        """Lifecycle eviction callback; the sweeper runs it in a worker thread"""
+        prefetch = self.prefetches.get(session_id)
+        if prefetch is None:
+            return
+        try:
+            prefetch.loop.call_soon_threadsafe(self._discard_prefetch, session_id)
+        except RuntimeError:
+            # Event loop already closed, its tasks are gone with it
+            pass
+    
+    def _discard_prefetch(self, session_id: str):
+        prefetch = self.prefetches.pop(session_id, None)
+        if prefetch is not None:
+            prefetch.cancel()
+            self.prefetch_stats["discarded"] += 1
+    
+    def _prune_prefetches(self):
+        """Drop prefetches of sessions that were abandoned"""
+        cutoff = time.perf_counter() - self.lifecycle.idle_timeout
+        for session_id in [sid for sid, p in self.prefetches.items() if p.created < cutoff]:
+            self._discard_prefetch(session_id)
+    
+    def get_prefetch_stats(self) -> Dict[str, Any]:
+        """Prefetch hit rate and latency saved (this worker)"""
+        stats = self.prefetch_stats
+        consumed = stats["hits"] + stats["misses"]
+        return {
+            **stats,
+            "pending": len(self.prefetches),
+            "hit_rate": stats["hits"] / consumed if consumed else 0.0,
+            "avg_latency_saved_ms": stats["latency_saved_ms"] / stats["hits"] if stats["hits"] else 0.0
+        }
     
     async def _generate_feedback(
         self,
@@ -382,65 +1030,7 @@ class GPUInterviewService:
         
         # In production, this would call an LLM
         # For now, provide structured feedback based on response length and keywords
-        
-        response_words = len(response.split())
-        
-        # Basic scoring based on response length
-        if response_words < 20:
-            score = 50
-            length_feedback = "Consider providing more detail in your response."
-        elif response_words < 50:
-            score = 70
-            length_feedback = "Good level of detail."
-        elif response_words < 150:
-            score = 85
-            length_feedback = "Great comprehensive response."
-        else:
-            score = 90
-            length_feedback = "Excellent thorough response."
-        
-        # Check for STAR method components
-        star_analysis = {
-            "situation": 0,
-            "task": 0,
-            "action": 0,
-            "result": 0
-        }
-        
-        response_lower = response.lower()
-        
-        if any(word in response_lower for word in ["when", "while", "during", "at"]):
-            star_analysis["situation"] = 80
-        if any(word in response_lower for word in ["needed", "required", "had to", "goal"]):
-            star_analysis["task"] = 80
-        if any(word in response_lower for word in ["i did", "i made", "i created", "i developed"]):
-            star_analysis["action"] = 80
-        if any(word in response_lower for word in ["result", "outcome", "achieved", "improved"]):
-            star_analysis["result"] = 80
-        
-        # Calculate average STAR score
-        star_avg = sum(star_analysis.values()) / 4
-        final_score = (score + star_avg) / 2
-        
-        return InterviewFeedback(
-            question_id=question.id,
-            overall_score=final_score,
-            strengths=[
-                length_feedback,
-                "Shows understanding of the question"
-            ],
-            growth_areas=[
-                "Consider using the STAR method more explicitly" if star_avg < 60 else "Good use of STAR method",
-                "Include specific metrics or outcomes" if "%" not in response else "Good use of metrics"
-            ],
-            star_analysis=star_analysis,
-            suggestions=[
-                "Try to quantify your achievements",
-                "Include the impact of your actions"
-            ],
-            keywords_used=question.tags[:3] if question.tags else [],
-            keywords_missing=[]
-        )
+        return self.scoring_engine.score(question, response)
     
     def _calculate_session_feedback(
         self,
@@ -448,7 +1038,8 @@ class GPUInterviewService:
     ) -> SessionFeedback:
         """Calculate overall session feedback"""
         
-        if not session.feedback_history:
+        aggregates = session.aggregates
+        if not aggregates.count:
             return SessionFeedback(
                 session_id=session.session_id,
                 overall_score=0,
@@ -460,33 +1051,8 @@ class GPUInterviewService:
                 recommendations=[]
             )
         
-        # Calculate averages
-        total_score = sum(f.overall_score for f in session.feedback_history)
-        avg_score = total_score / len(session.feedback_history)
-        
-        # Calculate category scores
-        category_scores = {}
-        for q, f in zip(session.questions_asked, session.feedback_history):
-            cat = q.category.value
-            if cat not in category_scores:
-                category_scores[cat] = []
-            category_scores[cat].append(f.overall_score)
-        
-        category_averages = {
-            cat: sum(scores) / len(scores)
-            for cat, scores in category_scores.items()
-        }
-        
-        # Aggregate strengths and growth areas
-        all_strengths = []
-        all_growth = []
-        for f in session.feedback_history:
-            all_strengths.extend(f.strengths)
-            all_growth.extend(f.growth_areas)
-        
-        # Deduplicate and prioritize
-        unique_strengths = list(set(all_strengths))[:5]
-        unique_growth = list(set(all_growth))[:5]
+        # Running aggregates, maintained as each answer is scored
+        avg_score = aggregates.mean_score
         
         # Generate recommendations
         recommendations = []
@@ -497,67 +1063,137 @@ class GPUInterviewService:
         if avg_score >= 80:
             recommendations.append("Excellent performance - ready for real interviews!")
         
-        # Determine trend
-        if len(session.feedback_history) >= 3:
-            first_half = session.feedback_history[:len(session.feedback_history)//2]
-            second_half = session.feedback_history[len(session.feedback_history)//2:]
-            
-            first_avg = sum(f.overall_score for f in first_half) / len(first_half)
-            second_avg = sum(f.overall_score for f in second_half) / len(second_half)
-            
-            if second_avg > first_avg + 5:
-                trend = "improving"
-            elif second_avg < first_avg - 5:
-                trend = "declining"
-            else:
-                trend = "stable"
-        else:
-            trend = None
-        
         return SessionFeedback(
             session_id=session.session_id,
             overall_score=avg_score,
             total_questions=len(session.questions_asked),
-            questions_answered=len(session.responses),
-            category_scores=category_averages,
-            strengths=unique_strengths,
-            growth_areas=unique_growth,
+            questions_answered=session.response_count,
+            category_scores=aggregates.category_scores(),
+            strengths=aggregates.top_strengths(),
+            growth_areas=aggregates.top_growth_areas(),
             recommendations=recommendations,
-            performance_trend=trend,
+            performance_trend=aggregates.trend(),
             comparison_to_average=avg_score - 70  # Assuming 70 is average
         )
     
     async def _generate_voice_response(
         self,
         text: str,
-        voice_preset: VoicePreset
+        voice_preset: VoicePreset,
+        prefix: str = "",
+        audio_format: AudioFormat = AudioFormat.WAV,
+        on_audio: Optional[AudioListener] = None
     ) -> Optional[str]:
-        """Generate voice response using TTS"""
+        """
+        Generate voice response using TTS
+        
+        The prefix (a fixed lead-in) and the text are cached as separate
+        segments and stitched, so a question is synthesized once however
+        it is introduced. With on_audio the response is streamed to it
+        sentence by sentence instead (VoiceService.stream_audio), each
+        sentence sent as soon as it is synthesized.
+        
+        Returns:
+            Base64 audio in audio_format, or None without TTS or when
+            streamed
+        """
         
         if not self.gpu_mode:
             return None
         
+        if on_audio is not None:
+            await self._stream_voice_response(prefix + text, voice_preset, audio_format, on_audio)
+            return None
+        
         try:
             tts_response = await self.voice_service.synthesize(
                 TTSRequest(
-                    text=text,
+                    text=prefix + text,
                     voice_preset=voice_preset,
                     emotion=EmotionStyle.NEUTRAL,
-                    speed=1.0
-                )
+                    speed=1.0,
+                    format=audio_format
+                ),
+                segments=[prefix, text]
             )
             return tts_response.audio_base64
         except Exception as e:
             logger.error(f"TTS generation failed: {e}")
             return None
     
+    async def _stream_voice_response(
+        self,
+        text: str,
+        voice_preset: VoicePreset,
+        audio_format: AudioFormat,
+        on_audio: AudioListener
+    ):
+        """
+        Stream TTS of text to on_audio
+        
+        A synthesis failure is logged and ends the stream early (like a
+        failed synthesize() drops the audio); failures of on_audio
+        propagate.
+        """
+        stream = self.voice_service.stream_audio(
+            TTSRequest(
+                text=text,
+                voice_preset=voice_preset,
+                emotion=EmotionStyle.NEUTRAL,
+                speed=1.0,
+                format=audio_format
+            )
+        )
+        try:
+            while True:
+                try:
+                    chunk = await stream.__anext__()
+                except StopAsyncIteration:
+                    break
+                except Exception as e:
+                    logger.error(f"TTS streaming failed: {e}")
+                    break
+                if chunk.data:
+                    await on_audio(chunk.data)
+        finally:
+            await stream.aclose()
+    
+    def _load_session(self, session_id: str) -> Optional[InterviewSession]:
+        """Load a session from the shared store"""
+        entry = self.session_store.load(session_id)
+        if entry is None:
+            return None
+        
+        version, payload = entry
+        return InterviewSession.from_state(unpack_state(payload), version)
+    
+    def _save_session(self, session: InterviewSession):
+        """Write a session back, failing if it changed since it was loaded"""
+        session.version = self.session_store.save(
+            session.session_id,
+            pack_state(session.to_state()),
+            session.version,
+            deadline=self.lifecycle.deadline_for(session.config, session.started_at)
+        )
+    
+    def _eviction_snapshot(self, payload: bytes) -> Optional[Dict[str, Any]]:
+        """Final-feedback snapshot of a session that is being evicted"""
+        session = InterviewSession.from_state(unpack_state(payload))
+        if not session.response_count:
+            return None
+        
+        return {
+            "session": session.to_dict(),
+            "feedback": self._calculate_session_feedback(session).dict()
+        }
+    
     def get_session(self, session_id: str) -> Optional[InterviewSession]:
         """Get an active session"""
-        return self.active_sessions.get(session_id)
+        return self._load_session(session_id)
     
     def end_session(self, session_id: str) -> Optional[SessionFeedback]:
         """End a session and get final feedback"""
-        session = self.active_sessions.get(session_id)
+        session = self._load_session(session_id)
         if not session:
             return None
         
@@ -565,13 +1201,14 @@ class GPUInterviewService:
         feedback = self._calculate_session_feedback(session)
         
         # Clean up
-        del self.active_sessions[session_id]
+        self._discard_prefetch(session_id)
+        self.session_store.delete(session_id)
         
         return feedback
     
     def get_active_sessions_count(self) -> int:
         """Get count of active sessions"""
-        return len(self.active_sessions)
+        return self.session_store.count()
 
 
 # Singleton accessor
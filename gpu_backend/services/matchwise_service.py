@@ -11,12 +11,15 @@ import logging
 import time
 import asyncio
 import aiohttp
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import hashlib
-import re
+import uuid
+from concurrent.futures import Future
 
-from config import get_settings, get_model_config, get_data_path
+import numpy as np
+
+from config import get_settings, get_gpu_config, get_model_config, get_data_path
 from models.schemas import (
     InterviewQuestion,
     InterviewCategory,
@@ -24,9 +27,13 @@ from models.schemas import (
     MatchWiseAnalysisData,
     PersonalizedRAGRequest,
     PersonalizedRAGResponse,
+    PersonalizedRAGBatchResponse,
+    PersonalizedRAGBuildStats,
     PersonalizedQuestionRequest
 )
 from services.embedding_service import get_embedding_service
+from services.extraction_engine import get_extraction_engine
+from services.chroma_writer import ChromaWriteBehindQueue, PendingCollection
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +79,13 @@ GAP_QUESTION_TEMPLATES = [
     "What transferable skills from your experience could help you succeed with {gap}?",
 ]
 
+# Generic fallback templates when topic-specific candidates run out
+GENERIC_QUESTION_TEMPLATES = [
+    "How would you contribute to our team given your background in {skill}?",
+    "Which project best shows how your {skill} experience would transfer to this role?",
+    "What would you want to accomplish with {skill} in your first six months here?",
+]
+
 
 class MatchWiseIntegrationService:
     """
@@ -89,14 +103,24 @@ class MatchWiseIntegrationService:
     
     def __init__(self):
         self.settings = get_settings()
+        self.gpu_config = get_gpu_config()
         self.model_config = get_model_config()
         self.embedding_service = get_embedding_service()
+        self.extractor = get_extraction_engine()
         self.chroma_client: Optional[chromadb.Client] = None
         self.user_collections: Dict[str, Any] = {}
         
         # Initialize ChromaDB for user RAGs
         self._initialize_chroma()
         
+        # All user RAG writes go through a single batched writer
+        self.writer = ChromaWriteBehindQueue(
+            lambda: self.chroma_client,
+            linger_ms=self.model_config.CHROMA_WRITE_LINGER_MS,
+            max_batch_rows=self.model_config.CHROMA_MAX_BATCH_ROWS,
+            collection_metadata={"hnsw:space": "cosine"}
+        )
+        
         logger.info("MatchWiseIntegrationService initialized")
     
     def _initialize_chroma(self):
@@ -129,139 +153,263 @@ class MatchWiseIntegrationService:
             PersonalizedRAGResponse with rag_id and stats
         """
         start_time = time.time()
-        matchwise_data = request.matchwise_data
         
         try:
-            # Generate unique RAG ID
-            rag_id = self._generate_rag_id(request.user_id)
-            
-            # Extract structured information
-            resume_info = self._extract_resume_info(matchwise_data.resume_text)
-            job_info = self._extract_job_info(matchwise_data.job_description)
+            rag_id, candidates = await self._prepare_personalized_questions(request)
             
-            # Generate personalized questions
-            questions = await self._generate_personalized_questions(
-                resume_info=resume_info,
-                job_info=job_info,
-                matchwise_data=matchwise_data,
-                focus_categories=request.focus_categories,
-                difficulty=request.difficulty_preference,
-                num_questions=request.num_questions
+            # Embed candidates once, then drop near-duplicates
+            text_embeddings = await asyncio.to_thread(
+                self._encode_unique_texts, [q.question for q in candidates]
+            )
+            questions, embeddings = self._select_distinct_questions(
+                candidates,
+                text_embeddings,
+                request.num_questions
             )
             
-            # Create ChromaDB collection for this user
-            collection = self._create_user_collection(rag_id, questions)
-            
-            # Calculate covered categories
-            categories_covered = list(set(q.category for q in questions))
-            
-            # Extract focus areas
-            focus_areas = list(set(
-                matchwise_data.strengths[:3] + 
-                matchwise_data.gaps[:2] + 
-                matchwise_data.keywords_matched[:3]
-            ))
+            # Create ChromaDB collection for this user and wait until durable
+            written = await asyncio.wrap_future(
+                self._create_user_collection(rag_id, questions, embeddings)
+            )
+            if not written:
+                raise RuntimeError(f"Write of {rag_id} was superseded or discarded before it was durable")
             
             build_time = time.time() - start_time
             logger.info(f"Built personalized RAG {rag_id} in {build_time:.2f}s with {len(questions)} questions")
             
-            return PersonalizedRAGResponse(
-                rag_id=rag_id,
-                user_id=request.user_id,
-                status="ready",
-                question_bank_size=len(questions),
-                categories_covered=categories_covered,
-                focus_areas=focus_areas,
-                created_at=datetime.utcnow(),
-                expires_at=datetime.utcnow() + timedelta(days=7)  # 7-day expiry
-            )
+            return self._build_rag_response(request, rag_id, questions)
             
         except Exception as e:
             logger.error(f"Failed to build personalized RAG: {e}")
             raise
     
-    def _generate_rag_id(self, user_id: str) -> str:
-        """Generate unique RAG ID"""
-        timestamp = int(time.time())
-        unique_string = f"{user_id}_{timestamp}"
-        hash_suffix = hashlib.md5(unique_string.encode()).hexdigest()[:8]
-        return f"rag_{user_id}_{hash_suffix}"
-    
-    def _extract_resume_info(self, resume_text: str) -> Dict[str, Any]:
-        """Extract structured information from resume text"""
-        # Basic extraction - in production, could use LLM for better extraction
-        info = {
-            "skills": [],
-            "experience": [],
-            "education": [],
-            "projects": [],
-            "companies": []
-        }
-        
-        # Extract skills (simple pattern matching)
-        skill_patterns = [
-            r"(?:skills?|technologies?|tools?)[\s:]+([^\n]+)",
-            r"(?:proficient in|experienced with|expertise in)[\s:]+([^\n]+)",
-        ]
+    async def build_personalized_rags_batch(
+        self,
+        requests: List[PersonalizedRAGRequest]
+    ) -> PersonalizedRAGBatchResponse:
+        """
+        Build personalized RAGs for many users in one pass
         
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, resume_text, re.IGNORECASE)
-            for match in matches:
-                skills = [s.strip() for s in re.split(r'[,;|]', match) if s.strip()]
-                info["skills"].extend(skills)
+        Candidate questions are generated per user, then every candidate text
+        across the cohort is embedded in large batches (identical templated
+        texts are encoded once). Each user's near-duplicates are dropped,
+        and all user collections go through the write-behind queue together.
+        A failure for one user is reported in its stats and does not abort
+        the rest of the batch.
         
-        # Extract company names (simple pattern)
-        company_patterns = [
-            r"(?:at|@|worked at|employed by)\s+([A-Z][A-Za-z\s]+(?:Inc|Corp|LLC|Ltd)?)",
-        ]
+        Args:
+            requests: One PersonalizedRAGRequest per user
+            
+        Returns:
+            PersonalizedRAGBatchResponse with per-user and aggregate throughput
+        """
+        start_time = time.time()
         
-        for pattern in company_patterns:
-            matches = re.findall(pattern, resume_text)
-            info["companies"].extend(matches)
+        prepared: List[Dict[str, Any]] = []
+        failures: List[PersonalizedRAGBuildStats] = []
         
-        # Deduplicate
-        info["skills"] = list(set(info["skills"]))[:20]
-        info["companies"] = list(set(info["companies"]))[:5]
+        # Stage 1: extraction and question generation (CPU only)
+        for request in requests:
+            prep_start = time.time()
+            try:
+                rag_id, candidates = await self._prepare_personalized_questions(request)
+                prepared.append({
+                    "request": request,
+                    "rag_id": rag_id,
+                    "candidates": candidates,
+                    "elapsed": time.time() - prep_start
+                })
+            except Exception as e:
+                logger.error(f"Failed to prepare personalized RAG for {request.user_id}: {e}")
+                failures.append(self._failed_build_stats(request, prep_start, e))
+        
+        # Stage 2: one de-duplicated bulk encoding across all users
+        embed_start = time.time()
+        all_texts = [q.question for item in prepared for q in item["candidates"]]
+        try:
+            text_embeddings = await asyncio.to_thread(self._encode_unique_texts, all_texts)
+        except Exception as e:
+            logger.error(f"Bulk embedding failed for batch RAG build: {e}")
+            failures.extend(
+                self._failed_build_stats(item["request"], embed_start, e)
+                for item in prepared
+            )
+            prepared = []
+            text_embeddings = {}
+        embedding_time = time.time() - embed_start
+        
+        # Stage 3: queue every user collection, then wait for durability once;
+        # the write-behind queue merges them into a single writer pass
+        write_start = time.time()
+        queued = []
+        for item in prepared:
+            request = item["request"]
+            try:
+                questions, embeddings = self._select_distinct_questions(
+                    item["candidates"],
+                    text_embeddings,
+                    request.num_questions
+                )
+                ack = self._create_user_collection(item["rag_id"], questions, embeddings)
+                queued.append((item, questions, ack))
+            except Exception as e:
+                logger.error(f"Failed to queue personalized RAG for {request.user_id}: {e}")
+                failures.append(self._failed_build_stats(request, write_start, e))
+        
+        acks = await asyncio.gather(
+            *(asyncio.wrap_future(ack) for _, _, ack in queued),
+            return_exceptions=True
+        )
+        write_time = time.time() - write_start
+        queued_rows = max(sum(len(questions) for _, questions, _ in queued), 1)
+        
+        results: List[PersonalizedRAGResponse] = []
+        per_user: List[PersonalizedRAGBuildStats] = []
+        for (item, questions, _), ack in zip(queued, acks):
+            request = item["request"]
+            if not isinstance(ack, Exception) and not ack:
+                # Superseded by a later replace, or deleted, before it landed
+                ack = RuntimeError(f"Write of {item['rag_id']} was superseded or discarded before it was durable")
+            if isinstance(ack, Exception):
+                logger.error(f"Failed to write personalized RAG for {request.user_id}: {ack}")
+                failures.append(self._failed_build_stats(request, write_start, ack))
+                continue
+            
+            results.append(self._build_rag_response(request, item["rag_id"], questions))
+            
+            # Attribute the shared embedding and write passes proportionally
+            embed_share = embedding_time * len(item["candidates"]) / max(len(all_texts), 1)
+            write_share = write_time * len(questions) / queued_rows
+            elapsed = item["elapsed"] + embed_share + write_share
+            per_user.append(PersonalizedRAGBuildStats(
+                user_id=request.user_id,
+                rag_id=item["rag_id"],
+                status="ready",
+                question_count=len(questions),
+                build_time_ms=elapsed * 1000,
+                questions_per_second=len(questions) / elapsed if elapsed > 0 else 0
+            ))
         
-        return info
-    
-    def _extract_job_info(self, job_description: str) -> Dict[str, Any]:
-        """Extract structured information from job description"""
-        info = {
-            "required_skills": [],
-            "preferred_skills": [],
-            "responsibilities": [],
-            "qualifications": []
-        }
-        
-        # Extract required skills
-        required_patterns = [
-            r"(?:required|must have|essential)[\s:]+([^\n]+)",
-            r"requirements?[\s:]+([^\n]+)",
-        ]
+        per_user.extend(failures)
+        total_time = time.time() - start_time
+        total_questions = sum(s.question_count for s in per_user)
         
-        for pattern in required_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
-            for match in matches:
-                skills = [s.strip() for s in re.split(r'[,;|]', match) if s.strip()]
-                info["required_skills"].extend(skills)
+        logger.info(
+            f"Batch-built {len(results)}/{len(requests)} personalized RAGs in {total_time:.2f}s "
+            f"({len(text_embeddings)} unique texts for {len(all_texts)} candidates)"
+        )
         
-        # Extract preferred skills
-        preferred_patterns = [
-            r"(?:preferred|nice to have|bonus)[\s:]+([^\n]+)",
-        ]
+        return PersonalizedRAGBatchResponse(
+            results=results,
+            per_user=per_user,
+            total_users=len(requests),
+            succeeded=len(results),
+            failed=len(failures),
+            total_questions=total_questions,
+            unique_texts_embedded=len(text_embeddings),
+            embedding_time_ms=embedding_time * 1000,
+            total_time_ms=total_time * 1000,
+            users_per_second=len(results) / total_time if total_time > 0 else 0,
+            questions_per_second=total_questions / total_time if total_time > 0 else 0
+        )
+    
+    async def _prepare_personalized_questions(
+        self,
+        request: PersonalizedRAGRequest
+    ) -> Tuple[str, List[InterviewQuestion]]:
+        """Extract resume/job info and generate the user's candidate questions"""
+        matchwise_data = request.matchwise_data
         
-        for pattern in preferred_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
-            for match in matches:
-                skills = [s.strip() for s in re.split(r'[,;|]', match) if s.strip()]
-                info["preferred_skills"].extend(skills)
+        # Generate unique RAG ID
+        rag_id = self._generate_rag_id(request.user_id)
+        
+        # Extract structured information
+        resume_info = self._extract_resume_info(matchwise_data.resume_text)
+        job_info = self._extract_job_info(matchwise_data.job_description)
+        
+        # Generate personalized candidate questions
+        candidates = await self._generate_personalized_questions(
+            resume_info=resume_info,
+            job_info=job_info,
+            matchwise_data=matchwise_data,
+            focus_categories=request.focus_categories,
+            difficulty=request.difficulty_preference,
+            num_questions=request.num_questions
+        )
+        
+        return rag_id, candidates
+    
+    def _encode_unique_texts(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """Embed texts in large batches, encoding each distinct text once"""
+        unique_texts = list(dict.fromkeys(texts))
+        if not unique_texts:
+            return {}
         
-        # Deduplicate
-        info["required_skills"] = list(set(info["required_skills"]))[:15]
-        info["preferred_skills"] = list(set(info["preferred_skills"]))[:10]
+        embeddings = self.embedding_service.encode_documents(
+            unique_texts,
+            batch_size=self.gpu_config.EMBEDDING_BULK_BATCH_SIZE,
+            show_progress=False
+        )
+        return dict(zip(unique_texts, embeddings))
+    
+    def _build_rag_response(
+        self,
+        request: PersonalizedRAGRequest,
+        rag_id: str,
+        questions: List[InterviewQuestion]
+    ) -> PersonalizedRAGResponse:
+        """Summarize a built personalized RAG"""
+        matchwise_data = request.matchwise_data
         
-        return info
+        # Calculate covered categories
+        categories_covered = list(set(q.category for q in questions))
+        
+        # Extract focus areas
+        focus_areas = list(set(
+            matchwise_data.strengths[:3] + 
+            matchwise_data.gaps[:2] + 
+            matchwise_data.keywords_matched[:3]
+        ))
+        
+        return PersonalizedRAGResponse(
+            rag_id=rag_id,
+            user_id=request.user_id,
+            status="ready",
+            question_bank_size=len(questions),
+            categories_covered=categories_covered,
+            focus_areas=focus_areas,
+            created_at=datetime.utcnow(),
+            expires_at=datetime.utcnow() + timedelta(days=7)  # 7-day expiry
+        )
+    
+    def _failed_build_stats(
+        self,
+        request: PersonalizedRAGRequest,
+        started_at: float,
+        error: Exception
+    ) -> PersonalizedRAGBuildStats:
+        """Per-user stats entry for a failed batch build"""
+        return PersonalizedRAGBuildStats(
+            user_id=request.user_id,
+            status="failed",
+            build_time_ms=(time.time() - started_at) * 1000,
+            error=str(error)
+        )
+    
+    def _generate_rag_id(self, user_id: str) -> str:
+        """Generate unique RAG ID (distinct per call, even within one batch)"""
+        unique_string = f"{user_id}_{time.time()}_{uuid.uuid4().hex}"
+        hash_suffix = hashlib.md5(unique_string.encode()).hexdigest()[:8]
+        return f"rag_{user_id}_{hash_suffix}"
+    
+    def _extract_resume_info(self, resume_text: str) -> Dict[str, Any]:
+        """Extract structured information from resume text"""
+        # Basic extraction - in production, could use LLM for better extraction
+        return self.extractor.extract_resume(resume_text)
+    
+    def _extract_job_info(self, job_description: str) -> Dict[str, Any]:
+        """Extract structured information from job description"""
+        return self.extractor.extract_job(job_description)
     
     async def _generate_personalized_questions(
         self,
@@ -272,9 +420,14 @@ class MatchWiseIntegrationService:
         difficulty: InterviewDifficulty,
         num_questions: int
     ) -> List[InterviewQuestion]:
-        """Generate personalized interview questions"""
-        questions = []
+        """
+        Generate personalized candidate questions in priority order
         
+        The primary strength (40%), gap (30%) and skill-match (30%) questions
+        come first, followed by backfill: the same topics phrased with the
+        other templates, then generic questions. _select_distinct_questions
+        takes candidates in this order and skips near-duplicates.
+        """
         # Determine categories to cover
         if focus_categories:
             categories = focus_categories
@@ -286,8 +439,8 @@ class MatchWiseIntegrationService:
                 InterviewCategory.SOFT_SKILLS
             ]
         
-        # Calculate questions per category
-        base_per_category = num_questions // len(categories)
+        primary: List[InterviewQuestion] = []
+        alternates: List[List[InterviewQuestion]] = []
         
         # Generate strength-based questions (40%)
         strength_count = int(num_questions * 0.4)
@@ -295,16 +448,17 @@ class MatchWiseIntegrationService:
             category = categories[i % len(categories)]
             templates = QUESTION_TEMPLATES.get(category, [])
             
-            if templates:
-                template = templates[i % len(templates)]
+            variants = []
+            for t in range(len(templates)):
+                template = templates[(i + t) % len(templates)]
                 question_text = template.format(
                     skill=strength,
                     domain="AI/ML",
                     company=resume_info["companies"][0] if resume_info["companies"] else "your previous role"
                 )
                 
-                questions.append(InterviewQuestion(
-                    id=f"strength_{i}",
+                variants.append(InterviewQuestion(
+                    id=f"strength_{i}" if t == 0 else f"strength_{i}_{t}",
                     question=question_text,
                     category=category,
                     subcategory="strength_showcase",
@@ -316,26 +470,35 @@ class MatchWiseIntegrationService:
                         "Shows depth of knowledge"
                     ]
                 ))
+            
+            if variants:
+                primary.append(variants[0])
+                alternates.append(variants[1:])
         
         # Generate gap-focused questions (30%)
         gap_count = int(num_questions * 0.3)
         for i, gap in enumerate(matchwise_data.gaps[:gap_count]):
-            template = GAP_QUESTION_TEMPLATES[i % len(GAP_QUESTION_TEMPLATES)]
-            question_text = template.format(gap=gap)
+            variants = []
+            for t in range(len(GAP_QUESTION_TEMPLATES)):
+                template = GAP_QUESTION_TEMPLATES[(i + t) % len(GAP_QUESTION_TEMPLATES)]
+                question_text = template.format(gap=gap)
+                
+                variants.append(InterviewQuestion(
+                    id=f"gap_{i}" if t == 0 else f"gap_{i}_{t}",
+                    question=question_text,
+                    category=InterviewCategory.BEHAVIORAL if i % 2 == 0 else InterviewCategory.SCENARIO,
+                    subcategory="gap_preparation",
+                    difficulty=InterviewDifficulty.MEDIUM,
+                    tags=[gap.lower().replace(" ", "_"), "gap", "growth"],
+                    evaluation_criteria=[
+                        "Acknowledges the gap honestly",
+                        "Shows willingness to learn",
+                        "Identifies transferable skills"
+                    ]
+                ))
             
-            questions.append(InterviewQuestion(
-                id=f"gap_{i}",
-                question=question_text,
-                category=InterviewCategory.BEHAVIORAL if i % 2 == 0 else InterviewCategory.SCENARIO,
-                subcategory="gap_preparation",
-                difficulty=InterviewDifficulty.MEDIUM,
-                tags=[gap.lower().replace(" ", "_"), "gap", "growth"],
-                evaluation_criteria=[
-                    "Acknowledges the gap honestly",
-                    "Shows willingness to learn",
-                    "Identifies transferable skills"
-                ]
-            ))
+            primary.append(variants[0])
+            alternates.append(variants[1:])
         
         # Generate skill-match questions (30%)
         skill_count = int(num_questions * 0.3)
@@ -345,16 +508,17 @@ class MatchWiseIntegrationService:
             category = categories[i % len(categories)]
             templates = QUESTION_TEMPLATES.get(category, [])
             
-            if templates:
-                template = templates[(i + 2) % len(templates)]
+            variants = []
+            for t in range(len(templates)):
+                template = templates[(i + 2 + t) % len(templates)]
                 question_text = template.format(
                     skill=skill,
                     domain="AI/ML engineering",
                     company=resume_info["companies"][0] if resume_info["companies"] else "your experience"
                 )
                 
-                questions.append(InterviewQuestion(
-                    id=f"skill_{i}",
+                variants.append(InterviewQuestion(
+                    id=f"skill_{i}" if t == 0 else f"skill_{i}_{t}",
                     question=question_text,
                     category=category,
                     subcategory="skill_demonstration",
@@ -366,80 +530,136 @@ class MatchWiseIntegrationService:
                         "Demonstrates impact"
                     ]
                 ))
+            
+            if variants:
+                primary.append(variants[0])
+                alternates.append(variants[1:])
+        
+        # Generic questions as the last resort
+        background = (
+            resume_info["skills"][:3] +
+            job_info["required_skills"][:2]
+        ) or ["AI/ML"]
+        generic = []
+        for template in GENERIC_QUESTION_TEMPLATES:
+            for topic in background:
+                generic.append(InterviewQuestion(
+                    id=f"generic_{len(generic)}",
+                    question=template.format(skill=topic),
+                    category=InterviewCategory.BEHAVIORAL,
+                    subcategory="general",
+                    difficulty=difficulty,
+                    tags=["general", "contribution"],
+                    evaluation_criteria=["Shows enthusiasm", "Identifies value-add", "Team orientation"]
+                ))
         
-        # Ensure we have the requested number of questions
-        while len(questions) < num_questions:
-            # Add generic questions if needed
-            questions.append(InterviewQuestion(
-                id=f"generic_{len(questions)}",
-                question=f"How would you contribute to our team given your background in {resume_info['skills'][0] if resume_info['skills'] else 'AI/ML'}?",
-                category=InterviewCategory.BEHAVIORAL,
-                subcategory="general",
-                difficulty=difficulty,
-                tags=["general", "contribution"],
-                evaluation_criteria=["Shows enthusiasm", "Identifies value-add", "Team orientation"]
-            ))
+        # Backfill round-robin across topics so coverage stays balanced
+        backfill = [
+            variants[t]
+            for t in range(max((len(v) for v in alternates), default=0))
+            for variants in alternates
+            if t < len(variants)
+        ]
         
-        return questions[:num_questions]
+        candidates = primary + backfill + generic
+        return candidates[:num_questions * self.settings.PERSONALIZED_CANDIDATE_FACTOR]
+    
+    def _select_distinct_questions(
+        self,
+        candidates: List[InterviewQuestion],
+        text_embeddings: Dict[str, np.ndarray],
+        num_questions: int
+    ) -> Tuple[List[InterviewQuestion], np.ndarray]:
+        """
+        Pick up to num_questions mutually distinct candidates
+        
+        Candidates are taken in priority order. One is skipped when its text
+        equals an accepted one case-insensitively, or when its cosine
+        similarity to any accepted question reaches
+        PERSONALIZED_DEDUP_THRESHOLD. All pairwise similarities come from a
+        single matmul over the normalized candidate embeddings.
+        
+        Returns:
+            Selected questions and their (normalized) embeddings
+        """
+        embeddings = np.stack([text_embeddings[q.question] for q in candidates]).astype(np.float32)
+        embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+        similarity = embeddings @ embeddings.T
+        
+        threshold = self.settings.PERSONALIZED_DEDUP_THRESHOLD
+        kept: List[int] = []
+        seen_texts = set()
+        
+        for i, question in enumerate(candidates):
+            key = question.question.casefold()
+            if key in seen_texts:
+                continue
+            if kept and similarity[i, kept].max() >= threshold:
+                continue
+            
+            kept.append(i)
+            seen_texts.add(key)
+            if len(kept) == num_questions:
+                break
+        
+        if len(kept) < num_questions:
+            logger.info(
+                f"Only {len(kept)} distinct personalized questions "
+                f"from {len(candidates)} candidates (requested {num_questions})"
+            )
+        
+        return [candidates[i] for i in kept], embeddings[kept]
     
     def _create_user_collection(
         self,
         rag_id: str,
-        questions: List[InterviewQuestion]
-    ) -> Any:
-        """Create ChromaDB collection for user's personalized questions"""
-        # Delete existing collection if exists
-        try:
-            self.chroma_client.delete_collection(rag_id)
-        except:
-            pass
-        
-        # Create new collection
-        collection = self.chroma_client.create_collection(
-            name=rag_id,
-            metadata={"hnsw:space": "cosine"}
-        )
+        questions: List[InterviewQuestion],
+        embeddings: np.ndarray
+    ) -> Future:
+        """
+        Queue the user's personalized questions as a fresh ChromaDB collection
         
-        # Generate embeddings for questions
-        question_texts = [q.question for q in questions]
-        embeddings = self.embedding_service.encode_documents(
-            question_texts,
-            show_progress=False
-        )
+        The write goes through the write-behind queue: the collection replaces
+        any existing one with the same name, is readable immediately through
+        the queue overlay, and the returned future resolves once it is durable.
+        """
+        self.user_collections.pop(rag_id, None)
         
-        # Add to collection
-        collection.add(
+        return self.writer.submit(
+            rag_id,
             ids=[q.id for q in questions],
-            embeddings=embeddings.tolist(),
-            documents=question_texts,
+            embeddings=embeddings,
+            documents=[q.question for q in questions],
             metadatas=[{
                 "category": q.category.value,
                 "subcategory": q.subcategory or "general",
                 "difficulty": q.difficulty.value,
                 "tags": ",".join(q.tags),
                 "evaluation_criteria": ",".join(q.evaluation_criteria or [])
-            } for q in questions]
+            } for q in questions],
+            replace=True
         )
-        
-        self.user_collections[rag_id] = collection
-        return collection
     
-    def get_personalized_question(
-        self,
-        request: PersonalizedQuestionRequest
-    ) -> Optional[InterviewQuestion]:
-        """Get a personalized question from user's RAG"""
-        collection = self.user_collections.get(request.rag_id)
+    def _get_user_collection(self, rag_id: str) -> Optional[Any]:
+        """Get a durable user collection, loading it from disk if needed"""
+        collection = self.user_collections.get(rag_id)
         
         if not collection:
             # Try to load from disk
             try:
-                collection = self.chroma_client.get_collection(request.rag_id)
-                self.user_collections[request.rag_id] = collection
+                collection = self.chroma_client.get_collection(rag_id)
+                self.user_collections[rag_id] = collection
             except:
-                logger.error(f"Collection not found: {request.rag_id}")
+                logger.error(f"Collection not found: {rag_id}")
                 return None
         
+        return collection
+    
+    def get_personalized_question(
+        self,
+        request: PersonalizedQuestionRequest
+    ) -> Optional[InterviewQuestion]:
+        """Get a personalized question from user's RAG"""
         # Build where clause
         where_clause = {}
         if request.category:
@@ -447,23 +667,14 @@ class MatchWiseIntegrationService:
         if request.difficulty:
             where_clause["difficulty"] = request.difficulty.value
         
-        # Get questions
         try:
-            results = collection.get(
-                where=where_clause if where_clause else None,
-                include=["documents", "metadatas"]
-            )
-            
-            if not results["ids"]:
+            rows = self._get_rows(request.rag_id, where_clause)
+            if not rows:
                 return None
             
             # Filter out excluded IDs
             available = [
-                (id, doc, meta) for id, doc, meta in zip(
-                    results["ids"],
-                    results["documents"],
-                    results["metadatas"]
-                )
+                (id, doc, meta) for id, doc, meta in rows
                 if id not in request.exclude_ids
             ]
             
@@ -474,20 +685,80 @@ class MatchWiseIntegrationService:
             import random
             q_id, doc, metadata = random.choice(available)
             
-            return InterviewQuestion(
-                id=q_id,
-                question=doc,
-                category=InterviewCategory(metadata["category"]),
-                subcategory=metadata.get("subcategory"),
-                difficulty=InterviewDifficulty(metadata.get("difficulty", "medium")),
-                tags=metadata.get("tags", "").split(",") if metadata.get("tags") else [],
-                evaluation_criteria=metadata.get("evaluation_criteria", "").split(",") if metadata.get("evaluation_criteria") else None
-            )
+            return self._row_to_question(q_id, doc, metadata)
             
         except Exception as e:
             logger.error(f"Failed to get personalized question: {e}")
             return None
     
+    def get_personalized_questions(
+        self,
+        rag_id: str,
+        category: Optional[InterviewCategory] = None
+    ) -> List[InterviewQuestion]:
+        """Get all questions in a user's RAG (optionally one category) in one read"""
+        where_clause = {"category": category.value} if category else {}
+        
+        try:
+            return [
+                self._row_to_question(q_id, doc, metadata)
+                for q_id, doc, metadata in self._get_rows(rag_id, where_clause)
+            ]
+        except Exception as e:
+            logger.error(f"Failed to get personalized questions: {e}")
+            return []
+    
+    def get_personalized_questions_by_id(
+        self,
+        rag_id: str,
+        question_ids: List[str]
+    ) -> List[InterviewQuestion]:
+        """Get questions of a user's RAG by ID in one read (missing IDs are skipped)"""
+        try:
+            return [
+                self._row_to_question(q_id, doc, metadata)
+                for q_id, doc, metadata in self._get_rows(rag_id, {}, question_ids)
+            ]
+        except Exception as e:
+            logger.error(f"Failed to get personalized questions by ID: {e}")
+            return []
+    
+    def _get_rows(
+        self,
+        rag_id: str,
+        where_clause: Dict[str, str],
+        ids: Optional[List[str]] = None
+    ) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """(id, document, metadata) rows of a user RAG matching where_clause (and ids)"""
+        # Not-yet-durable rows come from the write-behind overlay
+        pending = self.writer.overlay(rag_id)
+        if pending is not None:
+            wanted = set(ids) if ids is not None else None
+            return [
+                (id, doc, meta) for id, doc, meta in zip(
+                    pending.ids,
+                    pending.documents,
+                    pending.metadatas
+                )
+                if (wanted is None or id in wanted)
+                and all(meta.get(k) == v for k, v in where_clause.items())
+            ]
+        
+        collection = self._get_user_collection(rag_id)
+        if not collection:
+            return []
+        
+        results = collection.get(
+            ids=ids,
+            where=where_clause if where_clause else None,
+            include=["documents", "metadatas"]
+        )
+        return list(zip(
+            results["ids"],
+            results["documents"],
+            results["metadatas"]
+        ))
+    
     def query_personalized_rag(
         self,
         rag_id: str,
@@ -495,41 +766,68 @@ class MatchWiseIntegrationService:
         n_results: int = 5
     ) -> List[InterviewQuestion]:
         """Query user's personalized RAG"""
-        collection = self.user_collections.get(rag_id)
+        try:
+            # Generate query embedding
+            query_embedding = self.embedding_service.encode_query(query)
+        except Exception as e:
+            logger.error(f"Failed to query personalized RAG: {e}")
+            return []
         
-        if not collection:
-            try:
-                collection = self.chroma_client.get_collection(rag_id)
-                self.user_collections[rag_id] = collection
-            except:
-                logger.error(f"Collection not found: {rag_id}")
+        return self.query_personalized_rag_by_embedding(rag_id, query_embedding, n_results)
+    
+    def query_personalized_rag_by_embedding(
+        self,
+        rag_id: str,
+        query_embedding: np.ndarray,
+        n_results: int = 5,
+        category: Optional[InterviewCategory] = None,
+        difficulty: Optional[InterviewDifficulty] = None
+    ) -> List[InterviewQuestion]:
+        """
+        Query user's personalized RAG with a precomputed query embedding
+        
+        Args:
+            rag_id: User RAG to search
+            query_embedding: Normalized query embedding
+            n_results: Maximum number of results
+            category: Optional category filter
+            difficulty: Optional difficulty filter
+            
+        Returns:
+            Matching questions with relevance scores
+        """
+        where_clause = {}
+        if category:
+            where_clause["category"] = category.value
+        if difficulty:
+            where_clause["difficulty"] = difficulty.value
+        
+        pending = self.writer.overlay(rag_id)
+        collection = None
+        if pending is None:
+            collection = self._get_user_collection(rag_id)
+            if not collection:
                 return []
         
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_service.encode_query(query)
+            if pending is not None:
+                return self._query_overlay(pending, query_embedding, n_results, where_clause)
             
             # Query collection
             results = collection.query(
                 query_embeddings=[query_embedding.tolist()],
                 n_results=n_results,
+                where=where_clause if where_clause else None,
                 include=["documents", "metadatas", "distances"]
             )
             
             questions = []
             for i, doc in enumerate(results["documents"][0]):
-                metadata = results["metadatas"][0][i]
-                distance = results["distances"][0][i]
-                
-                questions.append(InterviewQuestion(
-                    id=results["ids"][0][i],
-                    question=doc,
-                    category=InterviewCategory(metadata["category"]),
-                    subcategory=metadata.get("subcategory"),
-                    difficulty=InterviewDifficulty(metadata.get("difficulty", "medium")),
-                    tags=metadata.get("tags", "").split(",") if metadata.get("tags") else [],
-                    evaluation_criteria=metadata.get("evaluation_criteria", "").split(",") if metadata.get("evaluation_criteria") else None,
-                    relevance_score=1 - distance
+                questions.append(self._row_to_question(
+                    results["ids"][0][i],
+                    doc,
+                    results["metadatas"][0][i],
+                    relevance_score=1 - results["distances"][0][i]
                 ))
             
             return questions
@@ -538,29 +836,101 @@ class MatchWiseIntegrationService:
             logger.error(f"Failed to query personalized RAG: {e}")
             return []
     
-    def delete_user_rag(self, rag_id: str) -> bool:
+    def _query_overlay(
+        self,
+        pending: PendingCollection,
+        query_embedding: np.ndarray,
+        n_results: int,
+        where_clause: Optional[Dict[str, str]] = None
+    ) -> List[InterviewQuestion]:
+        """Cosine search over rows still in the write-behind queue"""
+        embeddings = pending.embedding_matrix()
+        rows = [
+            i for i, meta in enumerate(pending.metadatas)
+            if all(meta.get(k) == v for k, v in (where_clause or {}).items())
+        ]
+        if not rows:
+            return []
+        
+        query = query_embedding / max(np.linalg.norm(query_embedding), 1e-12)
+        candidates = embeddings[rows]
+        norms = np.maximum(np.linalg.norm(candidates, axis=1), 1e-12)
+        scores = (candidates @ query) / norms
+        top = [(rows[j], scores[j]) for j in np.argsort(-scores)[:n_results]]
+        
+        return [
+            self._row_to_question(
+                pending.ids[i],
+                pending.documents[i],
+                pending.metadatas[i],
+                relevance_score=float(score)
+            )
+            for i, score in top
+        ]
+    
+    def _row_to_question(
+        self,
+        q_id: str,
+        doc: str,
+        metadata: Dict[str, Any],
+        relevance_score: Optional[float] = None
+    ) -> InterviewQuestion:
+        """Build an InterviewQuestion from a stored row"""
+        return InterviewQuestion(
+            id=q_id,
+            question=doc,
+            category=InterviewCategory(metadata["category"]),
+            subcategory=metadata.get("subcategory"),
+            difficulty=InterviewDifficulty(metadata.get("difficulty", "medium")),
+            tags=metadata.get("tags", "").split(",") if metadata.get("tags") else [],
+            evaluation_criteria=metadata.get("evaluation_criteria", "").split(",") if metadata.get("evaluation_criteria") else None,
+            relevance_score=relevance_score
+        )
+    
+    async def delete_user_rag(self, rag_id: str) -> bool:
         """Delete a user's personalized RAG"""
+        # Drop queued rows and let an in-flight write land before deleting
+        discarded = self.writer.discard(rag_id)
+        await self.writer.aflush(rag_id)
+        
         try:
-            self.chroma_client.delete_collection(rag_id)
+            await asyncio.to_thread(self.chroma_client.delete_collection, rag_id)
             if rag_id in self.user_collections:
                 del self.user_collections[rag_id]
             logger.info(f"Deleted user RAG: {rag_id}")
             return True
         except Exception as e:
+            if discarded:
+                logger.info(f"Deleted queued user RAG: {rag_id}")
+                return True
             logger.error(f"Failed to delete RAG {rag_id}: {e}")
             return False
     
     def get_rag_info(self, rag_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a user's RAG"""
+        pending = self.writer.overlay(rag_id)
+        if pending is not None:
+            return {
+                "rag_id": rag_id,
+                "question_count": len(pending),
+                "metadata": self.writer.collection_metadata,
+                "durable": False
+            }
+        
         try:
             collection = self.chroma_client.get_collection(rag_id)
             return {
                 "rag_id": rag_id,
                 "question_count": collection.count(),
-                "metadata": collection.metadata
+                "metadata": collection.metadata,
+                "durable": True
             }
         except:
             return None
+    
+    def flush_pending_writes(self, timeout: Optional[float] = 30) -> bool:
+        """Block until every queued user RAG write is durable"""
+        return self.writer.flush(timeout=timeout)
 
 
 # Singleton accessor
@@ -14,6 +14,8 @@ from typing import List, Dict, Optional, Any
 from datetime import datetime
 import hashlib
 
+import numpy as np
+
 from config import get_settings, get_model_config, get_data_path
 from models.schemas import (
     InterviewQuestion,
@@ -467,46 +469,19 @@ class PreRAGService:
             else:
                 categories = list(InterviewCategory)
             
+            # Embed once, shared by every category searched
+            query_embedding = self.embedding_service.encode_query(request.query)
+            
             all_questions = []
             
             for category in categories:
-                collection = self.collections.get(category.value)
-                if not collection:
-                    continue
-                
-                # Generate query embedding
-                query_embedding = self.embedding_service.encode_query(request.query)
-                
-                # Build where clause for filtering
-                where_clause = {}
-                if request.difficulty:
-                    where_clause["difficulty"] = request.difficulty.value
-                
-                # Query collection
-                results = collection.query(
-                    query_embeddings=[query_embedding.tolist()],
+                all_questions.extend(self.query_category(
+                    category,
+                    query_embedding,
                     n_results=request.n_results,
-                    where=where_clause if where_clause else None,
-                    include=["documents", "metadatas", "distances"]
-                )
-                
-                # Parse results
-                for i, doc in enumerate(results["documents"][0]):
-                    metadata = results["metadatas"][0][i]
-                    distance = results["distances"][0][i]
-                    
-                    question = InterviewQuestion(
-                        id=results["ids"][0][i],
-                        question=doc,
-                        category=InterviewCategory(metadata["category"]),
-                        subcategory=metadata.get("subcategory"),
-                        difficulty=InterviewDifficulty(metadata.get("difficulty", "medium")),
-                        tags=metadata.get("tags", "").split(",") if metadata.get("tags") else [],
-                        sample_answer=metadata.get("sample_answer") if request.include_sample_answers else None,
-                        evaluation_criteria=metadata.get("evaluation_criteria", "").split(",") if metadata.get("evaluation_criteria") else None,
-                        relevance_score=1 - distance  # Convert distance to similarity
-                    )
-                    all_questions.append(question)
+                    difficulty=request.difficulty,
+                    include_sample_answers=request.include_sample_answers
+                ))
             
             # Sort by relevance and limit
             all_questions.sort(key=lambda x: x.relevance_score or 0, reverse=True)
@@ -529,6 +504,65 @@ class PreRAGService:
                 total_results=0
             )
     
+    def query_category(
+        self,
+        category: InterviewCategory,
+        query_embedding: np.ndarray,
+        n_results: int = 5,
+        difficulty: Optional[InterviewDifficulty] = None,
+        include_sample_answers: bool = False
+    ) -> List[InterviewQuestion]:
+        """
+        Search one category with a precomputed query embedding
+        
+        Args:
+            category: Category collection to search
+            query_embedding: Normalized query embedding
+            n_results: Maximum number of results
+            difficulty: Optional difficulty filter
+            include_sample_answers: Include sample answers in results
+            
+        Returns:
+            Matching questions with relevance scores
+        """
+        collection = self.collections.get(category.value)
+        if not collection:
+            return []
+        
+        # Build where clause for filtering
+        where_clause = {}
+        if difficulty:
+            where_clause["difficulty"] = difficulty.value
+        
+        # Query collection
+        results = collection.query(
+            query_embeddings=[query_embedding.tolist()],
+            n_results=n_results,
+            where=where_clause if where_clause else None,
+            include=["documents", "metadatas", "distances"]
+        )
+        
+        # Parse results
+        questions = []
+        for i, doc in enumerate(results["documents"][0]):
+            metadata = results["metadatas"][0][i]
+            distance = results["distances"][0][i]
+            
+            question = InterviewQuestion(
+                id=results["ids"][0][i],
+                question=doc,
+                category=InterviewCategory(metadata["category"]),
+                subcategory=metadata.get("subcategory"),
+                difficulty=InterviewDifficulty(metadata.get("difficulty", "medium")),
+                tags=metadata.get("tags", "").split(",") if metadata.get("tags") else [],
+                sample_answer=metadata.get("sample_answer") if include_sample_answers else None,
+                evaluation_criteria=metadata.get("evaluation_criteria", "").split(",") if metadata.get("evaluation_criteria") else None,
+                relevance_score=1 - distance  # Convert distance to similarity
+            )
+            questions.append(question)
+        
+        return questions
+    
     def get_random_question(
         self,
         category: InterviewCategory,
@@ -538,9 +572,26 @@ class PreRAGService:
         """Get a random question from a category"""
         import random
         
+        available = [
+            q for q in self.get_questions(category, difficulty)
+            if q.id not in exclude_ids
+        ]
+        
+        if not available:
+            return None
+        
+        # Select random
+        return random.choice(available)
+    
+    def get_questions(
+        self,
+        category: InterviewCategory,
+        difficulty: Optional[InterviewDifficulty] = None
+    ) -> List[InterviewQuestion]:
+        """Get all questions of a category (optionally one difficulty) in one read"""
         collection = self.collections.get(category.value)
         if not collection:
-            return None
+            return []
         
         # Get all questions from category
         where_clause = {}
@@ -552,25 +603,40 @@ class PreRAGService:
             include=["documents", "metadatas"]
         )
         
-        if not results["ids"]:
-            return None
-        
-        # Filter out excluded IDs
-        available = [
-            (id, doc, meta) for id, doc, meta in zip(
+        return [
+            self._row_to_question(q_id, doc, metadata)
+            for q_id, doc, metadata in zip(
                 results["ids"],
                 results["documents"],
                 results["metadatas"]
             )
-            if id not in exclude_ids
         ]
+    
+    def get_questions_by_id(self, question_ids: List[str]) -> List[InterviewQuestion]:
+        """Get questions by ID, one read per category (unknown IDs are skipped)"""
+        by_category: Dict[str, List[str]] = {}
+        for q_id in question_ids:
+            # IDs are "<category>_<content hash>" (see _build_collection)
+            by_category.setdefault(q_id.rsplit("_", 1)[0], []).append(q_id)
         
-        if not available:
-            return None
-        
-        # Select random
-        q_id, doc, metadata = random.choice(available)
-        
+        questions = []
+        for category, ids in by_category.items():
+            collection = self.collections.get(category)
+            if not collection:
+                continue
+            results = collection.get(ids=ids, include=["documents", "metadatas"])
+            questions.extend(
+                self._row_to_question(q_id, doc, metadata)
+                for q_id, doc, metadata in zip(
+                    results["ids"],
+                    results["documents"],
+                    results["metadatas"]
+                )
+            )
+        return questions
+    
+    def _row_to_question(self, q_id: str, doc: str, metadata: Dict[str, Any]) -> InterviewQuestion:
+        """Build an InterviewQuestion from a stored row"""
         return InterviewQuestion(
             id=q_id,
             question=doc,
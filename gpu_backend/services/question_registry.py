@@ -0,0 +1,188 @@
+"""
+SmartSuccess.AI GPU Backend - Question Registry
+Per-worker table of interview questions shared by all sessions
+"""
+
+import logging
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import get_settings
+from models.schemas import InterviewQuestion
+
+logger = logging.getLogger(__name__)
+
+
+# Reference prefixes: pre-RAG bank, personalized RAG
+GENERAL_SOURCE = "g"
+PERSONALIZED_SOURCE = "p"
+
+# (scope, question IDs) -> questions found; scope is the rag_id for
+# personalized questions and empty for the general bank
+SourceLoader = Callable[[str, List[str]], List[InterviewQuestion]]
+
+
+def general_ref(question_id: str) -> str:
+    """Reference of a pre-RAG bank question"""
+    return f"{GENERAL_SOURCE}:{question_id}"
+
+
+def personalized_ref(rag_id: str, question_id: str) -> str:
+    """Reference of a question in a user's personalized RAG"""
+    return f"{PERSONALIZED_SOURCE}:{rag_id}:{question_id}"
+
+
+def question_ref(question: InterviewQuestion) -> Optional[str]:
+    """Bank reference of a registered question (None for generated questions)"""
+    return question._bank_ref
+
+
+def _split_ref(ref: str) -> Tuple[str, str, str]:
+    """(source, scope, question ID); question IDs never contain ':'"""
+    source, _, rest = ref.partition(":")
+    scope, _, question_id = rest.rpartition(":")
+    return source, scope, question_id
+
+
+class QuestionRegistry:
+    """
+    Bounded LRU of InterviewQuestion objects, keyed by bank reference
+
+    A reference names a question in the bank it came from, so session
+    state stores only the reference and any worker can rebuild the
+    question from it:
+    - "g:<id>" for the pre-RAG bank (IDs are content hashes)
+    - "p:<rag_id>:<id>" for a personalized RAG (IDs such as "strength_0"
+      are only unique within one RAG)
+
+    Sessions hold the registry's objects instead of their own copies.
+    References the registry does not hold (another worker created the
+    session, or the LRU dropped them) are read back from their bank with
+    one bulk read per collection, through the loaders given to
+    register_source(). Questions from no bank (generated fallbacks) have
+    no reference; sessions store those inline.
+
+    A question evicted from the LRU stays valid for the sessions that
+    still reference it; it is only no longer shared with new loads.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self._questions: "OrderedDict[str, InterviewQuestion]" = OrderedDict()
+        self._sources: Dict[str, SourceLoader] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bank_reads = 0
+        self.unresolved = 0
+
+    def register_source(self, source: str, loader: SourceLoader):
+        """Set the loader that reads questions of a reference prefix from their bank"""
+        self._sources[source] = loader
+
+    @staticmethod
+    def is_ref(value: str) -> bool:
+        """Whether a session-state string is a bank reference (plain IDs have no ':')"""
+        source, sep, _ = value.partition(":")
+        return bool(sep) and source in (GENERAL_SOURCE, PERSONALIZED_SOURCE)
+
+    def intern(self, question: InterviewQuestion, ref: Optional[str] = None) -> InterviewQuestion:
+        """
+        The registry's copy of a question (registering it if new)
+
+        Args:
+            question: Question as read from its bank
+            ref: Its bank reference; questions without one are not shared
+
+        Returns:
+            The shared object for ref, or the question itself
+        """
+        if ref is None:
+            return question
+
+        with self._lock:
+            existing = self._questions.get(ref)
+            if existing is not None:
+                self._questions.move_to_end(ref)
+                self.hits += 1
+                return existing
+            self.misses += 1
+            question._bank_ref = ref
+            self._insert(ref, question)
+        return question
+
+    def resolve(self, refs: Iterable[str]) -> Dict[str, InterviewQuestion]:
+        """
+        Questions for bank references
+
+        Registered questions are returned as is; the rest are read from
+        their banks, grouped into one read per source and scope. References
+        whose question no longer exists (e.g. a deleted personalized RAG)
+        are missing from the result.
+        """
+        found: Dict[str, InterviewQuestion] = {}
+        missing: Dict[Tuple[str, str], Dict[str, str]] = defaultdict(dict)
+        with self._lock:
+            for ref in refs:
+                if ref in found:
+                    continue
+                question = self._questions.get(ref)
+                if question is not None:
+                    self._questions.move_to_end(ref)
+                    self.hits += 1
+                    found[ref] = question
+                else:
+                    source, scope, question_id = _split_ref(ref)
+                    missing[(source, scope)][question_id] = ref
+
+        for (source, scope), wanted in missing.items():
+            loader = self._sources.get(source)
+            loaded: List[InterviewQuestion] = []
+            if loader is not None:
+                try:
+                    loaded = loader(scope, list(wanted))
+                except Exception as e:
+                    logger.error(f"Failed to read questions from source {source!r} ({scope}): {e}")
+            with self._lock:
+                self.bank_reads += 1
+
+            for question in loaded:
+                ref = wanted.pop(question.id, None)
+                if ref is not None:
+                    found[ref] = self.intern(question, ref)
+            if wanted:
+                with self._lock:
+                    self.unresolved += len(wanted)
+                logger.warning(f"Unresolved question references: {', '.join(wanted.values())}")
+
+        return found
+
+    def _insert(self, ref: str, question: InterviewQuestion):
+        self._questions[ref] = question
+        while len(self._questions) > self.max_size:
+            self._questions.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "questions": len(self._questions),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bank_reads": self.bank_reads,
+                "unresolved": self.unresolved
+            }
+
+
+# Singleton accessor
+_registry: Optional[QuestionRegistry] = None
+
+def get_question_registry() -> QuestionRegistry:
+    """Get the question registry singleton"""
+    global _registry
+    if _registry is None:
+        _registry = QuestionRegistry(get_settings().QUESTION_REGISTRY_SIZE)
+    return _registry
@@ -0,0 +1,215 @@
+"""
+SmartSuccess.AI GPU Backend - Session Lifecycle
+Idle-timeout eviction, capacity limits and eviction snapshots for interview sessions
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from config import get_settings
+from models.schemas import InterviewConfig
+from services.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+
+# Eviction reasons
+EVICT_IDLE = "idle"
+EVICT_CAPACITY = "capacity"
+
+
+class SessionLifecycleManager:
+    """
+    Evicts abandoned interview sessions from the session store
+
+    - Idle timeout: a session is abandoned once no turn arrived for
+      QUESTION_TIMEOUT * SESSION_IDLE_FACTOR seconds, or once its
+      time_limit_minutes (plus one question timeout) has run out.
+      The deadline is recomputed on every save.
+    - Capacity: at most MAX_ACTIVE_SESSIONS sessions; creating one beyond
+      the cap evicts the least recently active sessions first.
+    - A background sweeper removes sessions past their deadline every
+      SESSION_SWEEP_INTERVAL seconds.
+    - On eviction an optional final-feedback snapshot is written to
+      SESSION_SNAPSHOT_DIR so abandoned interviews are not lost.
+
+    Several workers may sweep the same shared store; a session counts as
+    evicted only for the worker whose delete removed it.
+    """
+
+    def __init__(
+        self,
+        store: SessionStore,
+        snapshot_fn: Optional[Callable[[bytes], Optional[Dict[str, Any]]]] = None,
+        on_evict: Optional[Callable[[str], None]] = None
+    ):
+        self.settings = get_settings()
+        self.store = store
+        self.snapshot_fn = snapshot_fn
+        self.on_evict = on_evict
+
+        self.idle_timeout = self.settings.QUESTION_TIMEOUT * self.settings.SESSION_IDLE_FACTOR
+        self.max_sessions = self.settings.MAX_ACTIVE_SESSIONS
+        self.sweep_interval = self.settings.SESSION_SWEEP_INTERVAL
+        self.snapshot_dir = self.settings.SESSION_SNAPSHOT_DIR if self.settings.SESSION_SNAPSHOT_ON_EVICT else None
+
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            "evicted_idle": 0,
+            "evicted_capacity": 0,
+            "snapshots_written": 0,
+            "snapshot_failures": 0,
+            "sweeps": 0,
+            "last_sweep_ms": 0.0
+        }
+
+    def deadline_for(self, config: InterviewConfig, started_at: datetime) -> float:
+        """
+        Time after which a session with this config counts as abandoned
+
+        Args:
+            config: The session's configuration
+            started_at: When it started (naive UTC, as InterviewSession keeps it)
+        """
+        deadline = time.time() + self.idle_timeout
+
+        if config.time_limit_minutes:
+            limit = started_at.replace(tzinfo=timezone.utc).timestamp() + config.time_limit_minutes * 60 + self.settings.QUESTION_TIMEOUT
+            deadline = min(deadline, limit)
+
+        return deadline
+
+    def make_room(self) -> int:
+        """Evict least recently active sessions so one more fits under the cap"""
+        # count() may include index entries of expired sessions; it only
+        # rules out the common case, the live list sets how many must go
+        if self.store.count() < self.max_sessions:
+            return 0
+        entries = self.store.activity()
+        excess = len(entries) - self.max_sessions + 1
+
+        # Sessions another worker evicted first cannot be evicted again;
+        # keep going down the list until enough deletes succeeded
+        evicted = 0
+        for entry in entries:
+            if evicted >= excess:
+                break
+            if self.evict(entry.session_id, EVICT_CAPACITY):
+                evicted += 1
+        return evicted
+
+    def sweep(self) -> int:
+        """Evict every session past its deadline, then enforce the cap"""
+        start = time.time()
+        evicted = 0
+
+        remaining = []
+        for entry in self.store.activity():
+            if entry.deadline <= start:
+                if self.evict(entry.session_id, EVICT_IDLE):
+                    evicted += 1
+            else:
+                remaining.append(entry)
+
+        # Oldest first, so the excess is the head of the list
+        for entry in remaining[:max(0, len(remaining) - self.max_sessions)]:
+            if self.evict(entry.session_id, EVICT_CAPACITY):
+                evicted += 1
+
+        self.stats["sweeps"] += 1
+        self.stats["last_sweep_ms"] = (time.time() - start) * 1000
+        if evicted:
+            logger.info(f"Session sweep evicted {evicted} sessions in {self.stats['last_sweep_ms']:.1f}ms")
+        return evicted
+
+    def evict(self, session_id: str, reason: str) -> bool:
+        """Snapshot (if enabled) and remove a session"""
+        if self.snapshot_dir and self.snapshot_fn:
+            self._write_snapshot(session_id, reason)
+
+        if not self.store.delete(session_id):
+            return False
+
+        if self.on_evict:
+            self.on_evict(session_id)
+
+        self.stats[f"evicted_{reason}"] += 1
+        logger.info(f"Evicted session {session_id} ({reason})")
+        return True
+
+    def _write_snapshot(self, session_id: str, reason: str):
+        entry = self.store.load(session_id)
+        if entry is None:
+            return
+
+        try:
+            snapshot = self.snapshot_fn(entry[1])
+            if snapshot is None:
+                return
+
+            snapshot["evicted_at"] = datetime.utcnow().isoformat()
+            snapshot["eviction_reason"] = reason
+
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            path = os.path.join(self.snapshot_dir, f"{session_id}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, default=str)
+            self.stats["snapshots_written"] += 1
+
+        except Exception as e:
+            logger.error(f"Failed to snapshot session {session_id}: {e}")
+            self.stats["snapshot_failures"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Session counts, stored payload sizes and eviction counters
+
+        Between turns a session exists only as its packed state in the
+        store, so the payload sizes are what each session holds there
+        (not the size of a loaded InterviewSession).
+        """
+        entries = self.store.activity()
+        sizes = [entry.size for entry in entries]
+        total = sum(sizes)
+
+        return {
+            "active_sessions": len(entries),
+            "max_sessions": self.max_sessions,
+            "idle_timeout_seconds": self.idle_timeout,
+            "session_payload_bytes_total": total,
+            "session_payload_bytes_avg": total / len(sizes) if sizes else 0,
+            "session_payload_bytes_max": max(sizes) if sizes else 0,
+            **self.stats
+        }
+
+    # ------------------------------------------------------------------
+    # Background sweeper
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the background sweeper on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception as e:
+                logger.error(f"Session sweep failed: {e}")
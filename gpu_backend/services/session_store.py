@@ -0,0 +1,513 @@
+"""
+SmartSuccess.AI GPU Backend - Session Store
+Shared interview session storage across uvicorn workers
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis = None
+    REDIS_AVAILABLE = False
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class SessionConflictError(Exception):
+    """Raised when a session was modified (or removed) by a concurrent turn"""
+
+
+class SessionActivity(NamedTuple):
+    """Activity index entry used for idle and capacity eviction"""
+    session_id: str
+    last_active: float  # Time of the last create/save
+    deadline: float  # Time after which the session counts as abandoned
+    size: int  # Serialized payload size in bytes
+
+
+# ============================================================================
+# Serialization
+# ============================================================================
+
+# Payload prefixes: plain compact JSON or zlib-compressed compact JSON
+_PLAIN = b"j"
+_ZLIB = b"z"
+_COMPRESS_MIN_BYTES = 2048
+
+
+def pack_state(state: Dict[str, Any]) -> bytes:
+    """Encode a session state dict as compact (optionally compressed) JSON"""
+    data = json.dumps(state, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if len(data) >= _COMPRESS_MIN_BYTES:
+        return _ZLIB + zlib.compress(data, 1)
+    return _PLAIN + data
+
+
+def unpack_state(payload: bytes) -> Dict[str, Any]:
+    """Decode a payload produced by pack_state"""
+    kind, data = payload[:1], payload[1:]
+    if kind == _ZLIB:
+        data = zlib.decompress(data)
+    elif kind != _PLAIN:
+        raise ValueError(f"Unknown session payload format: {kind!r}")
+    return json.loads(data)
+
+
+# ============================================================================
+# Stores
+# ============================================================================
+
+class SessionStore(ABC):
+    """
+    Versioned key/value store for serialized interview sessions
+
+    Every session carries a version that starts at 1 and is bumped by each
+    save. save() is a compare-and-set on the version the caller loaded, so
+    two turns racing on the same session (on one worker or across workers)
+    cannot silently overwrite each other; the loser gets a
+    SessionConflictError. Sessions expire after ``ttl`` seconds without a
+    write; that is only a backstop, the lifecycle manager evicts sessions
+    earlier using their ``deadline`` and the activity index.
+    """
+
+    name = "base"
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        """Return (version, payload), or None if missing or expired"""
+
+    @abstractmethod
+    def create(self, session_id: str, payload: bytes, deadline: Optional[float] = None) -> int:
+        """Store a new session and return its version (1)"""
+
+    @abstractmethod
+    def save(
+        self,
+        session_id: str,
+        payload: bytes,
+        expected_version: int,
+        deadline: Optional[float] = None
+    ) -> int:
+        """Replace a session if it is still at expected_version; return the new version"""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """Remove a session; return whether it existed"""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of live sessions"""
+
+    @abstractmethod
+    def activity(self, limit: Optional[int] = None) -> List[SessionActivity]:
+        """Live sessions, least recently active first"""
+
+    def close(self):
+        pass
+
+
+class InMemorySessionStore(SessionStore):
+    """Process-local store (single worker only)"""
+
+    name = "memory"
+
+    def __init__(self, ttl: int):
+        super().__init__(ttl)
+        self._lock = threading.Lock()
+        # session_id -> (version, payload, expires_at, last_active, deadline),
+        # kept in least-recently-active order
+        self._sessions: "OrderedDict[str, Tuple[int, bytes, float, float, float]]" = OrderedDict()
+
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        entry = self._sessions.get(session_id)
+        if entry is None or entry[2] <= time.time():
+            return None
+        return entry[0], entry[1]
+
+    def create(self, session_id: str, payload: bytes, deadline: Optional[float] = None) -> int:
+        now = time.time()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is not None and entry[2] > now:
+                raise SessionConflictError(f"Session already exists: {session_id}")
+            self._sessions[session_id] = (1, payload, now + self.ttl, now, deadline or now + self.ttl)
+            self._sessions.move_to_end(session_id)
+        return 1
+
+    def save(
+        self,
+        session_id: str,
+        payload: bytes,
+        expected_version: int,
+        deadline: Optional[float] = None
+    ) -> int:
+        now = time.time()
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None or entry[2] <= now:
+                raise SessionConflictError(f"Session no longer exists: {session_id}")
+            if entry[0] != expected_version:
+                raise SessionConflictError(
+                    f"Session {session_id} was modified concurrently "
+                    f"(expected version {expected_version}, found {entry[0]})"
+                )
+            version = expected_version + 1
+            self._sessions[session_id] = (version, payload, now + self.ttl, now, deadline or now + self.ttl)
+            self._sessions.move_to_end(session_id)
+        return version
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def count(self) -> int:
+        now = time.time()
+        with self._lock:
+            expired = [sid for sid, entry in self._sessions.items() if entry[2] <= now]
+            for sid in expired:
+                del self._sessions[sid]
+            return len(self._sessions)
+
+    def activity(self, limit: Optional[int] = None) -> List[SessionActivity]:
+        now = time.time()
+        entries = []
+        with self._lock:
+            for sid, entry in self._sessions.items():
+                if limit is not None and len(entries) >= limit:
+                    break
+                if entry[2] > now:
+                    entries.append(SessionActivity(sid, entry[3], entry[4], len(entry[1])))
+        return entries
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite store in WAL mode, shared by all workers on one host
+
+    Each thread keeps its own connection; WAL lets readers proceed while a
+    turn commits, and the compare-and-set is a single conditional UPDATE.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, ttl: int):
+        super().__init__(ttl)
+        self.path = path
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._conn()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, "
+            "version INTEGER NOT NULL, "
+            "payload BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, "
+            "last_active REAL NOT NULL DEFAULT 0, "
+            "deadline REAL NOT NULL DEFAULT 0)"
+        )
+        # Tables created before the activity columns existed
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+        for column in ("last_active", "deadline"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE sessions ADD COLUMN {column} REAL NOT NULL DEFAULT 0")
+        conn.execute("CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at)")
+        conn.execute("CREATE INDEX IF NOT EXISTS sessions_last_active ON sessions (last_active)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        row = self._conn().execute(
+            "SELECT version, payload FROM sessions WHERE session_id = ? AND expires_at > ?",
+            (session_id, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], bytes(row[1])
+
+    def create(self, session_id: str, payload: bytes, deadline: Optional[float] = None) -> int:
+        now = time.time()
+        conn = self._conn()
+        # Creates are rare, so they also purge expired sessions
+        conn.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+        try:
+            conn.execute(
+                "INSERT INTO sessions (session_id, version, payload, expires_at, last_active, deadline) "
+                "VALUES (?, 1, ?, ?, ?, ?)",
+                (session_id, payload, now + self.ttl, now, deadline or now + self.ttl)
+            )
+        except sqlite3.IntegrityError:
+            raise SessionConflictError(f"Session already exists: {session_id}")
+        return 1
+
+    def save(
+        self,
+        session_id: str,
+        payload: bytes,
+        expected_version: int,
+        deadline: Optional[float] = None
+    ) -> int:
+        now = time.time()
+        cursor = self._conn().execute(
+            "UPDATE sessions SET version = version + 1, payload = ?, expires_at = ?, "
+            "last_active = ?, deadline = ? "
+            "WHERE session_id = ? AND version = ? AND expires_at > ?",
+            (payload, now + self.ttl, now, deadline or now + self.ttl,
+             session_id, expected_version, now)
+        )
+        if cursor.rowcount != 1:
+            raise SessionConflictError(
+                f"Session {session_id} was modified concurrently or no longer exists "
+                f"(expected version {expected_version})"
+            )
+        return expected_version + 1
+
+    def delete(self, session_id: str) -> bool:
+        cursor = self._conn().execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        return cursor.rowcount > 0
+
+    def count(self) -> int:
+        row = self._conn().execute(
+            "SELECT COUNT(*) FROM sessions WHERE expires_at > ?", (time.time(),)
+        ).fetchone()
+        return row[0]
+
+    def activity(self, limit: Optional[int] = None) -> List[SessionActivity]:
+        rows = self._conn().execute(
+            "SELECT session_id, last_active, deadline, length(payload) FROM sessions "
+            "WHERE expires_at > ? ORDER BY last_active LIMIT ?",
+            (time.time(), -1 if limit is None else limit)
+        ).fetchall()
+        return [SessionActivity(*row) for row in rows]
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Redis store, shared by all workers and hosts
+
+    Each session is a hash {v: version, p: payload, d: deadline}, and a
+    sorted set scored by last activity indexes all sessions. Create and
+    compare-and-set are Lua scripts, so every store operation is a single
+    round trip and atomic on the server. Works with any client speaking the
+    redis-py API (e.g. a fakeredis instance for local testing).
+    """
+
+    name = "redis"
+
+    _CREATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'v', 1, 'p', ARGV[1], 'd', ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('ZADD', KEYS[2], ARGV[3], ARGV[5])
+return 1
+"""
+
+    _SAVE_SCRIPT = """
+local version = tonumber(redis.call('HGET', KEYS[1], 'v'))
+if version == nil or version ~= tonumber(ARGV[1]) then
+    return -1
+end
+redis.call('HSET', KEYS[1], 'v', version + 1, 'p', ARGV[2], 'd', ARGV[5])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('ZADD', KEYS[2], ARGV[4], ARGV[6])
+return version + 1
+"""
+
+    def __init__(
+        self,
+        ttl: int,
+        url: Optional[str] = None,
+        client: Optional[Any] = None,
+        prefix: str = "smartsuccess:session:"
+    ):
+        super().__init__(ttl)
+        if client is None:
+            if not REDIS_AVAILABLE:
+                raise RuntimeError("redis package is not installed")
+            client = redis.Redis.from_url(url, socket_connect_timeout=1.0)
+        self.client = client
+        self.prefix = prefix
+        self.index_key = f"{prefix}__activity__"
+        self._create = client.register_script(self._CREATE_SCRIPT)
+        self._save = client.register_script(self._SAVE_SCRIPT)
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.prefix}{session_id}"
+
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        version, payload = self.client.hmget(self._key(session_id), "v", "p")
+        if version is None or payload is None:
+            return None
+        return int(version), payload
+
+    def create(self, session_id: str, payload: bytes, deadline: Optional[float] = None) -> int:
+        now = time.time()
+        created = self._create(
+            keys=[self._key(session_id), self.index_key],
+            args=[payload, self.ttl, now, deadline or now + self.ttl, session_id]
+        )
+        if not created:
+            raise SessionConflictError(f"Session already exists: {session_id}")
+        return 1
+
+    def save(
+        self,
+        session_id: str,
+        payload: bytes,
+        expected_version: int,
+        deadline: Optional[float] = None
+    ) -> int:
+        now = time.time()
+        version = self._save(
+            keys=[self._key(session_id), self.index_key],
+            args=[expected_version, payload, self.ttl, now, deadline or now + self.ttl, session_id]
+        )
+        if version < 0:
+            raise SessionConflictError(
+                f"Session {session_id} was modified concurrently or no longer exists "
+                f"(expected version {expected_version})"
+            )
+        return int(version)
+
+    def delete(self, session_id: str) -> bool:
+        pipe = self.client.pipeline()
+        pipe.delete(self._key(session_id))
+        pipe.zrem(self.index_key, session_id)
+        deleted, _ = pipe.execute()
+        return deleted > 0
+
+    def count(self) -> int:
+        # Sessions dropped by the TTL backstop stay indexed until activity() prunes them
+        return self.client.zcard(self.index_key)
+
+    def activity(self, limit: Optional[int] = None) -> List[SessionActivity]:
+        members = self.client.zrange(
+            self.index_key, 0, -1 if limit is None else limit - 1, withscores=True
+        )
+        if not members:
+            return []
+
+        pipe = self.client.pipeline()
+        for member, _ in members:
+            key = self._key(member.decode() if isinstance(member, bytes) else member)
+            pipe.hget(key, "d")
+            pipe.hstrlen(key, "p")
+        values = pipe.execute()
+
+        entries = []
+        stale = []
+        for i, (member, last_active) in enumerate(members):
+            session_id = member.decode() if isinstance(member, bytes) else member
+            deadline, size = values[2 * i], values[2 * i + 1]
+            if deadline is None:
+                stale.append(session_id)
+                continue
+            entries.append(SessionActivity(session_id, last_active, float(deadline), size))
+
+        if stale:
+            self.client.zrem(self.index_key, *stale)
+        return entries
+
+    def close(self):
+        try:
+            self.client.close()
+        except Exception:
+            pass
+
+
+# ============================================================================
+# Backend selection
+# ============================================================================
+
+def _redis_reachable(url: str) -> bool:
+    if not REDIS_AVAILABLE or not url:
+        return False
+    try:
+        client = redis.Redis.from_url(url, socket_connect_timeout=0.5)
+        client.ping()
+        client.close()
+        return True
+    except Exception:
+        return False
+
+
+def create_session_store(backend: Optional[str] = None) -> SessionStore:
+    """
+    Create a session store
+
+    Args:
+        backend: "memory", "sqlite", "redis" or "auto" (default: SESSION_STORE).
+            "auto" uses Redis when REDIS_URL is reachable, otherwise SQLite
+            when running several workers, otherwise memory.
+
+    Returns:
+        SessionStore instance
+    """
+    settings = get_settings()
+    backend = (backend or settings.SESSION_STORE).lower()
+
+    if backend == "auto":
+        if _redis_reachable(settings.REDIS_URL):
+            backend = "redis"
+        elif settings.WORKERS > 1:
+            backend = "sqlite"
+        else:
+            backend = "memory"
+
+    if backend == "redis":
+        store = RedisSessionStore(
+            ttl=settings.SESSION_TTL,
+            url=settings.REDIS_URL,
+            prefix=settings.SESSION_KEY_PREFIX
+        )
+    elif backend == "sqlite":
+        store = SQLiteSessionStore(settings.SESSION_DB_PATH, ttl=settings.SESSION_TTL)
+    elif backend == "memory":
+        store = InMemorySessionStore(ttl=settings.SESSION_TTL)
+    else:
+        raise ValueError(f"Unknown session store backend: {backend}")
+
+    logger.info(f"Session store: {store.name}")
+    return store
+
+
+# Singleton accessor
+_store: Optional[SessionStore] = None
+
+def get_session_store() -> SessionStore:
+    """Get the session store singleton"""
+    global _store
+    if _store is None:
+        _store = create_session_store()
+    return _store
@@ -0,0 +1,156 @@
+"""
+SmartSuccess.AI GPU Backend - Speaker Latent Cache
+XTTS speaker conditioning latents computed once per reference wav
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+logger = logging.getLogger(__name__)
+
+
+Latents = Tuple[Any, Any]  # (gpt_cond_latent, speaker_embedding)
+
+
+class SpeakerLatentCache:
+    """
+    Memory + disk cache of XTTS conditioning latents
+
+    XTTS conditions every synthesis on a GPT latent and a speaker
+    embedding computed from the reference wav; passing speaker_wav
+    recomputes both on each call. Entries are keyed by a hash of the wav
+    bytes, the model version and the conditioning settings, so a changed
+    reference file or model gets fresh latents. The disk tier (one
+    torch.save file per entry) lets restarts and other workers skip the
+    computation.
+
+    Methods are thread-safe; synthesis runs in worker threads.
+    """
+
+    def __init__(self, model_version: str, disk_dir: Optional[str] = None):
+        self.model_version = model_version
+        self.disk_dir = disk_dir or None
+
+        self._lock = threading.Lock()
+        self._memory: Dict[str, Latents] = {}
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "computed": 0,
+            "disk_errors": 0
+        }
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def key(self, wav_path: str, xtts: Any) -> str:
+        """Hash of the reference audio, model version and conditioning settings"""
+        config = xtts.config
+        digest = hashlib.sha256()
+        digest.update(
+            f"{self.model_version}|{config.gpt_cond_len}|{config.gpt_cond_chunk_len}|"
+            f"{config.max_ref_len}|{config.sound_norm_refs}|".encode("utf-8")
+        )
+        with open(wav_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, wav_path: str, xtts: Any, device: str) -> Tuple[str, Latents]:
+        """
+        Latents of a reference wav, computed on first use
+
+        Args:
+            wav_path: Speaker reference audio
+            xtts: The loaded XTTS model (synthesizer.tts_model)
+            device: Device the latents are used on
+
+        Returns:
+            (cache key, (gpt_cond_latent, speaker_embedding))
+        """
+        key = self.key(wav_path, xtts)
+        with self._lock:
+            latents = self._memory.get(key)
+            if latents is not None:
+                self.stats["memory_hits"] += 1
+                return key, latents
+
+        latents = self._read_disk(key, device)
+        if latents is None:
+            config = xtts.config
+            latents = xtts.get_conditioning_latents(
+                audio_path=[wav_path],
+                gpt_cond_len=config.gpt_cond_len,
+                gpt_cond_chunk_len=config.gpt_cond_chunk_len,
+                max_ref_length=config.max_ref_len,
+                sound_norm_refs=config.sound_norm_refs
+            )
+            with self._lock:
+                self.stats["computed"] += 1
+            self._write_disk(key, latents)
+
+        with self._lock:
+            self._memory[key] = latents
+        return key, latents
+
+    def clear(self):
+        """Drop the memory tier (e.g. when the model is unloaded)"""
+        with self._lock:
+            self._memory.clear()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.pt")
+
+    def _read_disk(self, key: str, device: str) -> Optional[Latents]:
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            data = torch.load(path, map_location=device)
+            with self._lock:
+                self.stats["disk_hits"] += 1
+            return data["gpt_cond_latent"], data["speaker_embedding"]
+        except Exception as e:
+            logger.warning(f"Unreadable speaker latents {path}: {e}")
+            with self._lock:
+                self.stats["disk_errors"] += 1
+            return None
+
+    def _write_disk(self, key: str, latents: Latents):
+        if not self.disk_dir:
+            return
+        gpt_cond_latent, speaker_embedding = latents
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            torch.save(
+                {"gpt_cond_latent": gpt_cond_latent.cpu(), "speaker_embedding": speaker_embedding.cpu()},
+                tmp_path
+            )
+            # Atomic so concurrent workers never read a partial file
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to store speaker latents {path}: {e}")
+            with self._lock:
+                self.stats["disk_errors"] += 1
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self.stats,
+                "entries": len(self._memory),
+                "disk_enabled": self.disk_dir is not None
+            }
@@ -0,0 +1,367 @@
+"""
+SmartSuccess.AI GPU Backend - Streaming ASR
+Incremental transcription of live PCM audio with partial hypotheses
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+from fastapi import WebSocket
+
+from models.schemas import TranscriptionRequest
+from services.audio_io import ASR_SAMPLE_RATE, resample
+from services.audio_segmentation import ABSOLUTE_FLOOR_DB, FRAME_MS, PAD_MS, frame_energy_db, speech_chunks
+from services.ws_channel import ChannelClosed, WebSocketChannel, WS_CLOSE_TOO_BIG
+
+logger = logging.getLogger(__name__)
+
+
+NOISE_HISTORY_MS = 10000  # Frames the noise floor is estimated over
+MAX_SEGMENT_SECONDS = 30  # Whisper's window
+
+
+class StreamingTranscriber:
+    """
+    Incremental transcription of one audio stream (PCM s16le mono)
+
+    Audio is pushed as it arrives and tracked frame by frame with the
+    same energy VAD as long-form transcription (noise floor over the last
+    NOISE_HISTORY_MS). A segment is committed once speech is followed by
+    an endpoint pause, or when it reaches 30 s (cut at its quietest
+    pause). Committed segments are transcribed once, as finals; while
+    the user keeps talking, the uncommitted audio is re-transcribed every
+    partial interval as an unstable partial hypothesis. Silence before
+    speech is dropped as it arrives.
+
+    When the stream ends only the last, uncommitted segment still needs
+    decoding. Decoding goes through VoiceService.transcribe_samples, one
+    call at a time per stream; finals take priority over partials.
+    """
+
+    def __init__(
+        self,
+        voice_service,
+        request: TranscriptionRequest,
+        sample_rate: int = ASR_SAMPLE_RATE,
+        endpoint_ms: int = 600,
+        partial_interval_ms: int = 1000,
+        threshold_db: float = 12.0
+    ):
+        self.voice_service = voice_service
+        self.request = request
+        self.sample_rate = sample_rate
+        self.threshold_db = threshold_db
+
+        self.frame = max(1, sample_rate * FRAME_MS // 1000)
+        self.endpoint_frames = max(1, endpoint_ms // FRAME_MS)
+        self.pad_frames = PAD_MS // FRAME_MS
+        self.partial_samples = sample_rate * partial_interval_ms // 1000
+        self.max_samples = sample_rate * MAX_SEGMENT_SECONDS
+
+        self._noise: Deque[float] = deque(maxlen=NOISE_HISTORY_MS // FRAME_MS)
+        self.reset()
+
+    def reset(self):
+        """Forget the current utterance"""
+        # Uncommitted audio: _data[:_length], grown by doubling so pushes
+        # of small frames do not copy the whole buffer each time
+        self._data = np.zeros(self.sample_rate, dtype=np.float32)
+        self._length = 0
+        self._buffer_start = 0  # Stream sample offset of _buffer[0]
+        self._tail = b""  # Bytes of an incomplete sample or frame
+        self._analyzed = 0  # Frames of _buffer with known energy
+        self._speech_frames: List[int] = []  # Speech frame indices within _buffer
+        self._silent_run = 0  # Trailing non-speech frames
+        self._last_partial = 0  # Buffer length at the last partial
+        self._committed: Deque[Tuple[np.ndarray, int]] = deque()
+        self.finals: List[Dict[str, Any]] = []
+        self.received_samples = 0
+
+    @property
+    def _buffer(self) -> np.ndarray:
+        return self._data[:self._length]
+
+    @property
+    def pending_seconds(self) -> float:
+        """Audio received but not yet transcribed as final"""
+        committed = sum(len(audio) for audio, _ in self._committed)
+        return (committed + len(self._buffer)) / self.sample_rate
+
+    def push(self, pcm: bytes):
+        """Append PCM s16le frames and commit segments that are complete"""
+        data = self._tail + pcm
+        usable = len(data) - len(data) % 2
+        self._tail = data[usable:]
+        if not usable:
+            return
+
+        samples = np.frombuffer(data[:usable], dtype="<i2").astype(np.float32) / 32768.0
+        needed = self._length + len(samples)
+        if needed > len(self._data):
+            grown = np.zeros(max(needed, 2 * len(self._data)), dtype=np.float32)
+            grown[:self._length] = self._buffer
+            self._data = grown
+        self._data[self._length:needed] = samples
+        self._length = needed
+        self.received_samples += len(samples)
+        self._analyze()
+
+    def _analyze(self):
+        n_frames = len(self._buffer) // self.frame
+        if n_frames <= self._analyzed:
+            return
+
+        energies = frame_energy_db(self._buffer[self._analyzed * self.frame:n_frames * self.frame], self.frame)
+        for offset, energy in enumerate(energies):
+            index = self._analyzed + offset
+            floor = float(np.percentile(self._noise, 10)) if self._noise else float(energy)
+            self._noise.append(float(energy))
+            if energy > max(floor + self.threshold_db, ABSOLUTE_FLOOR_DB):
+                self._speech_frames.append(index)
+                self._silent_run = 0
+            else:
+                self._silent_run += 1
+        self._analyzed = n_frames
+
+        if not self._speech_frames:
+            # Nothing said yet: keep only the padding before speech
+            keep = self.pad_frames * self.frame
+            drop = max(0, (self._analyzed - self.pad_frames) * self.frame)
+            if drop and len(self._buffer) > keep:
+                self._advance(drop)
+            return
+
+        if self._silent_run >= self.endpoint_frames:
+            end = (self._speech_frames[-1] + 1 + self.pad_frames) * self.frame
+            self._commit(end)
+        elif len(self._buffer) >= self.max_samples:
+            chunks = speech_chunks(self._buffer, self.sample_rate, max_seconds=MAX_SEGMENT_SECONDS)
+            self._commit(chunks[0][1] if chunks else self.max_samples)
+
+    def _commit(self, end: int):
+        """Queue _buffer[:end] for final transcription"""
+        # Whole frames only, as _advance() drops
+        end = min(end, len(self._buffer)) // self.frame * self.frame
+        if end > 0:
+            self._committed.append((self._buffer[:end].copy(), self._buffer_start))
+        self._advance(end)
+        self._last_partial = 0
+
+    def _advance(self, samples: int):
+        """Drop samples from the front of the uncommitted buffer"""
+        frames = samples // self.frame
+        samples = frames * self.frame
+        remaining = self._length - samples
+        self._data[:remaining] = self._data[samples:self._length]
+        self._length = remaining
+        self._buffer_start += samples
+        self._analyzed = max(0, self._analyzed - frames)
+        self._speech_frames = [i - frames for i in self._speech_frames if i >= frames]
+        if not self._speech_frames:
+            self._silent_run = self._analyzed
+
+    # ------------------------------------------------------------------
+    # Decoding
+    # ------------------------------------------------------------------
+
+    async def poll(self) -> List[Dict[str, Any]]:
+        """
+        Run at most one decode that is due
+
+        Returns:
+            The resulting events: [{"type": "final", ...}] for a committed
+            segment, [{"type": "partial", ...}] for the uncommitted audio,
+            or [] when nothing is due
+        """
+        if self._committed:
+            audio, start = self._committed.popleft()
+            return [await self._final(audio, start)]
+
+        grown = len(self._buffer) - self._last_partial
+        if self._speech_frames and grown >= self.partial_samples:
+            self._last_partial = len(self._buffer)
+            start = self._buffer_start
+            end = start + self._last_partial
+            response = await self._decode(self._buffer.copy())
+            return [{
+                "type": "partial",
+                "text": response.text,
+                "start": start / self.sample_rate,
+                "end": end / self.sample_rate
+            }]
+        return []
+
+    async def finish(self) -> List[Dict[str, Any]]:
+        """
+        Commit the rest of the utterance and transcribe what is left
+
+        Returns:
+            The remaining final events followed by
+            {"type": "done", "text": ..., "segments": [...], "duration_seconds": ...};
+            the transcriber is reset for the next utterance
+        """
+        if self._speech_frames:
+            self._commit((self._speech_frames[-1] + 1 + self.pad_frames) * self.frame)
+
+        events = []
+        while self._committed:
+            audio, start = self._committed.popleft()
+            events.append(await self._final(audio, start))
+
+        events.append({
+            "type": "done",
+            "text": " ".join(final["text"] for final in self.finals if final["text"]),
+            "segments": self.finals,
+            "duration_seconds": self.received_samples / self.sample_rate
+        })
+        self.reset()
+        return events
+
+    async def _final(self, audio: np.ndarray, start: int) -> Dict[str, Any]:
+        response = await self._decode(audio)
+        offset = start / self.sample_rate
+        event = {
+            "type": "final",
+            "segment": len(self.finals),
+            "text": response.text,
+            "start": offset,
+            "end": offset + len(audio) / self.sample_rate,
+            "confidence": response.confidence
+        }
+        self.finals.append({key: value for key, value in event.items() if key != "type"})
+        return event
+
+    async def _decode(self, audio: np.ndarray):
+        return await self.voice_service.transcribe_samples(
+            resample(audio, self.sample_rate, ASR_SAMPLE_RATE),
+            self.request
+        )
+
+
+class TranscriptionChannel(WebSocketChannel):
+    """
+    Streaming transcription over a WebSocket
+
+    Client -> server:
+    - {"type": "start", "sample_rate": 16000, "language": "en",
+      "initial_prompt": "..."}: optional, before the first audio frame
+    - Binary frames: PCM s16le mono audio as it is recorded
+    - {"type": "end"}: the utterance is over; audio of the next one may
+      follow right away (it is held until "done" is sent)
+    - {"type": "ping"} / {"type": "pong"}
+
+    Server -> client:
+    - {"type": "partial", "text", "start", "end"}: hypothesis for speech
+      that is not committed yet; may still change
+    - {"type": "final", "segment", "text", "start", "end", "confidence"}:
+      a committed segment (times are seconds from the start of the utterance)
+    - {"type": "done", "text", "segments", "duration_seconds"}
+    - {"type": "error", "status": 400|500, "detail": ...}
+    """
+
+    name = "Transcription channel"
+
+    def __init__(self, websocket: WebSocket, channel_id: str, voice_service):
+        super().__init__(websocket, channel_id)
+        self.voice_service = voice_service
+        self.transcriber = self._new_transcriber(TranscriptionRequest(word_timestamps=False), ASR_SAMPLE_RATE)
+        self._wakeup = asyncio.Event()
+        self._ending = False
+        self._held: List[bytes] = []  # Next utterance's audio, sent before "done"
+        self._held_bytes = 0
+        self._decoder: Optional[asyncio.Task] = None
+
+    def _new_transcriber(self, request: TranscriptionRequest, sample_rate: int) -> StreamingTranscriber:
+        return StreamingTranscriber(
+            self.voice_service,
+            request,
+            sample_rate=sample_rate,
+            endpoint_ms=self.settings.ASR_STREAM_ENDPOINT_MS,
+            partial_interval_ms=self.settings.ASR_STREAM_PARTIAL_INTERVAL_MS
+        )
+
+    async def _on_open(self) -> bool:
+        self._decoder = asyncio.create_task(self._decode_loop())
+        return True
+
+    def _pending_tasks(self) -> Tuple[Optional[asyncio.Task], ...]:
+        return (self._decoder,)
+
+    async def _on_binary(self, data: bytes):
+        if self._ending:
+            self._held_bytes += len(data)
+            if self._held_bytes > self.settings.WS_MAX_AUDIO_BYTES:
+                await self._abort(WS_CLOSE_TOO_BIG, "Too much audio sent while finishing the utterance")
+                return
+            self._held.append(data)
+            return
+        max_seconds = self.settings.WS_MAX_AUDIO_BYTES / (2 * self.transcriber.sample_rate)
+        if self.transcriber.pending_seconds > max_seconds:
+            # Decoding fell this far behind the audio
+            await self._abort(WS_CLOSE_TOO_BIG, "Too much audio waiting for transcription")
+            return
+        self.transcriber.push(data)
+        self._wakeup.set()
+
+    async def _on_message(self, kind: str, message: Dict[str, Any]):
+        if kind == "start":
+            if self.transcriber.received_samples:
+                await self._send_error(400, "start must precede the audio of an utterance")
+                return
+            try:
+                request = TranscriptionRequest(
+                    language=message.get("language") or "en",
+                    task=message.get("task") or "transcribe",
+                    word_timestamps=False,
+                    initial_prompt=message.get("initial_prompt")
+                )
+                sample_rate = int(message.get("sample_rate") or ASR_SAMPLE_RATE)
+                if not 8000 <= sample_rate <= 192000:
+                    raise ValueError(f"Unsupported sample rate: {sample_rate}")
+            except (ValueError, TypeError) as e:
+                await self._send_error(400, str(e))
+                return
+            self.transcriber = self._new_transcriber(request, sample_rate)
+        elif kind == "end":
+            self._ending = True
+            self._wakeup.set()
+        else:
+            await self._send_error(400, f"Unknown message type: {kind}")
+
+    async def _decode_loop(self):
+        """Single consumer of the transcriber, so decodes never overlap"""
+        while not self._closed:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                while True:
+                    events = await self.transcriber.poll()
+                    if not events:
+                        break
+                    for event in events:
+                        await self._send_json(event)
+
+                if self._ending:
+                    for event in await self.transcriber.finish():
+                        await self._send_json(event)
+                    self._resume()
+            except ChannelClosed:
+                return
+            except Exception as e:
+                logger.error(f"Streaming transcription failed: {e}")
+                await self._send_error(500, str(e))
+                self.transcriber.reset()
+                self._resume()
+
+    def _resume(self):
+        """Start the next utterance with audio held back while finishing"""
+        self._ending = False
+        held, self._held = self._held, []
+        self._held_bytes = 0
+        for data in held:
+            self.transcriber.push(data)
+        if held:
+            self._wakeup.set()
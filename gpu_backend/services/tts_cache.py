@@ -0,0 +1,261 @@
+"""
+SmartSuccess.AI GPU Backend - TTS Audio Cache
+Content-addressed memory + disk cache of synthesized speech segments
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_segment(text: str) -> str:
+    """Collapse whitespace so "Hello  there " and "Hello there" share audio"""
+    return " ".join(text.split())
+
+
+class TTSAudioCache:
+    """
+    Two-tier cache of synthesized waveforms
+
+    Entries are keyed by a hash of everything that changes the audio:
+    normalized text, voice preset, speed, emotion, language and the model
+    version (model name plus TTS_CACHE_VERSION, bumped when speaker
+    references or post-processing change). Waveforms are stored as
+    float32 so segments can be stitched before encoding.
+
+    - Memory tier: LRU bounded by total waveform bytes.
+    - Disk tier: one .npz file per entry, bounded by total file bytes;
+      least recently used files are removed first. The directory may be
+      shared by several workers and pre-warmed offline.
+
+    Methods are thread-safe; synthesis runs in worker threads.
+    """
+
+    def __init__(
+        self,
+        model_version: str,
+        memory_bytes: int,
+        disk_dir: Optional[str] = None,
+        disk_bytes: int = 0
+    ):
+        self.model_version = model_version
+        self.memory_bytes = memory_bytes
+        self.disk_dir = disk_dir if disk_dir and disk_bytes > 0 else None
+        self.disk_bytes = disk_bytes
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Tuple[np.ndarray, int]]" = OrderedDict()
+        self._memory_used = 0
+        # key -> file size, least recently used first
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_used = 0
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0
+        }
+
+        if self.disk_dir:
+            self._scan_disk()
+
+    def key(
+        self,
+        text: str,
+        voice_preset: str,
+        speed: float,
+        emotion: str,
+        language: str
+    ) -> str:
+        """Content address of one synthesized segment"""
+        material = "\x1f".join([
+            self.model_version,
+            voice_preset,
+            f"{speed:.3f}",
+            emotion,
+            language,
+            normalize_segment(text)
+        ])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            return key in self._memory or key in self._disk
+
+    def get(self, key: str) -> Optional[Tuple[np.ndarray, int]]:
+        """Waveform and sample rate of a cached segment"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return entry
+
+        # Files written by other workers are not in the index yet, so the
+        # disk is checked even when the key is unknown
+        if self.disk_dir:
+            found = self._read_disk(key)
+            if found is not None:
+                audio, sample_rate, size = found
+                entry = (audio, sample_rate)
+                with self._lock:
+                    self.stats["disk_hits"] += 1
+                    if key in self._disk:
+                        self._disk.move_to_end(key)
+                    else:
+                        self._disk[key] = size
+                        self._disk_used += size
+                    self._put_memory(key, entry)
+                return entry
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def put(self, key: str, audio: np.ndarray, sample_rate: int):
+        """Store a synthesized segment in both tiers"""
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        audio.setflags(write=False)
+        with self._lock:
+            self._put_memory(key, (audio, sample_rate))
+        if self.disk_dir:
+            self._write_disk(key, audio, sample_rate)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.stats["memory_hits"] + self.stats["disk_hits"] + self.stats["misses"]
+            hits = lookups - self.stats["misses"]
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_used,
+                "memory_limit_bytes": self.memory_bytes,
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_used,
+                "disk_limit_bytes": self.disk_bytes if self.disk_dir else 0,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                **self.stats
+            }
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_used = 0
+
+    # ------------------------------------------------------------------
+    # Memory tier (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _put_memory(self, key: str, entry: Tuple[np.ndarray, int]):
+        size = entry[0].nbytes
+        if size > self.memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_used -= previous[0].nbytes
+
+        self._memory[key] = entry
+        self._memory_used += size
+
+        while self._memory_used > self.memory_bytes:
+            _, (evicted, _) = self._memory.popitem(last=False)
+            self._memory_used -= evicted.nbytes
+            self.stats["memory_evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], f"{key}.npz")
+
+    def _scan_disk(self):
+        """Index existing cache files, least recently used first"""
+        entries = []
+        try:
+            for shard in os.scandir(self.disk_dir):
+                if not shard.is_dir():
+                    continue
+                for item in os.scandir(shard.path):
+                    if item.name.endswith(".npz"):
+                        stat = item.stat()
+                        entries.append((stat.st_mtime, item.name[:-4], stat.st_size))
+        except FileNotFoundError:
+            return
+
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_used += size
+
+        logger.info(f"TTS disk cache: {len(self._disk)} segments, {self._disk_used / 1e6:.1f}MB")
+        with self._lock:
+            self._evict_disk()
+
+    def _read_disk(self, key: str) -> Optional[Tuple[np.ndarray, int, int]]:
+        """Waveform, sample rate and file size of a cached file"""
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                audio = data["audio"]
+                sample_rate = int(data["sample_rate"])
+            # Refresh recency for other workers scanning the directory
+            os.utime(path)
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            # Never written, or evicted by another worker
+            with self._lock:
+                size = self._disk.pop(key, None)
+                if size is not None:
+                    self._disk_used -= size
+            return None
+        except Exception as e:
+            logger.warning(f"Unreadable TTS cache entry {key}: {e}")
+            return None
+
+        audio.setflags(write=False)
+        return audio, sample_rate, size
+
+    def _write_disk(self, key: str, audio: np.ndarray, sample_rate: int):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                np.savez(f, audio=audio, sample_rate=np.int32(sample_rate))
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+        except Exception as e:
+            logger.warning(f"Failed to write TTS cache entry {key}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            previous = self._disk.pop(key, None)
+            if previous is not None:
+                self._disk_used -= previous
+            self._disk[key] = size
+            self._disk_used += size
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Remove least recently used files beyond the size limit (lock held)"""
+        while self._disk_used > self.disk_bytes and self._disk:
+            key, size = self._disk.popitem(last=False)
+            self._disk_used -= size
+            try:
+                os.unlink(self._path(key))
+            except OSError:
+                pass
+            self.stats["disk_evictions"] += 1
@@ -0,0 +1,97 @@
+"""
+SmartSuccess.AI GPU Backend - Streaming TTS
+Sentence-level splitting and an ordered synthesis pipeline for streamed speech
+"""
+
+import asyncio
+import re
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, TypeVar
+
+from services.tts_cache import normalize_segment
+
+T = TypeVar("T")
+
+_SENTENCE_END = re.compile(r"(?:(?<=[.!?…])|(?<=[.!?…][\"')\]]))\s+")
+_CLAUSE_END = re.compile(r"(?<=[,;:—–])\s+")
+
+
+def _split_long(text: str, max_chars: int) -> List[str]:
+    """Cut text over max_chars at clause boundaries, then at spaces"""
+    if len(text) <= max_chars:
+        return [text]
+
+    pieces = []
+    current = ""
+    for clause in _CLAUSE_END.split(text):
+        candidate = f"{current} {clause}" if current else clause
+        if len(candidate) <= max_chars:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        # A single clause over the limit is cut between words
+        while len(clause) > max_chars:
+            cut = clause.rfind(" ", 0, max_chars + 1)
+            if cut <= 0:
+                cut = max_chars
+            pieces.append(clause[:cut].rstrip())
+            clause = clause[cut:].lstrip()
+        current = clause
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_sentences(text: str, max_chars: int = 200, first_chars: Optional[int] = None) -> List[str]:
+    """
+    Split text into sentences for incremental synthesis
+
+    Sentences over max_chars are cut at clause boundaries. The first
+    piece may be held to first_chars so the first audio arrives sooner
+    (its synthesis time is what the listener waits for).
+
+    Returns:
+        Non-empty pieces that, joined with spaces, give the normalized text
+    """
+    sentences = []
+    for sentence in _SENTENCE_END.split(normalize_segment(text)):
+        if sentence:
+            sentences.extend(_split_long(sentence, max_chars))
+
+    if sentences and first_chars and len(sentences[0]) > first_chars:
+        head = _split_long(sentences[0], first_chars)[0]
+        rest = sentences[0][len(head):].strip()
+        sentences[:1] = [head] + (_split_long(rest, max_chars) if rest else [])
+    return sentences
+
+
+async def ordered_pipeline(
+    items: List[str],
+    render: Callable[[str], Awaitable[T]],
+    lookahead: int = 2
+) -> AsyncIterator[T]:
+    """
+    Render items in a background task and yield the results in order
+
+    Up to `lookahead` results are rendered ahead of the consumer, so the
+    next sentence is synthesizing while the previous one is sent.
+    Closing the iterator (client gone) cancels the outstanding work.
+    """
+    queue: "asyncio.Queue" = asyncio.Queue(maxsize=max(1, lookahead))
+
+    async def produce():
+        try:
+            for item in items:
+                await queue.put((True, await render(item)))
+        except Exception as e:
+            await queue.put((False, e))
+
+    producer = asyncio.create_task(produce())
+    try:
+        for _ in items:
+            ok, value = await queue.get()
+            if not ok:
+                raise value
+            yield value
+    finally:
+        producer.cancel()
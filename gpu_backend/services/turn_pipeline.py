@@ -0,0 +1,128 @@
+"""
+SmartSuccess.AI GPU Backend - Turn Pipeline
+Dependency-graph execution and span tracing for interview turns
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Awaited with (stage name, stage result) when a stage finishes
+StageListener = Callable[[str, Any], Awaitable[None]]
+
+# Awaited with each piece of synthesized speech as it is encoded
+AudioListener = Callable[[bytes], Awaitable[None]]
+
+
+class TurnTrace:
+    """
+    Runs the stages of one interview turn as a small dependency graph
+
+    Each stage is started as a task as soon as it is declared and awaits
+    only the stages it depends on, so independent stages (e.g. scoring the
+    answer and retrieving + voicing the next question) overlap. Every
+    stage records a span; the critical path is the longest chain of
+    dependent stage durations, i.e. the turn latency the graph could not
+    hide.
+
+    Usage:
+        trace = TurnTrace()
+        text = trace.stage("transcribe", transcribe)
+        feedback = trace.stage("feedback", score, text)
+        ...
+        await feedback
+
+    If on_stage is given it is awaited with (name, result) as each stage
+    finishes, e.g. to stream the transcript or the next question to the
+    client before the whole turn is done. Dependent stages wait for it,
+    so a slow listener applies backpressure to the turn.
+
+    If on_audio is given, speech stages stream their audio to it while
+    it is synthesized instead of returning it whole.
+    """
+
+    def __init__(
+        self,
+        on_stage: Optional[StageListener] = None,
+        on_audio: Optional[AudioListener] = None
+    ):
+        self.on_stage = on_stage
+        self.on_audio = on_audio
+        self._t0 = time.perf_counter()
+        self._tasks: Dict[asyncio.Task, str] = {}
+        self.spans: Dict[str, Tuple[float, float]] = {}
+        self.deps: Dict[str, Tuple[str, ...]] = {}
+
+    def stage(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable[Any]],
+        *deps: asyncio.Task
+    ) -> asyncio.Task:
+        """
+        Declare and start a stage
+
+        Args:
+            name: Stage name (used in timings)
+            fn: Coroutine function called with the results of deps
+            deps: Tasks of stages this stage depends on
+
+        Returns:
+            Task resolving to the stage result
+        """
+        async def run():
+            args = [await dep for dep in deps]
+            start = time.perf_counter()
+            try:
+                result = await fn(*args)
+            finally:
+                self.spans[name] = (start - self._t0, time.perf_counter() - self._t0)
+            if self.on_stage is not None:
+                await self.on_stage(name, result)
+            return result
+
+        task = asyncio.ensure_future(run())
+        self._tasks[task] = name
+        self.deps[name] = tuple(self._tasks[dep] for dep in deps)
+        return task
+
+    def cancel(self):
+        """Cancel stages that have not finished (e.g. after a failure)"""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+
+    def timings_ms(self) -> Dict[str, float]:
+        """Duration of each finished stage"""
+        return {
+            name: round((end - start) * 1000, 3)
+            for name, (start, end) in self.spans.items()
+        }
+
+    def critical_path(self) -> Tuple[float, List[str]]:
+        """Longest dependent chain of stage durations (ms) and its stages"""
+        finish: Dict[str, Tuple[float, List[str]]] = {}
+
+        def longest(name: str) -> Tuple[float, List[str]]:
+            if name not in finish:
+                start, end = self.spans.get(name, (0.0, 0.0))
+                before = max(
+                    (longest(dep) for dep in self.deps.get(name, ())),
+                    default=(0.0, []),
+                    key=lambda item: item[0]
+                )
+                finish[name] = (before[0] + (end - start) * 1000, before[1] + [name])
+            return finish[name]
+
+        if not self.spans:
+            return 0.0, []
+
+        total, path = max((longest(name) for name in self.spans), key=lambda item: item[0])
+        return round(total, 3), path
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._t0) * 1000
@@ -7,15 +7,6 @@ import torch
 import numpy as np
 
 # Optional imports with fallback
-try:
-    import whisper
-    WHISPER_AVAILABLE = True
-except ImportError:
-    whisper = None
-    WHISPER_AVAILABLE = False
-    import logging
-    logging.warning("Whisper not available - voice transcription will be disabled")
-
 try:
     from TTS.api import TTS
     TTS_AVAILABLE = True
@@ -25,13 +16,11 @@ except ImportError:
     import logging
     logging.warning("TTS not available - text-to-speech will be disabled")
 
-import io
-import base64
+import asyncio
 import logging
 import time
-import tempfile
 import os
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
 from pathlib import Path
 
 try:
@@ -41,20 +30,6 @@ except ImportError:
     sf = None
     SOUNDFILE_AVAILABLE = False
 
-try:
-    import librosa
-    LIBROSA_AVAILABLE = True
-except ImportError:
-    librosa = None
-    LIBROSA_AVAILABLE = False
-
-try:
-    import noisereduce as nr
-    NOISEREDUCE_AVAILABLE = True
-except ImportError:
-    nr = None
-    NOISEREDUCE_AVAILABLE = False
-
 from config import get_settings, get_model_config, get_device, is_gpu_available, get_data_path
 from models.schemas import (
     TranscriptionRequest,
@@ -62,12 +37,25 @@ from models.schemas import (
     TTSRequest,
     TTSResponse,
     VoicePreset,
-    EmotionStyle
+    EmotionStyle,
+    AudioFormat
+)
+from services.tts_cache import TTSAudioCache, normalize_segment
+from services.audio_io import (
+    ASR_SAMPLE_RATE,
+    EncodedAudio,
+    StreamEncoder,
+    encode_audio,
+    get_audio_decoder
 )
+from services.tts_streaming import ordered_pipeline, split_sentences
+from services.speaker_latents import Latents, SpeakerLatentCache
+from services.audio_enhancement import AudioEnhancer, create_audio_enhancer
+from services.asr_engines import ASREngine, create_asr_engine
+from services.asr_batcher import ASRBatcher
 
 logger = logging.getLogger(__name__)
 
-
 # Voice preset configurations
 VOICE_PRESETS = {
     VoicePreset.PROFESSIONAL_MALE: {
@@ -104,9 +92,10 @@ class VoiceService:
     
     Features:
     - Whisper large-v3 for high-accuracy transcription
+    - CTranslate2 int8 Whisper on CPU-only hosts (see asr_engines)
     - XTTS-v2 for natural-sounding speech synthesis
     - Voice presets for different interviewer styles
-    - Audio enhancement (noise reduction, normalization)
+    - Configurable audio enhancement (normalization, noise gate/reduction)
     - GPU-accelerated for real-time performance
     """
     
@@ -127,41 +116,73 @@ class VoiceService:
         self.model_config = get_model_config()
         self.device = get_device()
         
-        self.whisper_model: Optional[Any] = None
+        self.asr_engine: Optional[ASREngine] = create_asr_engine(self.model_config, self.device)
         self.tts_model: Optional[Any] = None
         self.voice_presets_dir = get_data_path("voice_presets")
+        self.audio_decoder = get_audio_decoder()
+        
+        # Models run in worker threads; ASR and TTS may overlap, but each
+        # model serves one request at a time
+        self._asr_lock = asyncio.Lock()
+        self._tts_lock = asyncio.Lock()
+        
+        # Windows of concurrent requests share decoder passes
+        self.asr_batcher: Optional[ASRBatcher] = None
+        if self.settings.ASR_BATCHING_ENABLED and self.asr_engine is not None and self.asr_engine.batch_decoding:
+            self.asr_batcher = ASRBatcher(
+                self.asr_engine,
+                self._asr_lock,
+                max_batch=self.model_config.WHISPER_BATCH_SIZE,
+                window_ms=self.settings.ASR_BATCH_WINDOW_MS
+            )
+        
+        # Post-processing of synthesized segments, off the model lock
+        self.enhancer: AudioEnhancer = create_audio_enhancer(self.model_config)
+        
+        # Synthesized segments, shared with the offline pre-warm job;
+        # cached audio is enhanced, so the pipeline is part of the version
+        self.tts_cache: Optional[TTSAudioCache] = None
+        if self.model_config.TTS_CACHE_ENABLED:
+            self.tts_cache = TTSAudioCache(
+                model_version=(
+                    f"{self.model_config.TTS_MODEL_NAME}@{self.model_config.TTS_CACHE_VERSION}"
+                    f"@{self.enhancer.signature}"
+                ),
+                memory_bytes=self.model_config.TTS_CACHE_MEMORY_MB * 1024 * 1024,
+                disk_dir=self.model_config.TTS_CACHE_DIR,
+                disk_bytes=self.model_config.TTS_CACHE_DISK_MB * 1024 * 1024
+            )
+        self._rendering: Dict[str, asyncio.Future] = {}  # Cache key -> segment being rendered
+        
+        # Speaker conditioning, resolved once per preset wav
+        self.speaker_latents: Optional[SpeakerLatentCache] = None
+        if self.model_config.TTS_LATENT_CACHE_ENABLED:
+            self.speaker_latents = SpeakerLatentCache(
+                model_version=self.model_config.TTS_MODEL_NAME,
+                disk_dir=self.model_config.TTS_LATENT_CACHE_DIR
+            )
+        self._speaker_paths: Dict[str, str] = {}
+        self._speaker_conditioning: Dict[str, Latents] = {}
         
         self._initialized = True
         logger.info(f"VoiceService initialized on device: {self.device}")
     
+    @property
+    def whisper_model(self) -> Optional[Any]:
+        """The loaded Whisper model of the ASR engine, if any"""
+        return self.asr_engine.model if self.asr_engine is not None else None
+    
+    @property
+    def asr_available(self) -> bool:
+        """Whether this host has an ASR engine that can serve transcription"""
+        return self.asr_engine is not None
+    
     def load_whisper(self) -> bool:
-        if not WHISPER_AVAILABLE:
-            logger.warning("Whisper not available - transcription disabled")
-            return False
-        """Load Whisper ASR model"""
-        if self.whisper_model is not None:
-            return True
-            
-        try:
-            logger.info(f"Loading Whisper model: {self.model_config.WHISPER_MODEL_SIZE}")
-            start_time = time.time()
-            
-            self.whisper_model = whisper.load_model(
-                self.model_config.WHISPER_MODEL_SIZE,
-                device=self.device
-            )
-            
-            # Optimize for inference
-            if self.device == "cuda":
-                self.whisper_model = self.whisper_model.half()
-            
-            load_time = time.time() - start_time
-            logger.info(f"Whisper model loaded in {load_time:.2f}s")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to load Whisper model: {e}")
+        """Load the Whisper model of the ASR engine"""
+        if self.asr_engine is None:
+            logger.warning("No ASR engine available - transcription disabled")
             return False
+        return self.asr_engine.load()
     
     def load_tts(self) -> bool:
         if not TTS_AVAILABLE:
@@ -184,12 +205,51 @@ class VoiceService:
             
             load_time = time.time() - start_time
             logger.info(f"TTS model loaded in {load_time:.2f}s")
+            
+            self._prepare_speakers()
             return True
             
         except Exception as e:
             logger.error(f"Failed to load TTS model: {e}")
             return False
     
+    def _xtts(self) -> Optional[Any]:
+        """The underlying XTTS model, if the loaded TTS model is one"""
+        model = getattr(getattr(self.tts_model, "synthesizer", None), "tts_model", None)
+        if model is None or not hasattr(model, "get_conditioning_latents"):
+            return None
+        return model
+    
+    def _prepare_speakers(self):
+        """Compute (or load) the conditioning latents of every voice preset"""
+        if self.speaker_latents is None or self._xtts() is None:
+            return
+        
+        start_time = time.time()
+        for filename in dict.fromkeys(preset["speaker_wav"] for preset in VOICE_PRESETS.values()):
+            try:
+                self._get_conditioning(filename)
+            except Exception as e:
+                logger.warning(f"Speaker latents for {filename} unavailable: {e}")
+        logger.info(
+            f"Speaker latents ready for {len(self._speaker_conditioning)} presets "
+            f"in {time.time() - start_time:.2f}s"
+        )
+    
+    def _get_conditioning(self, filename: str) -> Optional[Latents]:
+        """Cached conditioning latents of a preset's reference wav"""
+        latents = self._speaker_conditioning.get(filename)
+        if latents is not None:
+            return latents
+        
+        xtts = self._xtts()
+        if self.speaker_latents is None or xtts is None:
+            return None
+        
+        _, latents = self.speaker_latents.get(self._get_speaker_wav(filename), xtts, self.device)
+        self._speaker_conditioning[filename] = latents
+        return latents
+    
     async def transcribe(
         self,
         audio_data: bytes,
@@ -198,6 +258,11 @@ class VoiceService:
         """
         Transcribe audio using Whisper
         
+        Runs in a worker thread so other interview turn stages (retrieval,
+        TTS) can proceed concurrently. Without word timestamps the audio is
+        decoded outside the model lock and its windows are batched with
+        those of concurrent requests (see ASRBatcher).
+        
         Args:
             audio_data: Audio bytes (WAV, MP3, etc.)
             request: Transcription settings
@@ -205,64 +270,117 @@ class VoiceService:
         Returns:
             TranscriptionResponse with text and metadata
         """
+        if self._use_batcher(request):
+            start_time = time.time()
+            try:
+                audio = await asyncio.to_thread(self.audio_decoder.decode, audio_data, ASR_SAMPLE_RATE)
+            except Exception as e:
+                logger.error(f"Transcription failed: {e}")
+                raise
+            return await self._transcribe_batched(audio, request, start_time)
+        
+        async with self._asr_lock:
+            return await asyncio.to_thread(self._transcribe_sync, audio_data, request)
+    
+    async def transcribe_samples(
+        self,
+        audio: np.ndarray,
+        request: TranscriptionRequest
+    ) -> TranscriptionResponse:
+        """
+        Transcribe already decoded audio (16 kHz mono float32)
+        
+        Used by streaming transcription, which decodes PCM frames itself.
+        """
+        if self._use_batcher(request):
+            return await self._transcribe_batched(audio, request, time.time())
+        
+        async with self._asr_lock:
+            return await asyncio.to_thread(self._transcribe_samples_sync, audio, request, time.time())
+    
+    def _use_batcher(self, request: TranscriptionRequest) -> bool:
+        # Word alignment needs the full transcribe() pass
+        return self.asr_batcher is not None and not request.word_timestamps
+    
+    async def _transcribe_batched(
+        self,
+        audio: np.ndarray,
+        request: TranscriptionRequest,
+        start_time: float
+    ) -> TranscriptionResponse:
+        if self.whisper_model is None:
+            async with self._asr_lock:
+                loaded = await asyncio.to_thread(self.load_whisper)
+            if not loaded:
+                raise RuntimeError("Whisper model not available")
+        
+        try:
+            result = await self.asr_batcher.transcribe(audio, request)
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            raise
+        return self._build_transcription(result, request, start_time)
+    
+    def _transcribe_sync(
+        self,
+        audio_data: bytes,
+        request: TranscriptionRequest
+    ) -> TranscriptionResponse:
+        """Blocking Whisper transcription"""
         start_time = time.time()
         
+        try:
+            # Decode in memory (ffmpeg only for containers that need it)
+            audio = self.audio_decoder.decode(audio_data, ASR_SAMPLE_RATE)
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            raise
+        
+        return self._transcribe_samples_sync(audio, request, start_time)
+    
+    def _transcribe_samples_sync(
+        self,
+        audio: np.ndarray,
+        request: TranscriptionRequest,
+        start_time: float
+    ) -> TranscriptionResponse:
+        """Blocking Whisper transcription of 16 kHz samples"""
         if not self.load_whisper():
             raise RuntimeError("Whisper model not available")
         
         try:
-            # Save audio to temp file (Whisper requires file path)
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                tmp.write(audio_data)
-                tmp_path = tmp.name
-            
-            # Load and preprocess audio
-            if not WHISPER_AVAILABLE:
-                raise ImportError("Whisper not available")
-            audio = whisper.load_audio(tmp_path)
-            audio = whisper.pad_or_trim(audio)
-            
-            # Get duration
-            duration = len(audio) / 16000  # Whisper uses 16kHz
-            
-            # Transcribe
-            result = self.whisper_model.transcribe(
-                audio,
-                language=request.language,
-                task=request.task,
-                fp16=(self.device == "cuda"),
-                verbose=False,
-                word_timestamps=request.word_timestamps,
-                initial_prompt=request.initial_prompt
-            )
-            
-            # Clean up
-            os.unlink(tmp_path)
-            
-            # Calculate confidence from segments
-            confidence = None
-            if result.get("segments"):
-                avg_prob = np.mean([
-                    s.get("avg_logprob", 0) 
-                    for s in result["segments"]
-                ])
-                confidence = min(1.0, np.exp(avg_prob))
-            
-            processing_time = (time.time() - start_time) * 1000
-            
-            return TranscriptionResponse(
-                text=result["text"].strip(),
-                language=result.get("language", request.language),
-                duration_seconds=duration,
-                segments=result.get("segments"),
-                word_timestamps=self._extract_word_timestamps(result) if request.word_timestamps else None,
-                confidence=confidence,
-                processing_time_ms=processing_time
-            )
-            
+            result = self.asr_engine.transcribe(audio, request)
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
+        return self._build_transcription(result, request, start_time)
+    
+    def _build_transcription(
+        self,
+        result: Dict[str, Any],
+        request: TranscriptionRequest,
+        start_time: float
+    ) -> TranscriptionResponse:
+        # Calculate confidence from segments
+        confidence = None
+        if result.get("segments"):
+            avg_prob = np.mean([
+                s.get("avg_logprob", 0) 
+                for s in result["segments"]
+            ])
+            confidence = min(1.0, np.exp(avg_prob))
+        
+        processing_time = (time.time() - start_time) * 1000
+        
+        return TranscriptionResponse(
+            text=result["text"].strip(),
+            language=result.get("language", request.language),
+            duration_seconds=result["duration"],
+            segments=result.get("segments"),
+            word_timestamps=self._extract_word_timestamps(result) if request.word_timestamps else None,
+            confidence=confidence,
+            processing_time_ms=processing_time
+        )
     
     def _extract_word_timestamps(self, result: Dict) -> list:
         """Extract word-level timestamps from Whisper result"""
@@ -279,77 +397,297 @@ class VoiceService:
     
     async def synthesize(
         self,
-        request: TTSRequest
+        request: TTSRequest,
+        segments: Optional[List[str]] = None
     ) -> TTSResponse:
         """
         Synthesize speech using XTTS-v2
         
+        Runs in worker threads so other interview turn stages can proceed
+        concurrently. Each segment is looked up in the TTS audio cache and
+        only missing segments are synthesized (see _render_segment); the
+        waveforms are stitched with a short pause and encoded once, in
+        request.format (WAV by default), in a worker thread. Fully cached
+        requests skip the model lock.
+        
         Args:
             request: TTS settings including text and voice preset
+            segments: Pieces of request.text to cache separately, e.g. a
+                fixed prefix and a question (defaults to the whole text)
             
         Returns:
             TTSResponse with audio data
         """
         start_time = time.time()
+        audio, sr = await self.synthesize_audio(request, segments)
+        encoded, audio_base64 = await asyncio.to_thread(
+            self._encode_base64, audio, sr, request.format or AudioFormat.WAV
+        )
         
-        if not self.load_tts():
-            raise RuntimeError("TTS model not available")
+        return TTSResponse(
+            audio_base64=audio_base64,
+            duration_seconds=encoded.duration,
+            sample_rate=encoded.sample_rate,
+            format=encoded.format.value,
+            processing_time_ms=(time.time() - start_time) * 1000
+        )
+    
+    async def synthesize_audio(
+        self,
+        request: TTSRequest,
+        segments: Optional[List[str]] = None
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Synthesize speech as a float waveform, for callers that encode it
+        
+        Same as synthesize() without the encoding.
+        
+        Returns:
+            (mono float32 samples, sample rate)
+        """
+        if segments is None:
+            segments = [request.text]
         
         try:
-            # Get voice preset configuration
-            preset_config = VOICE_PRESETS.get(
-                request.voice_preset,
-                VOICE_PRESETS[VoicePreset.PROFESSIONAL_MALE]
-            )
+            waveforms = []
+            sr = 0
+            for segment in segments:
+                if not normalize_segment(segment):
+                    continue
+                # All segments come from the same model, so share one rate
+                audio, sr = await self._render_segment(segment, request)
+                waveforms.append(audio)
             
-            # Get speaker reference audio
-            speaker_wav = self._get_speaker_wav(preset_config["speaker_wav"])
+            if not waveforms:
+                raise ValueError("Nothing to synthesize")
             
-            # Apply emotion/style adjustments to text
-            text = self._apply_emotion_markers(request.text, request.emotion)
+            return self._stitch(waveforms, sr), sr
             
-            # Calculate effective speed
-            speed = request.speed * preset_config.get("speed", 1.0)
+        except Exception as e:
+            logger.error(f"TTS synthesis failed: {e}")
+            raise
+    
+    async def stream_audio(self, request: TTSRequest) -> AsyncIterator[EncodedAudio]:
+        """
+        Synthesize speech sentence by sentence as a stream
+        
+        The text is split into sentences (long ones at clauses, the first
+        one short) that are synthesized in order, TTS_STREAM_LOOKAHEAD
+        ahead of the consumer, and each is yielded as soon as it is ready.
+        Sentences go through the TTS audio cache and only hold the model
+        lock while synthesizing (see _render_segment).
+        
+        The chunks concatenate into one stream in request.format (see
+        StreamEncoder; WAV has a header with open-ended sizes). Encoding
+        runs in a worker thread.
+        
+        Args:
+            request: TTS settings including text and voice preset
             
-            # Generate audio
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                self.tts_model.tts_to_file(
+        Yields:
+            EncodedAudio per sentence (the pause before it included),
+            then the encoder's remaining bytes
+        """
+        fmt = request.format or AudioFormat.WAV
+        sentences = split_sentences(
+            request.text,
+            max_chars=self.model_config.TTS_STREAM_MAX_CHARS,
+            first_chars=self.model_config.TTS_STREAM_FIRST_CHARS
+        )
+        if not sentences:
+            raise ValueError("Nothing to synthesize")
+        
+        async def render(sentence: str) -> Tuple[np.ndarray, int]:
+            return await self._render_segment(sentence, request)
+        
+        chunks = ordered_pipeline(sentences, render, self.model_config.TTS_STREAM_LOOKAHEAD)
+        encoder = None
+        try:
+            async for audio, sr in chunks:
+                if encoder is None:
+                    encoder = StreamEncoder(fmt, sr, self._compression_level(fmt))
+                else:
+                    gap = np.zeros(int(sr * self.model_config.TTS_SEGMENT_GAP_MS / 1000), dtype=np.float32)
+                    audio = np.concatenate((gap, audio))
+                yield await asyncio.to_thread(encoder.write, audio)
+            yield await asyncio.to_thread(encoder.close)
+        finally:
+            # An abandoned encoder is closed when collected, after any
+            # write still running in its worker thread
+            await chunks.aclose()
+    
+    def _compression_level(self, fmt: AudioFormat) -> Optional[float]:
+        if fmt == AudioFormat.OPUS:
+            return self.model_config.TTS_OPUS_COMPRESSION_LEVEL
+        if fmt == AudioFormat.MP3:
+            return self.model_config.TTS_MP3_COMPRESSION_LEVEL
+        return None
+    
+    def _encode_base64(self, audio: np.ndarray, sr: int, fmt: AudioFormat) -> Tuple[EncodedAudio, str]:
+        """Blocking encoding for JSON responses"""
+        encoded = encode_audio(audio, sr, fmt, self._compression_level(fmt))
+        return encoded, encoded.to_base64()
+    
+    def _cache_key(self, text: str, request: TTSRequest) -> str:
+        return self.tts_cache.key(
+            text,
+            request.voice_preset.value,
+            request.speed,
+            request.emotion.value,
+            request.language
+        )
+    
+    async def _render_segment(self, text: str, request: TTSRequest) -> Tuple[np.ndarray, int]:
+        """
+        Enhanced waveform of one segment, from the cache or freshly synthesized
+        
+        Only the model call holds the TTS lock; enhancement runs in the
+        enhancer's worker pool, so the next segment can be synthesizing
+        meanwhile. Concurrent requests for the same uncached segment share
+        one rendering.
+        """
+        if self.tts_cache is None:
+            return await self._enhanced_waveform(text, request)
+        
+        key = self._cache_key(text, request)
+        cached = await asyncio.to_thread(self.tts_cache.get, key)
+        if cached is not None:
+            return cached
+        
+        rendering = self._rendering.get(key)
+        if rendering is None:
+            rendering = asyncio.ensure_future(self._enhanced_waveform(text, request, key))
+            self._rendering[key] = rendering
+            rendering.add_done_callback(lambda _: self._rendering.pop(key, None))
+        # A caller that goes away does not cancel the others' rendering
+        return await asyncio.shield(rendering)
+    
+    async def _enhanced_waveform(
+        self,
+        text: str,
+        request: TTSRequest,
+        key: Optional[str] = None
+    ) -> Tuple[np.ndarray, int]:
+        async with self._tts_lock:
+            audio, sr = await asyncio.to_thread(self._synthesize_waveform, text, request)
+        audio = await self.enhancer.enhance(audio, sr)
+        
+        if key is not None:
+            await asyncio.to_thread(self.tts_cache.put, key, audio, sr)
+        return audio, sr
+    
+    def _synthesize_waveform(self, text: str, request: TTSRequest) -> Tuple[np.ndarray, int]:
+        """Run XTTS on one segment (raw model output, before enhancement)"""
+        if not self.load_tts():
+            raise RuntimeError("TTS model not available")
+        
+        # Get voice preset configuration
+        preset_config = VOICE_PRESETS.get(
+            request.voice_preset,
+            VOICE_PRESETS[VoicePreset.PROFESSIONAL_MALE]
+        )
+        
+        # Apply emotion/style adjustments to text
+        text = self._apply_emotion_markers(normalize_segment(text), request.emotion)
+        
+        # Calculate effective speed
+        speed = request.speed * preset_config.get("speed", 1.0)
+        
+        # Generate audio (the waveform itself, no temp file)
+        latents = self._get_conditioning(preset_config["speaker_wav"])
+        if latents is not None:
+            audio = self._xtts_inference(text, request.language, latents, speed)
+        else:
+            audio = np.asarray(
+                self.tts_model.tts(
                     text=text,
-                    speaker_wav=speaker_wav,
+                    speaker_wav=self._get_speaker_wav(preset_config["speaker_wav"]),
                     language=request.language,
-                    file_path=tmp.name,
                     speed=speed
-                )
-                
-                # Read generated audio
-                audio, sr = sf.read(tmp.name)
-                os.unlink(tmp.name)
-            
-            # Apply post-processing
-            audio = self._enhance_audio(audio, sr)
-            
-            # Convert to base64
-            audio_buffer = io.BytesIO()
-            sf.write(audio_buffer, audio, sr, format='WAV')
-            audio_base64 = base64.b64encode(audio_buffer.getvalue()).decode('utf-8')
-            
-            duration = len(audio) / sr
-            processing_time = (time.time() - start_time) * 1000
-            
-            return TTSResponse(
-                audio_base64=audio_base64,
-                duration_seconds=duration,
-                sample_rate=sr,
-                format="wav",
-                processing_time_ms=processing_time
+                ),
+                dtype=np.float32
             )
+        return np.asarray(audio, dtype=np.float32), self.tts_model.synthesizer.output_sample_rate
+    
+    def _xtts_inference(self, text: str, language: str, latents: Latents, speed: float) -> np.ndarray:
+        """XTTS synthesis from precomputed speaker latents"""
+        xtts = self._xtts()
+        config = xtts.config
+        gpt_cond_latent, speaker_embedding = latents
+        output = xtts.inference(
+            text,
+            language,
+            gpt_cond_latent,
+            speaker_embedding,
+            temperature=config.temperature,
+            length_penalty=config.length_penalty,
+            repetition_penalty=config.repetition_penalty,
+            top_k=config.top_k,
+            top_p=config.top_p,
+            speed=speed,
+            enable_text_splitting=True
+        )
+        wav = output["wav"]
+        if hasattr(wav, "cpu"):
+            wav = wav.cpu().numpy()
+        return np.asarray(wav, dtype=np.float32).reshape(-1)
+    
+    def _stitch(self, waveforms: List[np.ndarray], sr: int) -> np.ndarray:
+        """Concatenate segments with a short pause between them"""
+        if len(waveforms) == 1:
+            return waveforms[0]
+        
+        gap = np.zeros(int(sr * self.model_config.TTS_SEGMENT_GAP_MS / 1000), dtype=np.float32)
+        pieces = []
+        for i, audio in enumerate(waveforms):
+            if i:
+                pieces.append(gap)
+            pieces.append(audio)
+        return np.concatenate(pieces)
+    
+    def prewarm_cache(
+        self,
+        texts: List[str],
+        request: TTSRequest
+    ) -> Dict[str, int]:
+        """
+        Render texts into the TTS audio cache (blocking, for offline jobs)
+        
+        Args:
+            texts: Segments to render
+            request: Voice preset, speed, emotion and language to render with
             
-        except Exception as e:
-            logger.error(f"TTS synthesis failed: {e}")
-            raise
+        Returns:
+            Counts of segments rendered, already cached and failed
+        """
+        if self.tts_cache is None:
+            raise RuntimeError("TTS cache is disabled")
+        
+        counts = {"rendered": 0, "cached": 0, "failed": 0}
+        for text in dict.fromkeys(normalize_segment(t) for t in texts):
+            if not text:
+                continue
+            key = self._cache_key(text, request)
+            if self.tts_cache.contains(key):
+                counts["cached"] += 1
+                continue
+            try:
+                audio, sr = self._synthesize_waveform(text, request)
+                self.tts_cache.put(key, self.enhancer.process(audio, sr), sr)
+                counts["rendered"] += 1
+            except Exception as e:
+                logger.error(f"Failed to pre-render '{text[:40]}': {e}")
+                counts["failed"] += 1
+        return counts
     
     def _get_speaker_wav(self, filename: str) -> str:
-        """Get path to speaker reference audio"""
+        """Get path to speaker reference audio (resolved once per preset)"""
+        path = self._speaker_paths.get(filename)
+        if path is None:
+            path = self._speaker_paths[filename] = self._resolve_speaker_wav(filename)
+        return path
+    
+    def _resolve_speaker_wav(self, filename: str) -> str:
         # Check in voice presets directory
         preset_path = os.path.join(self.voice_presets_dir, filename)
         if os.path.exists(preset_path):
@@ -366,15 +704,16 @@ class VoiceService:
     
     def _create_placeholder_speaker(self) -> str:
         """Create a placeholder speaker wav for testing"""
-        # Generate a simple sine wave as placeholder
-        import numpy as np
+        placeholder_path = os.path.join(self.voice_presets_dir, "placeholder.wav")
+        if os.path.exists(placeholder_path):
+            return placeholder_path
         
+        # Generate a simple sine wave as placeholder
         sr = 22050
         duration = 2.0
         t = np.linspace(0, duration, int(sr * duration))
         audio = 0.3 * np.sin(2 * np.pi * 220 * t)  # 220 Hz sine wave
         
-        placeholder_path = os.path.join(self.voice_presets_dir, "placeholder.wav")
         os.makedirs(self.voice_presets_dir, exist_ok=True)
         sf.write(placeholder_path, audio, sr)
         
@@ -394,45 +733,34 @@ class VoiceService:
         # In production, could use more sophisticated prosody control
         return text
     
-    def _enhance_audio(self, audio: np.ndarray, sr: int) -> np.ndarray:
-        """Apply audio post-processing for better quality"""
-        try:
-            # Reduce background noise
-            audio = nr.reduce_noise(
-                y=audio,
-                sr=sr,
-                prop_decrease=0.6
-            )
-            
-            # Normalize volume
-            audio = librosa.util.normalize(audio)
-            
-            return audio
-            
-        except Exception as e:
-            logger.warning(f"Audio enhancement failed: {e}")
-            return audio
-    
     def get_status(self) -> Dict[str, Any]:
         """Get voice service status"""
         return {
             "whisper_loaded": self.whisper_model is not None,
             "tts_loaded": self.tts_model is not None,
             "device": self.device,
-            "whisper_model": self.model_config.WHISPER_MODEL_SIZE,
+            "whisper_model": self.asr_engine.model_size if self.asr_engine is not None else None,
+            "asr_engine": self.asr_engine.get_info() if self.asr_engine is not None else None,
+            "asr_batching": self.asr_batcher.get_stats() if self.asr_batcher is not None else None,
             "tts_model": self.model_config.TTS_MODEL_NAME,
-            "available_presets": list(VOICE_PRESETS.keys())
+            "available_presets": list(VOICE_PRESETS.keys()),
+            "tts_cache": self.tts_cache.get_stats() if self.tts_cache is not None else None,
+            "audio_decode": self.audio_decoder.get_stats(),
+            "speaker_latents": self.speaker_latents.get_stats() if self.speaker_latents is not None else None,
+            "audio_enhancement": self.enhancer.get_stats()
         }
     
     def unload_models(self):
         """Unload models to free GPU memory"""
-        if self.whisper_model is not None:
-            del self.whisper_model
-            self.whisper_model = None
+        if self.asr_engine is not None:
+            self.asr_engine.unload()
             
         if self.tts_model is not None:
             del self.tts_model
             self.tts_model = None
+            self._speaker_conditioning.clear()
+            if self.speaker_latents is not None:
+                self.speaker_latents.clear()
             
         if self.device == "cuda":
             torch.cuda.empty_cache()
@@ -444,14 +772,22 @@ class VoiceServiceFallback:
     """
     Fallback voice service for when GPU is unavailable
     Uses Web Speech API (handled by frontend) with basic audio processing
+    
+    When the host has a CPU ASR engine, transcription is served by the
+    voice service and only TTS falls back.
     """
     
+    def __init__(self, asr_service: Optional[VoiceService] = None):
+        self.asr_service = asr_service
+    
     async def transcribe(
         self,
         audio_data: bytes,
         request: TranscriptionRequest
     ) -> TranscriptionResponse:
         """Fallback transcription - returns error indicating frontend should use Web Speech API"""
+        if self.asr_service is not None:
+            return await self.asr_service.transcribe(audio_data, request)
         return TranscriptionResponse(
             text="",
             language=request.language,
@@ -462,9 +798,20 @@ class VoiceServiceFallback:
             processing_time_ms=0
         )
     
+    async def transcribe_samples(
+        self,
+        audio: np.ndarray,
+        request: TranscriptionRequest
+    ) -> TranscriptionResponse:
+        """Fallback transcription of decoded audio"""
+        if self.asr_service is not None:
+            return await self.asr_service.transcribe_samples(audio, request)
+        return await self.transcribe(b"", request)
+    
     async def synthesize(
         self,
-        request: TTSRequest
+        request: TTSRequest,
+        segments: Optional[List[str]] = None
     ) -> TTSResponse:
         """Fallback TTS - returns error indicating frontend should use Web Speech API"""
         return TTSResponse(
@@ -491,6 +838,11 @@ def get_voice_service_with_fallback() -> VoiceService:
     """Get voice service with fallback for non-GPU environments"""
     if is_gpu_available():
         return get_voice_service()
-    else:
-        logger.warning("GPU not available, using fallback voice service")
-        return VoiceServiceFallback()
+    
+    voice_service = get_voice_service()
+    if voice_service.asr_available:
+        logger.warning("GPU not available, using CPU transcription and fallback TTS")
+        return VoiceServiceFallback(asr_service=voice_service)
+    
+    logger.warning("GPU not available, using fallback voice service")
+    return VoiceServiceFallback()
@@ -0,0 +1,200 @@
+"""
+SmartSuccess.AI GPU Backend - WebSocket Channel
+Shared transport for full-duplex WebSocket endpoints
+"""
+
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple, Union
+
+from fastapi import WebSocket
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+# Close codes
+WS_CLOSE_GOING_AWAY = 1001
+WS_CLOSE_TOO_BIG = 1009
+WS_CLOSE_TRY_AGAIN = 1013
+WS_CLOSE_NOT_FOUND = 4404
+
+
+class ChannelClosed(Exception):
+    """Raised to unwind pending work once the connection is being closed"""
+    pass
+
+
+class WebSocketChannel(ABC):
+    """
+    Base class for WebSocket endpoints with a receive loop, a bounded
+    outbox and heartbeats
+
+    Subclasses implement _on_binary and _on_message (JSON control
+    messages other than ping/pong), and may override _on_open to reject
+    the connection and _pending_tasks to have their own tasks cancelled
+    on close.
+
+    Outgoing frames go through a bounded queue drained by one sender task.
+    When the queue is full the producer waits, and a client that stops
+    reading for WS_SEND_TIMEOUT is disconnected. A client that sends
+    nothing (not even pongs) for WS_HEARTBEAT_TIMEOUT is disconnected.
+    """
+
+    name = "WebSocket channel"
+
+    def __init__(self, websocket: WebSocket, channel_id: str):
+        self.settings = get_settings()
+        self.websocket = websocket
+        self.channel_id = channel_id
+
+        self._outbox: "asyncio.Queue[Union[str, bytes]]" = asyncio.Queue(
+            maxsize=self.settings.WS_SEND_QUEUE_SIZE
+        )
+        self._sender: Optional[asyncio.Task] = None
+        self._receiver: Optional[asyncio.Task] = None
+        self._closed = False
+        self._last_seen = time.monotonic()
+
+    async def run(self):
+        """Serve the connection until either side closes it"""
+        await self.websocket.accept()
+
+        if not await self._on_open():
+            return
+
+        self._sender = asyncio.create_task(self._send_loop())
+        self._receiver = asyncio.create_task(self._receive_loop())
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+        try:
+            await self._receiver
+        except asyncio.CancelledError:
+            # Aborted by us; the endpoint itself was not cancelled
+            if not self._closed:
+                raise
+        finally:
+            self._closed = True
+            for task in (*self._pending_tasks(), heartbeat, self._sender, self._receiver):
+                if task is not None and not task.done():
+                    task.cancel()
+            logger.info(f"{self.name} closed: {self.channel_id}")
+
+    # ------------------------------------------------------------------
+    # Hooks
+    # ------------------------------------------------------------------
+
+    async def _on_open(self) -> bool:
+        """Called after accept; return False after closing to reject"""
+        return True
+
+    def _pending_tasks(self) -> Tuple[Optional[asyncio.Task], ...]:
+        """Subclass tasks to cancel when the connection closes"""
+        return ()
+
+    @abstractmethod
+    async def _on_binary(self, data: bytes):
+        """Handle a binary frame"""
+
+    @abstractmethod
+    async def _on_message(self, kind: str, message: Dict[str, Any]):
+        """Handle a JSON control message of type kind (not ping/pong)"""
+
+    # ------------------------------------------------------------------
+    # Inbound
+    # ------------------------------------------------------------------
+
+    async def _receive_loop(self):
+        while not self._closed:
+            message = await self.websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+            self._last_seen = time.monotonic()
+            if message.get("bytes") is not None:
+                await self._on_binary(message["bytes"])
+            elif message.get("text") is not None:
+                await self._on_text(message["text"])
+
+    async def _on_text(self, text: str):
+        try:
+            message = json.loads(text)
+            kind = message["type"]
+        except (ValueError, KeyError, TypeError):
+            await self._send_error(400, "Expected a JSON object with a type")
+            return
+
+        if kind == "ping":
+            await self._send_json({"type": "pong", "ts": time.time()})
+        elif kind == "pong":
+            pass
+        else:
+            await self._on_message(kind, message)
+
+    # ------------------------------------------------------------------
+    # Outbound
+    # ------------------------------------------------------------------
+
+    async def _send_json(self, payload: Dict[str, Any]):
+        await self._enqueue(json.dumps(payload, default=str))
+
+    async def _send_error(self, status: int, detail: str):
+        try:
+            await self._send_json({"type": "error", "status": status, "detail": detail})
+        except ChannelClosed:
+            pass
+
+    async def _enqueue(self, frame: Union[str, bytes]):
+        """Queue a frame, waiting while the client is behind"""
+        if self._closed:
+            raise ChannelClosed()
+        try:
+            await asyncio.wait_for(self._outbox.put(frame), self.settings.WS_SEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"{self.name} {self.channel_id}: client stopped reading")
+            await self._abort(WS_CLOSE_TRY_AGAIN, "Client is not reading")
+            raise ChannelClosed()
+
+    async def _send_loop(self):
+        try:
+            while True:
+                frame = await self._outbox.get()
+                if isinstance(frame, bytes):
+                    await self.websocket.send_bytes(frame)
+                else:
+                    await self.websocket.send_text(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"{self.name} {self.channel_id} send failed: {e}")
+            self._closed = True
+
+    async def _heartbeat_loop(self):
+        interval = self.settings.WS_HEARTBEAT_INTERVAL
+        while not self._closed:
+            await asyncio.sleep(interval)
+            if time.monotonic() - self._last_seen > self.settings.WS_HEARTBEAT_TIMEOUT:
+                logger.info(f"{self.name} {self.channel_id}: heartbeat timeout")
+                await self._abort(WS_CLOSE_GOING_AWAY, "Heartbeat timeout")
+                return
+            # A full queue already keeps the connection busy
+            if not self._outbox.full():
+                self._outbox.put_nowait(json.dumps({"type": "ping", "ts": time.time()}))
+
+    async def _abort(self, code: int, reason: str):
+        """Stop sending and close the connection"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._sender is not None and not self._sender.done():
+            self._sender.cancel()
+        try:
+            await self.websocket.close(code=code, reason=reason)
+        except Exception:
+            pass
+        # A dead client may never answer the close frame
+        if self._receiver is not None and self._receiver is not asyncio.current_task():
+            self._receiver.cancel()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Session state verification: InterviewSession survives store round trips
+
+Saves and reloads a session through to_state/pack_state/unpack_state/
+from_state several times under a non-UTC local time zone, as a worker
+does once per turn, and checks that the start time neither moves nor is
+stored as anything but UTC epoch seconds, and that the time-limit
+deadline counts from it. Exits non-zero when any check fails.
+
+Usage:
+    python verify_session_state.py
+    python verify_session_state.py --tz Asia/Kolkata
+"""
+import argparse
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models.schemas import InterviewConfig
+from services.interview_service import InterviewSession
+from services.session_lifecycle import SessionLifecycleManager
+from services.session_store import InMemorySessionStore, pack_state, unpack_state
+
+
+ROUND_TRIPS = 5
+EPOCH = datetime(1970, 1, 1)
+
+
+def round_trip(session: InterviewSession) -> InterviewSession:
+    """Save and reload a session the way the service does each turn"""
+    return InterviewSession.from_state(unpack_state(pack_state(session.to_state())))
+
+
+def check_session() -> list:
+    """Run the round-trip checks; return (description, passed) pairs"""
+    session = InterviewSession(
+        session_id=f"verify_{uuid.uuid4().hex}",
+        user_id="verify",
+        config=InterviewConfig(time_limit_minutes=30)
+    )
+    started_at = session.started_at
+    utc_seconds = (started_at - EPOCH).total_seconds()
+
+    results = [(
+        "started_at is stored as UTC epoch seconds",
+        abs(session.to_state()["t"] - utc_seconds) < 1e-3
+    )]
+
+    loaded = session
+    for _ in range(ROUND_TRIPS):
+        loaded = round_trip(loaded)
+    results.append((
+        f"started_at unchanged after {ROUND_TRIPS} round trips",
+        abs((loaded.started_at - started_at).total_seconds()) < 1e-3
+    ))
+
+    # A session started an hour ago with a 30 minute limit is past its
+    # time limit, whatever the idle timeout
+    lifecycle = SessionLifecycleManager(InMemorySessionStore(ttl=3600))
+    started_at = datetime.utcnow() - timedelta(hours=1)
+    expected = (started_at - EPOCH).total_seconds() + 30 * 60 + lifecycle.settings.QUESTION_TIMEOUT
+    results.append((
+        "time-limit deadline counts from the UTC start time",
+        abs(lifecycle.deadline_for(session.config, started_at) - expected) < 1e-3
+    ))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify session state round trips")
+    parser.add_argument("--tz", default="America/New_York", help="Local time zone to run under (not UTC)")
+    args = parser.parse_args()
+
+    os.environ["TZ"] = args.tz
+    time.tzset()
+    print(f"Local time zone: {args.tz} (UTC offset {-time.timezone / 3600:+.1f}h)")
+    if not time.timezone and not time.daylight:
+        print("⚠️ The time zone has no UTC offset here; the checks cannot catch local-time bugs")
+
+    failed = 0
+    for description, passed in check_session():
+        failed += not passed
+        print(f"  {'✅' if passed else '❌'} {description}")
+
+    print()
+    if failed:
+        print(f"❌ {failed} check(s) failed")
+        sys.exit(1)
+    print("✅ All session state checks passed")
+
+
+if __name__ == "__main__":
+    main()
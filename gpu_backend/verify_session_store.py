@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Session store verification: compare-and-set semantics of every backend
+
+Runs the same checks against the in-memory, SQLite and Redis stores. Redis
+is checked against fakeredis (with Lua scripting, so the create and
+compare-and-set scripts really execute), or a live server with
+--redis-url. Exits non-zero when any check fails.
+
+Usage:
+    python verify_session_store.py
+    python verify_session_store.py --redis-url redis://localhost:6379/15
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from services.session_store import (
+    InMemorySessionStore,
+    RedisSessionStore,
+    SessionConflictError,
+    SessionStore,
+    SQLiteSessionStore
+)
+
+
+TTL = 3600
+WRITERS = 8
+
+
+def expect_conflict(fn) -> bool:
+    try:
+        fn()
+    except SessionConflictError:
+        return True
+    return False
+
+
+def check_store(store: SessionStore) -> list:
+    """Run the CAS checks; return (description, passed) pairs"""
+    session_id = f"verify_{uuid.uuid4().hex}"
+    results = []
+
+    results.append(("create returns version 1", store.create(session_id, b"j{}") == 1))
+    results.append(("duplicate create conflicts", expect_conflict(lambda: store.create(session_id, b"j{}"))))
+
+    version, _ = store.load(session_id)
+    new_version = store.save(session_id, b"jwinner", version)
+    results.append(("save bumps the version", new_version == version + 1))
+    results.append((
+        "save from a stale version conflicts",
+        expect_conflict(lambda: store.save(session_id, b"jloser", version))
+    ))
+    results.append(("stale save leaves the stored payload", store.load(session_id) == (new_version, b"jwinner")))
+
+    # Concurrent turns that all loaded the same version: exactly one wins
+    version, _ = store.load(session_id)
+    barrier = threading.Barrier(WRITERS)
+    outcomes = []
+
+    def writer(i: int):
+        barrier.wait()
+        try:
+            store.save(session_id, f"jwriter{i}".encode(), version)
+            outcomes.append(True)
+        except SessionConflictError:
+            outcomes.append(False)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.append((f"{WRITERS} racing saves: exactly one wins", outcomes.count(True) == 1))
+    results.append(("racing saves bump the version once", store.load(session_id)[0] == version + 1))
+
+    version, _ = store.load(session_id)
+    results.append(("delete removes the session", store.delete(session_id) and store.load(session_id) is None))
+    results.append((
+        "save after delete conflicts",
+        expect_conflict(lambda: store.save(session_id, b"j{}", version))
+    ))
+    results.append(("failed save does not resurrect the session", store.load(session_id) is None))
+    return results
+
+
+def check_abstract() -> bool:
+    """An incomplete store must fail at construction, not on first use"""
+    class IncompleteStore(SessionStore):
+        def load(self, session_id):
+            return None
+
+    try:
+        IncompleteStore(TTL)
+    except TypeError:
+        return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify session store compare-and-set semantics")
+    parser.add_argument("--redis-url", help="Check a live Redis server instead of fakeredis")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="session_verify_")
+    stores = [
+        InMemorySessionStore(ttl=TTL),
+        SQLiteSessionStore(os.path.join(tmp, "sessions.db"), ttl=TTL)
+    ]
+    if args.redis_url:
+        stores.append(RedisSessionStore(ttl=TTL, url=args.redis_url, prefix="smartsuccess:verify:"))
+    else:
+        try:
+            import fakeredis
+            stores.append(RedisSessionStore(ttl=TTL, client=fakeredis.FakeRedis()))
+        except ImportError:
+            print("⚠️ fakeredis not installed (pip install 'fakeredis[lua]'): Redis store not checked")
+
+    failed = 0
+    abstract_ok = check_abstract()
+    failed += not abstract_ok
+    print(f"{'✅' if abstract_ok else '❌'} SessionStore subclasses must implement every method")
+
+    for store in stores:
+        print(f"\n{store.name}:")
+        try:
+            results = check_store(store)
+        except Exception as e:
+            results = [(f"checks raised {type(e).__name__}: {e}", False)]
+        finally:
+            store.close()
+        for description, passed in results:
+            failed += not passed
+            print(f"  {'✅' if passed else '❌'} {description}")
+
+    print()
+    if failed:
+        print(f"❌ {failed} check(s) failed")
+        sys.exit(1)
+    print("✅ All session store checks passed")
+
+
+if __name__ == "__main__":
+    main()